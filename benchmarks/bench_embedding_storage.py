@@ -0,0 +1,141 @@
+"""Compare index rebuild time for JSON-text versus packed float32 BLOB embeddings.
+
+Usage::
+
+    python -m benchmarks.bench_embedding_storage --roles 20000 --dimension 384
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+from uuid import UUID, uuid4
+
+from job_role_analyzer.data_models import JobRoleSummary
+from job_role_analyzer.db import Database
+from job_role_analyzer.vector_index import FlatIndex
+
+
+LEGACY_SCHEMA = """
+CREATE TABLE job_roles (
+    job_role_id TEXT PRIMARY KEY,
+    job_title TEXT NOT NULL,
+    normalized_summary TEXT NOT NULL,
+    years_experience INTEGER NOT NULL,
+    embedding_vector TEXT
+)
+"""
+
+
+def _create_legacy_database(path: Path, roles: int, dimension: int, seed: int) -> None:
+    rng = random.Random(seed)
+    connection = sqlite3.connect(path)
+    connection.execute(LEGACY_SCHEMA)
+    connection.executemany(
+        "INSERT INTO job_roles VALUES (?, ?, ?, ?, ?)",
+        (
+            (
+                str(uuid4()),
+                f"Role {index}",
+                f"Synthetic summary for role {index}",
+                index % 15,
+                json.dumps([rng.uniform(-1.0, 1.0) for _ in range(dimension)]),
+            )
+            for index in range(roles)
+        ),
+    )
+    connection.commit()
+    connection.close()
+
+
+def _legacy_rebuild(path: Path) -> float:
+    """Replicates the pre-BLOB rebuild: json.loads and model validation per row."""
+    started = time.perf_counter()
+    connection = sqlite3.connect(path)
+    connection.row_factory = sqlite3.Row
+    rows = connection.execute(
+        "SELECT job_role_id, job_title, normalized_summary, years_experience, embedding_vector FROM job_roles"
+    ).fetchall()
+    embeddings = []
+    for row in rows:
+        JobRoleSummary(
+            job_role_id=UUID(row["job_role_id"]),
+            job_title=row["job_title"],
+            normalized_summary=row["normalized_summary"],
+            years_experience=row["years_experience"],
+        )
+        embeddings.append(json.loads(row["embedding_vector"]))
+    index = FlatIndex(len(embeddings[0]))
+    index.add(embeddings)
+    connection.close()
+    return time.perf_counter() - started
+
+
+def _blob_rebuild(database: Database) -> float:
+    started = time.perf_counter()
+    index = None
+    for _, block in database.iter_embedding_blocks():
+        if index is None:
+            index = FlatIndex(len(block[0]))
+        index.add(block)
+    return time.perf_counter() - started
+
+
+def _embedding_bytes(path: Path) -> int:
+    connection = sqlite3.connect(path)
+    try:
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(job_roles)")}
+        lengths = " + ".join(
+            f"COALESCE(SUM(LENGTH({column})), 0)"
+            for column in ("embedding_vector", "embedding_blob")
+            if column in columns
+        )
+        return int(connection.execute(f"SELECT {lengths} FROM job_roles").fetchone()[0])
+    finally:
+        connection.close()
+
+
+def run(roles: int, dimension: int, seed: int = 7) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as workdir:
+        path = Path(workdir) / "bench.db"
+        _create_legacy_database(path, roles, dimension, seed)
+        json_bytes = _embedding_bytes(path)
+        json_seconds = _legacy_rebuild(path)
+
+        started = time.perf_counter()
+        database = Database(str(path))
+        migration_seconds = time.perf_counter() - started
+        try:
+            blob_seconds = _blob_rebuild(database)
+        finally:
+            database.close()
+        blob_bytes = _embedding_bytes(path)
+
+    return {
+        "roles": roles,
+        "dimension": dimension,
+        "json_rebuild_seconds": round(json_seconds, 4),
+        "blob_rebuild_seconds": round(blob_seconds, 4),
+        "rebuild_speedup": round(json_seconds / blob_seconds, 2) if blob_seconds else None,
+        "migration_seconds": round(migration_seconds, 4),
+        "json_embedding_bytes": json_bytes,
+        "blob_embedding_bytes": blob_bytes,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JSON versus BLOB embedding storage")
+    parser.add_argument("--roles", type=int, default=10000, help="Number of synthetic roles")
+    parser.add_argument("--dimension", type=int, default=384, help="Embedding dimensionality")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for synthetic vectors")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.roles, args.dimension, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
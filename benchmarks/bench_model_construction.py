@@ -0,0 +1,102 @@
+"""Compare model construction cost on pydantic_shim versus real pydantic.
+
+Loads ``job_role_analyzer.data_models`` once against each backend and times validated
+construction and trusted ``model_construct`` for the hydration-heavy models.
+
+Usage::
+
+    python -m benchmarks.bench_model_construction --rows 50000
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, List
+from uuid import uuid4
+
+
+def _load_models(module_name: str, *, block_pydantic: bool) -> ModuleType:
+    spec = importlib.util.find_spec("job_role_analyzer.data_models")
+    assert spec is not None and spec.origin is not None
+    isolated = importlib.util.spec_from_file_location(module_name, spec.origin)
+    assert isolated is not None and isolated.loader is not None
+    module = importlib.util.module_from_spec(isolated)
+    saved = sys.modules.get("pydantic")
+    if block_pydantic:
+        sys.modules["pydantic"] = None  # type: ignore[assignment]
+    sys.modules[module_name] = module
+    try:
+        isolated.loader.exec_module(module)
+    finally:
+        if block_pydantic:
+            if saved is None:
+                sys.modules.pop("pydantic", None)
+            else:
+                sys.modules["pydantic"] = saved
+    return module
+
+
+def _time_per_row(build: Callable[[Dict[str, Any]], Any], rows: List[Dict[str, Any]], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for row in rows:
+            build(row)
+        best = min(best, time.perf_counter() - started)
+    return best / len(rows) * 1e6
+
+
+def _measure(models: ModuleType, competencies: List[Dict[str, Any]], roles: List[Dict[str, Any]], repeats: int):
+    competency = models.Competency
+    summary = models.JobRoleSummary
+    return {
+        "competency_validate_us": round(_time_per_row(lambda row: competency(**row), competencies, repeats), 3),
+        "competency_construct_us": round(
+            _time_per_row(lambda row: competency.model_construct(**row), competencies, repeats), 3
+        ),
+        "summary_validate_us": round(_time_per_row(lambda row: summary(**row), roles, repeats), 3),
+        "summary_construct_us": round(_time_per_row(lambda row: summary.model_construct(**row), roles, repeats), 3),
+    }
+
+
+def run(rows: int, repeats: int = 3) -> Dict[str, Any]:
+    competencies = [
+        {"name": f"Skill {index % 200}", "level": index % 5 + 1, "type": "technical" if index % 3 else "soft"}
+        for index in range(rows)
+    ]
+    roles = [
+        {
+            "job_role_id": uuid4(),
+            "job_title": f"Role {index}",
+            "normalized_summary": f"Summary {index}",
+            "years_experience": index % 15,
+        }
+        for index in range(rows)
+    ]
+    results: Dict[str, Any] = {"rows": rows}
+    shim_models = _load_models("_bench_models_shim", block_pydantic=True)
+    results["pydantic_shim"] = _measure(shim_models, competencies, roles, repeats)
+    try:
+        import pydantic
+    except ModuleNotFoundError:
+        results["pydantic"] = None
+    else:
+        pydantic_models = _load_models("_bench_models_pydantic", block_pydantic=False)
+        results["pydantic"] = {"version": pydantic.VERSION, **_measure(pydantic_models, competencies, roles, repeats)}
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark shim versus pydantic model construction")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows constructed per measurement")
+    parser.add_argument("--repeats", type=int, default=3, help="Repetitions; the fastest is reported")
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.rows, args.repeats), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Profile per-request CPU for hydrating stored roles with and without validation.
+
+Mirrors the storage side of a request that resolves to an existing role with the role
+cache cold: one hydration query plus model construction for the role and its
+competencies. Trusted hydration only changes the construction path when the models run
+on ``pydantic_shim``; run it in an environment without pydantic to measure that case.
+
+Usage::
+
+    python -m benchmarks.bench_role_hydration --roles 2000 --competencies 12 --profile
+"""
+from __future__ import annotations
+
+import argparse
+import cProfile
+import io
+import json
+import pstats
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+from uuid import UUID
+
+from job_role_analyzer.data_models import (
+    USING_PYDANTIC_SHIM,
+    Competency,
+    JobRoleSummary,
+    JobRoleWithCompetencies,
+)
+from job_role_analyzer.db import ROLE_HYDRATION_QUERY, Database, StoredJobRole, _hydrate_roles
+
+
+def _validated_hydrate(rows: Iterable[Any]) -> Dict[UUID, JobRoleWithCompetencies]:
+    """Replicates the previous hydration, which re-ran every validator on read."""
+    roles: Dict[UUID, JobRoleWithCompetencies] = {}
+    current: JobRoleWithCompetencies | None = None
+    for row in rows:
+        job_role_id = UUID(row["job_role_id"])
+        if current is None or current.job_role.job_role_id != job_role_id:
+            current = JobRoleWithCompetencies(
+                job_role=JobRoleSummary(
+                    job_role_id=job_role_id,
+                    job_title=row["job_title"],
+                    normalized_summary=row["normalized_summary"],
+                    years_experience=row["years_experience"],
+                ),
+                competencies=[],
+            )
+            roles[job_role_id] = current
+        if row["competency_id"] is not None:
+            current.competencies.append(
+                Competency(name=sys.intern(row["name"]), level=row["level"], type=row["type"])
+            )
+    return roles
+
+
+def _populate(database: Database, roles: int, competencies: int, seed: int) -> List[UUID]:
+    rng = random.Random(seed)
+    entries = [
+        StoredJobRole(
+            job_role=JobRoleSummary(
+                job_title=f"Role {index}",
+                normalized_summary=f"Synthetic summary for role {index}",
+                years_experience=index % 15,
+            ),
+            competencies=[
+                Competency(name=f"Skill {rng.randrange(300)}", level=rng.randint(1, 5)) for _ in range(competencies)
+            ],
+        )
+        for index in range(roles)
+    ]
+    database.add_job_roles(entries)
+    return [entry.job_role.job_role_id for entry in entries]
+
+
+def _per_request_cpu(
+    database: Database,
+    role_ids: List[UUID],
+    hydrate: Callable[[Iterable[Any]], Dict[UUID, JobRoleWithCompetencies]],
+) -> float:
+    connection = database._reader()  # noqa: SLF001 - bypass the role cache on purpose
+    query = f"{ROLE_HYDRATION_QUERY} WHERE r.job_role_id = ? ORDER BY c.id"
+    started = time.process_time()
+    for job_role_id in role_ids:
+        hydrate(connection.execute(query, (str(job_role_id),)).fetchall())
+    return (time.process_time() - started) / len(role_ids)
+
+
+def run(roles: int, competencies: int, seed: int = 7, profile: bool = False) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as workdir:
+        database = Database(str(Path(workdir) / "bench.db"))
+        try:
+            role_ids = _populate(database, roles, competencies, seed)
+            validated = _per_request_cpu(database, role_ids, _validated_hydrate)
+            trusted = _per_request_cpu(database, role_ids, _hydrate_roles)
+            report = None
+            if profile:
+                profiler = cProfile.Profile()
+                profiler.enable()
+                _per_request_cpu(database, role_ids, _validated_hydrate)
+                profiler.disable()
+                stream = io.StringIO()
+                pstats.Stats(profiler, stream=stream).sort_stats("tottime").print_stats(8)
+                report = stream.getvalue()
+        finally:
+            database.close()
+
+    results: Dict[str, Any] = {
+        "backend": "pydantic_shim" if USING_PYDANTIC_SHIM else "pydantic",
+        "roles": roles,
+        "competencies_per_role": competencies,
+        "validated_us_per_request": round(validated * 1e6, 2),
+        "trusted_us_per_request": round(trusted * 1e6, 2),
+        "cpu_reduction_percent": round((1 - trusted / validated) * 100, 1) if validated else None,
+    }
+    if report is not None:
+        results["validated_profile"] = report
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark validated versus trusted role hydration")
+    parser.add_argument("--roles", type=int, default=2000, help="Number of stored roles, each fetched once")
+    parser.add_argument("--competencies", type=int, default=12, help="Competencies per role")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for synthetic competencies")
+    parser.add_argument("--profile", action="store_true", help="Include a cProfile summary of the validated path")
+    args = parser.parse_args(argv)
+    results = run(args.roles, args.competencies, args.seed, args.profile)
+    report = results.pop("validated_profile", None)
+    print(json.dumps(results, indent=2))
+    if report:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare benchmark results JSON against a stored baseline.
+
+Metrics named ``*_per_second`` are higher-is-better; every other numeric metric
+(seconds, latencies, memory) is lower-is-better.
+
+Usage::
+
+    python -m benchmarks.compare results.json benchmarks/baseline.json --tolerance 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+def higher_is_better(metric: str) -> bool:
+    return metric.endswith("_per_second")
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], *, tolerance: float = 0.2) -> Dict[str, Any]:
+    """Return per-metric relative changes and the metrics that regressed beyond ``tolerance``."""
+    rows: List[Dict[str, Any]] = []
+    regressions: List[str] = []
+    current, previous = results.get("metrics", {}), baseline.get("metrics", {})
+    for metric, value in current.items():
+        reference = previous.get(metric)
+        if not isinstance(value, (int, float)) or not isinstance(reference, (int, float)) or reference == 0:
+            continue
+        change = (value - reference) / reference
+        worse = -change if higher_is_better(metric) else change
+        regressed = worse > tolerance
+        rows.append(
+            {
+                "metric": metric,
+                "baseline": reference,
+                "current": value,
+                "change_percent": round(change * 100, 1),
+                "regressed": regressed,
+            }
+        )
+        if regressed:
+            regressions.append(metric)
+    mismatched = {
+        key: (baseline.get("parameters", {}).get(key), value)
+        for key, value in results.get("parameters", {}).items()
+        if baseline.get("parameters", {}).get(key) != value
+    }
+    return {"metrics": rows, "regressions": regressions, "parameter_mismatches": mismatched}
+
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    lines = []
+    for key, (before, after) in comparison["parameter_mismatches"].items():
+        lines.append(f"warning: parameter {key} differs from baseline ({before!r} -> {after!r})")
+    width = max((len(row["metric"]) for row in comparison["metrics"]), default=6)
+    for row in comparison["metrics"]:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        lines.append(
+            f"{row['metric']:<{width}}  {row['baseline']:>12}  {row['current']:>12}  {row['change_percent']:>+7.1f}%{flag}"
+        )
+    lines.append(f"{len(comparison['regressions'])} regression(s)")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark results against a baseline")
+    parser.add_argument("results", help="Results JSON produced by benchmarks.suite")
+    parser.add_argument("baseline", help="Stored baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown per metric")
+    args = parser.parse_args(argv)
+    comparison = compare(
+        json.loads(Path(args.results).read_text(encoding="utf-8")),
+        json.loads(Path(args.baseline).read_text(encoding="utf-8")),
+        tolerance=args.tolerance,
+    )
+    print(format_comparison(comparison))
+    return 1 if comparison["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
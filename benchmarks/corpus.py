@@ -0,0 +1,144 @@
+"""Deterministic synthetic job role corpus for benchmarks and load tests.
+
+Every role is derived from ``(seed, index)`` alone, so any slice of a corpus can be
+regenerated without materializing the rest; this keeps million-role corpora streamable.
+
+Usage::
+
+    python -m benchmarks.corpus --roles 100000 --database bench.db --embedder hashing
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import Iterator, List, Sequence
+
+from job_role_analyzer.analyzer import compute_content_hash
+from job_role_analyzer.data_models import Competency, JobRoleSummary
+from job_role_analyzer.db import Database, StoredJobRole
+from job_role_analyzer.similarity import EmbeddingProvider, embed_batch
+
+from .fakes import build_embedder
+
+
+TITLES = (
+    "Data Engineer", "Backend Engineer", "Frontend Engineer", "Site Reliability Engineer",
+    "Machine Learning Engineer", "Data Scientist", "Product Manager", "Security Engineer",
+    "Mobile Developer", "QA Engineer", "Platform Engineer", "Solutions Architect",
+    "Engineering Manager", "Database Administrator", "DevOps Engineer", "Analytics Engineer",
+)
+SENIORITY = ("Junior", "", "Senior", "Staff", "Principal", "Lead")
+SKILLS = (
+    "Python", "Go", "Java", "TypeScript", "Rust", "SQL", "Kafka", "Spark", "Airflow", "dbt",
+    "Kubernetes", "Terraform", "AWS", "GCP", "Azure", "PostgreSQL", "Redis", "React", "GraphQL",
+    "PyTorch", "TensorFlow", "Docker", "Linux", "gRPC", "Elasticsearch", "Snowflake", "Flink",
+    "Observability", "Incident response", "System design", "Stakeholder management", "Mentoring",
+)
+RESPONSIBILITIES = (
+    "design and operate {a} services backed by {b}",
+    "build batch and streaming pipelines with {a} and {b}",
+    "own the reliability of production systems running on {a}",
+    "partner with product teams to ship features in {a}",
+    "migrate legacy workloads to {a} while keeping {b} costs flat",
+    "define data contracts and quality checks for {a} datasets",
+    "mentor engineers and review designs involving {a} and {b}",
+    "automate infrastructure provisioning using {a}",
+    "tune query performance across {a} and {b}",
+    "lead incident reviews and drive follow-up work on {a}",
+)
+
+
+@dataclass(frozen=True)
+class SyntheticRole:
+    index: int
+    job_title: str
+    job_description: str
+    years_of_experience: int
+    skills: tuple
+
+    @property
+    def content_hash(self) -> str:
+        return compute_content_hash(self.job_title, self.job_description, self.years_of_experience)
+
+
+def make_role(index: int, seed: int = 0) -> SyntheticRole:
+    rng = random.Random(f"{seed}:{index}")
+    title = " ".join(part for part in (rng.choice(SENIORITY), rng.choice(TITLES)) if part)
+    skills = tuple(rng.sample(SKILLS, 5))
+    sentences = [
+        rng.choice(RESPONSIBILITIES).format(a=rng.choice(skills), b=rng.choice(skills)).capitalize() + "."
+        for _ in range(rng.randint(3, 6))
+    ]
+    # The index keeps every description unique even when the sampled sentences collide.
+    sentences.append(f"Team reference {index}.")
+    return SyntheticRole(index, title, " ".join(sentences), rng.randint(0, 15), skills)
+
+
+def iter_roles(count: int, *, seed: int = 0, start: int = 0) -> Iterator[SyntheticRole]:
+    for index in range(start, start + count):
+        yield make_role(index, seed)
+
+
+def competencies_for(skills: Sequence[str], digest: bytes) -> List[Competency]:
+    """Pick 3-5 competencies for ``skills``; ``digest`` makes the choice deterministic."""
+    count = 3 + digest[0] % 3
+    return [
+        Competency(name=skill, level=1 + digest[position + 1] % 5, type="technical")
+        for position, skill in enumerate(skills[:count])
+    ]
+
+
+def stored_role(role: SyntheticRole, embedding: Sequence[float] | None) -> StoredJobRole:
+    digest = hashlib.sha256(role.job_description.encode("utf-8")).digest()
+    return StoredJobRole(
+        job_role=JobRoleSummary(
+            job_title=role.job_title,
+            normalized_summary=f"{role.job_title} working with {', '.join(role.skills[:3])}.",
+            years_experience=role.years_of_experience,
+        ),
+        competencies=competencies_for(role.skills, digest),
+        embedding=embedding,
+        content_hash=role.content_hash,
+    )
+
+
+def populate(
+    database: Database,
+    embedder: EmbeddingProvider,
+    count: int,
+    *,
+    seed: int = 0,
+    chunk_size: int = 5000,
+) -> None:
+    """Write ``count`` synthetic roles with embeddings, one transaction per chunk."""
+    for start in range(0, count, chunk_size):
+        roles = list(iter_roles(min(chunk_size, count - start), seed=seed, start=start))
+        matrix = embed_batch(embedder, [role.job_description for role in roles])
+        database.add_job_roles(stored_role(role, vector) for role, vector in zip(roles, matrix))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Populate a database with a synthetic job role corpus")
+    parser.add_argument("--roles", type=int, default=10000, help="Number of roles to generate")
+    parser.add_argument("--database", required=True, help="SQLite database to populate")
+    parser.add_argument("--embedder", choices=("hashing", "stub"), default="hashing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Roles written per transaction")
+    args = parser.parse_args(argv)
+
+    database = Database(args.database)
+    started = time.perf_counter()
+    try:
+        populate(database, build_embedder(args.embedder), args.roles, seed=args.seed, chunk_size=args.chunk_size)
+    finally:
+        database.close()
+    elapsed = time.perf_counter() - started
+    print(json.dumps({"roles": args.roles, "seconds": round(elapsed, 2), "roles_per_second": round(args.roles / elapsed, 1)}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Deterministic stand-ins for the LLM and embedding model used by the benchmarks."""
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import threading
+import time
+from typing import Any, List, Sequence
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - executed when numpy is unavailable
+    np = None  # type: ignore[assignment]
+
+from job_role_analyzer.embeddings import HashingEmbeddingProvider
+from job_role_analyzer.similarity import EmbeddingProvider
+
+
+STUB_DIMENSION = 64
+NORMALIZE_PROMPT_MARKER = "distills job descriptions"
+COMPETENCY_NAMES = (
+    "Python", "SQL", "System design", "Kubernetes", "Data modeling", "Communication",
+    "Incident response", "Testing", "Mentoring", "Cloud infrastructure",
+)
+
+
+class FakeLLMClient:
+    """``LLMClient`` answering the analyzer's two prompts with valid, prompt-derived output.
+
+    Each call sleeps ``latency_seconds`` plus up to ``jitter_seconds`` drawn from a seeded
+    generator, so runs are repeatable while still exercising concurrency.
+    """
+
+    def __init__(self, latency_seconds: float = 0.0, *, jitter_seconds: float = 0.0, seed: int = 0) -> None:
+        self.latency_seconds = latency_seconds
+        self.jitter_seconds = jitter_seconds
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def complete(self, prompt: str, **kwargs: Any) -> str:
+        with self._lock:
+            self.calls += 1
+            delay = self.latency_seconds + self._rng.random() * self.jitter_seconds
+        if delay > 0:
+            time.sleep(delay)
+        digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+        if NORMALIZE_PROMPT_MARKER in prompt:
+            return f"Synthetic role summary {digest[:6].hex()}."
+        return json.dumps(fake_competencies(digest))
+
+
+def fake_competencies(digest: bytes) -> List[dict]:
+    count = 3 + digest[0] % 3
+    names = [COMPETENCY_NAMES[(digest[1] + step * 3) % len(COMPETENCY_NAMES)] for step in range(count)]
+    return [
+        {"name": name, "level": 1 + digest[position + 2] % 5, "type": "technical"}
+        for position, name in enumerate(dict.fromkeys(names))
+    ]
+
+
+class StubEmbeddingProvider:
+    """Random unit vectors seeded by the text hash: cheap, deterministic, no semantic signal."""
+
+    def __init__(self, dimension: int = STUB_DIMENSION) -> None:
+        self.dimension = dimension
+
+    def embed(self, text: str) -> Sequence[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+        if np is not None:
+            vector = np.random.default_rng(seed).standard_normal(self.dimension).astype(np.float32)
+            return (vector / np.linalg.norm(vector)).tolist()
+        rng = random.Random(seed)
+        values = [rng.gauss(0.0, 1.0) for _ in range(self.dimension)]
+        norm = sum(value * value for value in values) ** 0.5
+        return [value / norm for value in values]
+
+
+def build_embedder(name: str) -> EmbeddingProvider:
+    if name == "stub":
+        return StubEmbeddingProvider()
+    if name == "hashing":
+        return HashingEmbeddingProvider()
+    raise ValueError(f"Unknown benchmark embedder: {name}")
@@ -0,0 +1,180 @@
+"""Open-loop load generator for ``POST /api/analyze``.
+
+Requests are sent at a fixed target rate regardless of how fast responses come back, so
+queueing and shedding show up in the results. A configurable share of requests repeats
+an earlier payload, which exercises the content-hash and response-cache paths. LLM usage
+is read from the server's ``/metrics`` before and after the run.
+
+Usage::
+
+    python -m benchmarks.stub_llm --port 1234 &
+    uvicorn webapp.main:app --port 8000 &
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --rps 20 --duration 30 --duplicate-ratio 0.5
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import statistics
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from .corpus import make_role
+
+
+PROMPT_STAGES = ("normalize_jd", "extract_competencies")
+LLM_CALLS_PER_MISS = len(PROMPT_STAGES)
+_STAGE_COUNT = re.compile(r'^jra_stage_duration_seconds_count\{stage="([^"]+)"\} (\S+)$', re.MULTILINE)
+
+
+async def llm_prompt_count(client: httpx.AsyncClient) -> int | None:
+    """Total LLM prompts the server has run, from its ``/metrics`` stage counters."""
+    try:
+        response = await client.get("/metrics")
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return None
+    counts = {stage: float(value) for stage, value in _STAGE_COUNT.findall(response.text)}
+    return int(sum(counts.get(stage, 0.0) for stage in PROMPT_STAGES))
+
+
+class PayloadSource:
+    """Yields fresh corpus roles, or with ``duplicate_ratio`` probability a previously sent one."""
+
+    def __init__(self, duplicate_ratio: float, *, seed: int = 0, start_index: int = 0) -> None:
+        self.duplicate_ratio = duplicate_ratio
+        self._rng = random.Random(seed)
+        self._seed = seed
+        self._next_index = start_index
+        self._sent: List[Dict[str, Any]] = []
+
+    def next(self) -> Tuple[Dict[str, Any], bool]:
+        if self._sent and self._rng.random() < self.duplicate_ratio:
+            return self._rng.choice(self._sent), True
+        role = make_role(self._next_index, self._seed)
+        self._next_index += 1
+        payload = {
+            "job_title": role.job_title,
+            "job_description": role.job_description,
+            "years_of_experience": role.years_of_experience,
+        }
+        self._sent.append(payload)
+        return payload, False
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float | None]:
+    if not samples:
+        return {"p50": None, "p90": None, "p99": None, "max": None}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+    return {
+        "p50": round(cuts[49] * 1e3, 1),
+        "p90": round(cuts[89] * 1e3, 1),
+        "p99": round(cuts[98] * 1e3, 1),
+        "max": round(max(samples) * 1e3, 1),
+    }
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    *,
+    rps: float,
+    duration: float,
+    duplicate_ratio: float = 0.0,
+    seed: int = 0,
+    start_index: int = 0,
+    request_timeout: float = 120.0,
+) -> Dict[str, Any]:
+    if rps <= 0 or duration <= 0:
+        raise ValueError("rps and duration must be positive")
+    source = PayloadSource(duplicate_ratio, seed=seed, start_index=start_index)
+    statuses: Counter[str] = Counter()
+    latencies: List[float] = []
+    duplicates = 0
+
+    async def send(payload: Dict[str, Any]) -> None:
+        started = time.perf_counter()
+        try:
+            response = await client.post("/api/analyze", json=payload, timeout=request_timeout)
+        except httpx.HTTPError as exc:
+            statuses[type(exc).__name__] += 1
+            return
+        statuses[str(response.status_code)] += 1
+        if response.status_code < 400:
+            latencies.append(time.perf_counter() - started)
+
+    prompts_before = await llm_prompt_count(client)
+    total = max(1, int(rps * duration))
+    tasks = []
+    started = time.perf_counter()
+    for position in range(total):
+        delay = started + position / rps - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        payload, duplicate = source.next()
+        duplicates += duplicate
+        tasks.append(asyncio.create_task(send(payload)))
+    send_seconds = time.perf_counter() - started
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    prompts_after = await llm_prompt_count(client)
+
+    succeeded = len(latencies)
+    report: Dict[str, Any] = {
+        "target_rps": rps,
+        "achieved_send_rps": round(total / send_seconds, 1) if send_seconds else None,
+        "requests": total,
+        "duplicates": duplicates,
+        "succeeded": succeeded,
+        "statuses": dict(sorted(statuses.items())),
+        "throughput_rps": round(succeeded / elapsed, 1),
+        "latency_ms": _percentiles(latencies),
+        "elapsed_seconds": round(elapsed, 2),
+    }
+    if prompts_before is not None and prompts_after is not None:
+        llm_calls = prompts_after - prompts_before
+        report["llm_calls"] = llm_calls
+        report["llm_calls_avoided"] = max(0, succeeded * LLM_CALLS_PER_MISS - llm_calls)
+    return report
+
+
+async def _main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits) as client:
+        return await run_load(
+            client,
+            rps=args.rps,
+            duration=args.duration,
+            duplicate_ratio=args.duplicate_ratio,
+            seed=args.seed,
+            start_index=args.start_index,
+            request_timeout=args.timeout,
+        )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Drive /api/analyze at a target request rate")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Base URL of the webapp")
+    parser.add_argument("--rps", type=float, default=10.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to keep sending")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.5, help="Share of requests repeating a payload")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--start-index",
+        type=int,
+        default=1_000_000,
+        help="First corpus index for fresh payloads; keep it past any pre-populated corpus",
+    )
+    parser.add_argument("--max-connections", type=int, default=512)
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds")
+    args = parser.parse_args(argv)
+    print(json.dumps(asyncio.run(_main_async(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Local stand-in for the LM Studio server, speaking OpenAI-style ``/v1/chat/completions``.
+
+Answers the analyzer's prompts with valid summaries and competency JSON (see
+:mod:`benchmarks.fakes`), both as a single response and as an SSE token stream, with a
+configurable latency profile: time to first token, token rate, a slow tail and errors.
+
+Usage::
+
+    python -m benchmarks.stub_llm --port 1234 --ttft-ms 300 --tokens-per-second 60 \\
+        --tail-ratio 0.02 --tail-ms 4000 --error-rate 0.01
+
+then point ``llm_targets.job_role_analyzer.base_url`` at ``http://127.0.0.1:1234``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from .fakes import NORMALIZE_PROMPT_MARKER, fake_competencies
+
+
+MODEL_NAME = "stub-llm"
+
+
+@dataclass
+class LatencyProfile:
+    ttft_seconds: float = 0.2
+    tokens_per_second: float = 50.0
+    tail_ratio: float = 0.0
+    tail_seconds: float = 0.0
+    error_rate: float = 0.0
+
+
+class StubLLMStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.streamed = 0
+        self.tokens = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"requests": self.requests, "errors": self.errors, "streamed": self.streamed, "tokens": self.tokens}
+
+    def record(self, *, error: bool = False, streamed: bool = False, tokens: int = 0) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += int(error)
+            self.streamed += int(streamed)
+            self.tokens += tokens
+
+
+def answer_for(prompt: str) -> str:
+    digest = hashlib.sha256(prompt.encode("utf-8")).digest()
+    if NORMALIZE_PROMPT_MARKER in prompt:
+        return f"Synthetic role summary {digest[:6].hex()} covering the responsibilities and stack described."
+    return json.dumps(fake_competencies(digest))
+
+
+def tokenize(text: str) -> List[str]:
+    """Split into word-sized pieces that concatenate back to ``text``."""
+    return re.findall(r"\s*\S+", text) or [text]
+
+
+def _prompt_from(body: Dict[str, Any]) -> str:
+    messages = body.get("messages")
+    if isinstance(messages, list):
+        return "\n".join(str(message.get("content", "")) for message in messages if isinstance(message, dict))
+    return str(body.get("prompt", ""))
+
+
+def create_app(profile: LatencyProfile, *, seed: int = 0) -> FastAPI:
+    app = FastAPI(title="Stub LLM")
+    rng = random.Random(seed)
+    rng_lock = threading.Lock()
+    ids = itertools.count(1)
+    stats = StubLLMStats()
+    app.state.stats = stats
+
+    def draw() -> tuple[bool, float]:
+        with rng_lock:
+            failed = rng.random() < profile.error_rate
+            tail = profile.tail_seconds if rng.random() < profile.tail_ratio else 0.0
+        return failed, tail
+
+    def token_delay() -> float:
+        return 1.0 / profile.tokens_per_second if profile.tokens_per_second > 0 else 0.0
+
+    @app.get("/")
+    @app.get("/v1/models")
+    async def models() -> Dict[str, Any]:
+        return {"object": "list", "data": [{"id": MODEL_NAME, "object": "model"}]}
+
+    @app.get("/stats")
+    async def read_stats() -> Dict[str, int]:
+        return stats.snapshot()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        failed, tail = draw()
+        await asyncio.sleep(profile.ttft_seconds + tail)
+        if failed:
+            stats.record(error=True)
+            return JSONResponse({"error": {"message": "Injected stub failure", "type": "server_error"}}, status_code=500)
+
+        completion_id = f"chatcmpl-stub-{next(ids)}"
+        model = body.get("model") or MODEL_NAME
+        tokens = tokenize(answer_for(_prompt_from(body)))
+        if body.get("stream"):
+            stats.record(streamed=True, tokens=len(tokens))
+            return StreamingResponse(
+                _stream(completion_id, model, tokens, token_delay()),
+                media_type="text/event-stream",
+            )
+        await asyncio.sleep(len(tokens) * token_delay())
+        stats.record(tokens=len(tokens))
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {"index": 0, "message": {"role": "assistant", "content": "".join(tokens)}, "finish_reason": "stop"}
+            ],
+            "usage": {"completion_tokens": len(tokens)},
+        }
+
+    return app
+
+
+async def _stream(completion_id: str, model: str, tokens: List[str], delay: float) -> AsyncIterator[bytes]:
+    def chunk(delta: Dict[str, Any], finish_reason: str | None = None) -> bytes:
+        payload = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return b"data: " + json.dumps(payload).encode("utf-8") + b"\n\n"
+
+    yield chunk({"role": "assistant"})
+    for position, token in enumerate(tokens):
+        if position and delay:
+            await asyncio.sleep(delay)
+        yield chunk({"content": token})
+    yield chunk({}, "stop")
+    yield b"data: [DONE]\n\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run a local OpenAI-style stub LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1234)
+    parser.add_argument("--ttft-ms", type=float, default=200.0, help="Delay before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0, help="0 streams without delay")
+    parser.add_argument("--tail-ratio", type=float, default=0.0, help="Fraction of requests that are slow")
+    parser.add_argument("--tail-ms", type=float, default=0.0, help="Extra delay for slow requests")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    profile = LatencyProfile(
+        ttft_seconds=args.ttft_ms / 1000.0,
+        tokens_per_second=args.tokens_per_second,
+        tail_ratio=args.tail_ratio,
+        tail_seconds=args.tail_ms / 1000.0,
+        error_rate=args.error_rate,
+    )
+    uvicorn.run(create_app(profile, seed=args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
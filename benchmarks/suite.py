@@ -0,0 +1,229 @@
+"""End-to-end benchmark suite for the analyze hot path, runnable fully offline.
+
+Builds a synthetic corpus, then measures cold start, index build, similarity search
+latency, hit-path and miss-path throughput, and memory. Results are printed as JSON and
+can be compared against a stored baseline with ``--baseline`` (or :mod:`benchmarks.compare`).
+
+Usage::
+
+    python -m benchmarks.suite --roles 10000 --output results.json
+    python -m benchmarks.suite --roles 10000 --baseline benchmarks/baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+try:
+    import resource
+except ModuleNotFoundError:  # pragma: no cover - executed on Windows
+    resource = None  # type: ignore[assignment]
+
+from job_role_analyzer.analyzer import JobRoleAnalyzer
+from job_role_analyzer.data_models import USING_PYDANTIC_SHIM
+from job_role_analyzer.db import Database
+from job_role_analyzer.llm_interface import LLMInterface
+from job_role_analyzer.similarity import embed_batch
+
+from .compare import compare, format_comparison
+from .corpus import iter_roles, populate
+from .fakes import FakeLLMClient, build_embedder
+
+
+def _rss_mib() -> float | None:
+    """Current resident set size, where ``/proc`` is available."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as handle:
+            resident_pages = int(handle.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _peak_rss_mib() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def _percentiles(samples: List[float], prefix: str, scale: float) -> Dict[str, float]:
+    ordered = sorted(samples)
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive") if len(ordered) > 1 else ordered * 99
+    return {
+        f"{prefix}_p50": round(cuts[49] * scale, 2),
+        f"{prefix}_p95": round(cuts[94] * scale, 2),
+        f"{prefix}_p99": round(cuts[98] * scale, 2),
+    }
+
+
+def _throughput(requests: List[Dict[str, Any]], handler: Callable[..., Any], prefix: str) -> Dict[str, float]:
+    latencies = []
+    started = time.perf_counter()
+    for request in requests:
+        call_started = time.perf_counter()
+        handler(**request)
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    return {
+        f"{prefix}_requests_per_second": round(len(requests) / elapsed, 1),
+        **_percentiles(latencies, f"{prefix}_latency_ms", 1e3),
+    }
+
+
+def _forced_miss(analyzer: JobRoleAnalyzer) -> Callable[..., Any]:
+    """Full resolve, generate and persist, even when a templated corpus role is similar enough."""
+
+    def analyze(*, job_title: str, job_description: str, years_of_experience: int) -> Any:
+        resolution = analyzer.resolve(
+            job_title=job_title,
+            job_description=job_description,
+            years_of_experience=years_of_experience,
+        )
+        resolution.existing_role_id = None
+        return analyzer.analyze_resolved(
+            job_title=job_title,
+            years_of_experience=years_of_experience,
+            resolution=resolution,
+        )
+
+    return analyze
+
+
+def _request(role) -> Dict[str, Any]:
+    return {
+        "job_title": role.job_title,
+        "job_description": role.job_description,
+        "years_of_experience": role.years_of_experience,
+    }
+
+
+def run(
+    roles: int,
+    *,
+    queries: int = 500,
+    embedder_name: str = "hashing",
+    llm_latency_ms: float = 0.0,
+    seed: int = 0,
+    repeat: int = 3,
+) -> Dict[str, Any]:
+    """Run the suite ``repeat`` times on fresh corpora and report each metric's median."""
+    samples = [_run_once(roles, queries, embedder_name, llm_latency_ms, seed) for _ in range(repeat)]
+    metrics: Dict[str, float | None] = {}
+    for name in samples[0]:
+        values = [sample[name] for sample in samples if sample.get(name) is not None]
+        metrics[name] = statistics.median(values) if values else None
+    return {
+        "parameters": {
+            "roles": roles,
+            "queries": queries,
+            "embedder": embedder_name,
+            "llm_latency_ms": llm_latency_ms,
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "models": "pydantic_shim" if USING_PYDANTIC_SHIM else "pydantic",
+        },
+        "metrics": metrics,
+    }
+
+
+def _run_once(
+    roles: int,
+    queries: int,
+    embedder_name: str,
+    llm_latency_ms: float,
+    seed: int,
+) -> Dict[str, float | None]:
+    embedder = build_embedder(embedder_name)
+    metrics: Dict[str, float | None] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        path = str(Path(workdir) / "bench.db")
+        database = Database(path)
+        started = time.perf_counter()
+        populate(database, embedder, roles, seed=seed)
+        metrics["populate_seconds"] = round(time.perf_counter() - started, 3)
+        database.close()
+        gc.collect()
+
+        rss_before = _rss_mib()
+        started = time.perf_counter()
+        database = Database(path)
+        llm_client = FakeLLMClient(llm_latency_ms / 1000.0, seed=seed)
+        analyzer = JobRoleAnalyzer(database, LLMInterface(llm_client), embedder)
+        metrics["cold_start_seconds"] = round(time.perf_counter() - started, 4)
+        rss_after = _rss_mib()
+        metrics["index_rss_mib"] = round(rss_after - rss_before, 1) if rss_before and rss_after else None
+
+        try:
+            checker = analyzer.similarity_checker
+            started = time.perf_counter()
+            checker.rebuild_index()
+            metrics["index_build_seconds"] = round(time.perf_counter() - started, 4)
+
+            # Held-out roles: never stored, so every search scans the index without a hash hit.
+            held_out = list(iter_roles(queries, seed=seed, start=roles))
+            vectors = embed_batch(embedder, [role.job_description for role in held_out])
+            latencies = []
+            for vector in vectors:
+                call_started = time.perf_counter()
+                checker.find_similar_role_id_for_embedding(vector)
+                latencies.append(time.perf_counter() - call_started)
+            metrics.update(_percentiles(latencies, "search_latency_us", 1e6))
+
+            stored = [_request(role) for role in iter_roles(min(queries, roles), seed=seed)]
+            metrics.update(_throughput(stored, analyzer.analyze, "hit"))
+            metrics.update(_throughput([_request(role) for role in held_out], _forced_miss(analyzer), "miss"))
+            metrics["peak_rss_mib"] = round(_peak_rss_mib() or 0.0, 1) or None
+        finally:
+            database.close()
+    return metrics
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the analyze hot path on a synthetic corpus")
+    parser.add_argument("--roles", type=int, default=1000, help="Corpus size (1k to 1M)")
+    parser.add_argument("--queries", type=int, default=500, help="Searches and requests per measured path")
+    parser.add_argument("--embedder", choices=("hashing", "stub"), default="hashing")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency per LLM call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per metric; the median is reported")
+    parser.add_argument("--output", help="Also write the results JSON to this path")
+    parser.add_argument("--baseline", help="Compare against a stored results JSON; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown per metric")
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.roles,
+        queries=args.queries,
+        embedder_name=args.embedder,
+        llm_latency_ms=args.llm_latency_ms,
+        seed=args.seed,
+        repeat=args.repeat,
+    )
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        comparison = compare(results, baseline, tolerance=args.tolerance)
+        print(format_comparison(comparison))
+        return 1 if comparison["regressions"] else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@ from .config import AnalyzerConfig, LLMEndpointConfig, load_config
 from .data_models import Competency, JobRoleSummary, JobRoleWithCompetencies
 from .db import Database
 from .llm_interface import LLMInterface, LLMClient, TemplateRenderer
-from .embeddings import SentenceTransformerEmbeddingProvider
+from .embeddings import HashingEmbeddingProvider, SentenceTransformerEmbeddingProvider
 from .similarity import EmbeddingProvider, SimilarityChecker
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     "Competency",
     "Database",
     "EmbeddingProvider",
+    "HashingEmbeddingProvider",
     "JobRoleAnalyzer",
     "JobRoleSummary",
     "JobRoleWithCompetencies",
@@ -0,0 +1,176 @@
+"""Incrementally maintained competency aggregates over the job role store."""
+from __future__ import annotations
+
+import sqlite3
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+EXPERIENCE_BANDS: Tuple[Tuple[int, int | None, str], ...] = (
+    (0, 2, "0-2"),
+    (3, 5, "3-5"),
+    (6, 9, "6-9"),
+    (10, None, "10+"),
+)
+
+ANALYTICS_TABLES = ("competency_title_stats", "competency_level_stats")
+
+ANALYTICS_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS competency_title_stats (
+        title_key TEXT NOT NULL,
+        experience_band TEXT NOT NULL,
+        name_id INTEGER NOT NULL,
+        role_count INTEGER NOT NULL,
+        level_sum INTEGER NOT NULL,
+        PRIMARY KEY (title_key, experience_band, name_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS competency_level_stats (
+        name_id INTEGER NOT NULL,
+        level INTEGER NOT NULL,
+        role_count INTEGER NOT NULL,
+        PRIMARY KEY (name_id, level)
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_competency_title_stats_rank
+    ON competency_title_stats (title_key, experience_band, role_count DESC)
+    """,
+)
+
+
+def title_key(job_title: str) -> str:
+    return " ".join(job_title.split()).casefold()
+
+
+def experience_band(years: int) -> str:
+    for low, high, label in EXPERIENCE_BANDS:
+        if years >= low and (high is None or years <= high):
+            return label
+    return EXPERIENCE_BANDS[0][2]
+
+
+def register_functions(connection: sqlite3.Connection) -> None:
+    """Expose the Python key functions to SQL so recomputation can aggregate in SQLite."""
+    connection.create_function("jra_title_key", 1, title_key, deterministic=True)
+    connection.create_function("jra_experience_band", 1, experience_band, deterministic=True)
+
+
+def apply_role_delta(
+    connection: sqlite3.Connection,
+    job_title: str,
+    years_experience: int,
+    competencies: Iterable[Tuple[int, int]],
+    sign: int,
+) -> None:
+    """Add (``sign=1``) or remove (``sign=-1``) one role's ``(name_id, level)`` pairs."""
+    key = title_key(job_title)
+    band = experience_band(years_experience)
+    pairs = list(competencies)
+    if not pairs:
+        return
+    connection.executemany(
+        """
+        INSERT INTO competency_title_stats (title_key, experience_band, name_id, role_count, level_sum)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (title_key, experience_band, name_id) DO UPDATE
+        SET role_count = role_count + excluded.role_count, level_sum = level_sum + excluded.level_sum
+        """,
+        [(key, band, name_id, sign, sign * level) for name_id, level in pairs],
+    )
+    connection.executemany(
+        """
+        INSERT INTO competency_level_stats (name_id, level, role_count)
+        VALUES (?, ?, ?)
+        ON CONFLICT (name_id, level) DO UPDATE SET role_count = role_count + excluded.role_count
+        """,
+        [(name_id, level, sign) for name_id, level in pairs],
+    )
+    if sign < 0:
+        connection.execute("DELETE FROM competency_title_stats WHERE role_count <= 0")
+        connection.execute("DELETE FROM competency_level_stats WHERE role_count <= 0")
+
+
+def recompute(connection: sqlite3.Connection) -> None:
+    """Rebuild both aggregate tables from the base tables; run inside a transaction."""
+    register_functions(connection)
+    for table in ANALYTICS_TABLES:
+        connection.execute(f"DELETE FROM {table}")
+    connection.execute(
+        """
+        INSERT INTO competency_title_stats (title_key, experience_band, name_id, role_count, level_sum)
+        SELECT jra_title_key(r.job_title), jra_experience_band(r.years_experience), c.name_id,
+               COUNT(*), SUM(c.level)
+        FROM competencies AS c
+        JOIN job_roles AS r ON r.job_role_id = c.job_role_id
+        GROUP BY 1, 2, 3
+        """
+    )
+    connection.execute(
+        """
+        INSERT INTO competency_level_stats (name_id, level, role_count)
+        SELECT c.name_id, c.level, COUNT(*)
+        FROM competencies AS c
+        JOIN job_roles AS r ON r.job_role_id = c.job_role_id
+        GROUP BY 1, 2
+        """
+    )
+
+
+def top_competencies(
+    connection: sqlite3.Connection,
+    job_title: str,
+    years_experience: int | None = None,
+    limit: int = 10,
+) -> List[Dict[str, object]]:
+    key = title_key(job_title)
+    if years_experience is None:
+        rows: Sequence[sqlite3.Row] = connection.execute(
+            """
+            SELECT n.display_name AS name, SUM(s.role_count) AS role_count, SUM(s.level_sum) AS level_sum
+            FROM competency_title_stats AS s
+            JOIN competency_names AS n ON n.id = s.name_id
+            WHERE s.title_key = ?
+            GROUP BY s.name_id
+            ORDER BY role_count DESC, name
+            LIMIT ?
+            """,
+            (key, limit),
+        ).fetchall()
+    else:
+        rows = connection.execute(
+            """
+            SELECT n.display_name AS name, s.role_count, s.level_sum
+            FROM competency_title_stats AS s
+            JOIN competency_names AS n ON n.id = s.name_id
+            WHERE s.title_key = ? AND s.experience_band = ?
+            ORDER BY s.role_count DESC, name
+            LIMIT ?
+            """,
+            (key, experience_band(years_experience), limit),
+        ).fetchall()
+    return [
+        {
+            "name": row["name"],
+            "role_count": int(row["role_count"]),
+            "average_level": round(row["level_sum"] / row["role_count"], 2),
+        }
+        for row in rows
+    ]
+
+
+def level_distribution(connection: sqlite3.Connection, canonical_name: str) -> Dict[int, int] | None:
+    rows = connection.execute(
+        """
+        SELECT s.level, s.role_count
+        FROM competency_names AS n
+        LEFT JOIN competency_level_stats AS s ON s.name_id = n.id
+        WHERE n.canonical_name = ?
+        ORDER BY s.level
+        """,
+        (canonical_name,),
+    ).fetchall()
+    if not rows:
+        return None
+    return {int(row["level"]): int(row["role_count"]) for row in rows if row["level"] is not None}
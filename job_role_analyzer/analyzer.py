@@ -1,15 +1,43 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from dataclasses import dataclass
 from typing import Any, List, Sequence
+from uuid import UUID
 
 from .config import load_config
 from .data_models import Competency, JobRoleSummary, JobRoleWithCompetencies
-from .db import Database
+from .db import Database, StoredJobRole
 from .llm_interface import LLMInterface
+from .metrics import StageTimings, record_stages, time_stage
+from .preprocessing import EMBEDDING_CONSUMER, JobDescriptionPreprocessor, PreprocessedDescription
+from .shared_index import SharedVectorIndex
 from .similarity import EmbeddingProvider, SimilarityChecker
 
 
+def compute_content_hash(job_title: str, job_description: str, years_of_experience: int) -> str:
+    """Hash the request inputs after case- and whitespace-normalization."""
+    canonical = "\x1f".join(
+        (
+            " ".join(job_title.split()).casefold(),
+            " ".join(job_description.split()),
+            str(int(years_of_experience)),
+        )
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class RoleResolution:
+    """Outcome of looking up a request against the store before any LLM call."""
+
+    prepared: PreprocessedDescription
+    content_hash: str
+    embedding: List[float]
+    existing_role_id: UUID | None = None
+
+
 class JobRoleAnalyzer:
     """Coordinates job role normalization, competency extraction, and persistence."""
 
@@ -18,11 +46,14 @@ class JobRoleAnalyzer:
         db: Database,
         llm_interface: LLMInterface,
         embedding_provider: EmbeddingProvider,
+        *,
+        shared_index: SharedVectorIndex | None = None,
     ) -> None:
         self.db = db
         self.llm_interface = llm_interface
-        self.similarity_checker = SimilarityChecker(db, embedding_provider)
+        self.similarity_checker = SimilarityChecker(db, embedding_provider, shared_index=shared_index)
         self.config = load_config()
+        self.preprocessor = JobDescriptionPreprocessor(self.config.token_budgets)
 
     def analyze(
         self,
@@ -30,18 +61,157 @@ class JobRoleAnalyzer:
         job_title: str,
         job_description: str,
         years_of_experience: int,
+        timings: StageTimings | None = None,
     ) -> JobRoleWithCompetencies:
-        similar = self.similarity_checker.find_similar_role(job_description)
-        if similar:
-            existing = self.db.get_job_role_with_competencies(similar[0].job_role_id)
+        """Resolve, generate and persist a role; ``timings`` collects per-stage durations."""
+        resolution = self.resolve(
+            job_title=job_title,
+            job_description=job_description,
+            years_of_experience=years_of_experience,
+            timings=timings,
+        )
+        return self.analyze_resolved(
+            job_title=job_title,
+            years_of_experience=years_of_experience,
+            resolution=resolution,
+            timings=timings,
+        )
+
+    def analyze_resolved(
+        self,
+        *,
+        job_title: str,
+        years_of_experience: int,
+        resolution: RoleResolution,
+        timings: StageTimings | None = None,
+    ) -> JobRoleWithCompetencies:
+        """Finish :meth:`analyze` for a request that has already been resolved."""
+        if resolution.existing_role_id is not None:
+            with record_stages(timings):
+                existing = self.db.get_job_role_with_competencies(resolution.existing_role_id)
             if existing:
                 return existing
 
+        generated = self.generate(
+            job_title=job_title,
+            years_of_experience=years_of_experience,
+            resolution=resolution,
+            timings=timings,
+        )
+        return self.persist(generated, timings=timings)
+
+    def persist(
+        self,
+        generated: StoredJobRole,
+        timings: StageTimings | None = None,
+    ) -> JobRoleWithCompetencies:
+        """Store a generated role and make it visible to similarity lookups."""
+        with record_stages(timings):
+            self.db.add_job_role(
+                generated.job_role,
+                generated.competencies,
+                generated.embedding,
+                content_hash=generated.content_hash,
+            )
+            self.similarity_checker.add_to_index(generated.job_role, generated.embedding or [])
+
+        return JobRoleWithCompetencies(job_role=generated.job_role, competencies=generated.competencies)
+
+    def find_existing_role_id(
+        self,
+        *,
+        job_title: str,
+        job_description: str,
+        years_of_experience: int,
+    ) -> UUID | None:
+        return self.resolve(
+            job_title=job_title,
+            job_description=job_description,
+            years_of_experience=years_of_experience,
+        ).existing_role_id
+
+    def resolve(
+        self,
+        *,
+        job_title: str,
+        job_description: str,
+        years_of_experience: int,
+        timings: StageTimings | None = None,
+    ) -> RoleResolution:
+        """Match a request by exact content hash first, then by embedding similarity."""
+        with record_stages(timings):
+            return self._resolve(job_title, job_description, years_of_experience)
+
+    def _resolve(self, job_title: str, job_description: str, years_of_experience: int) -> RoleResolution:
+        resolution = self._prepare(job_title, job_description, years_of_experience)
+        self._match_content_hash(resolution)
+        if resolution.existing_role_id is None:
+            self._match_similar(resolution)
+        return resolution
+
+    # The three steps of :meth:`resolve`, exposed separately so async callers can run the
+    # SQLite lookup on the database's reader pool and the embedding on a general pool.
+
+    def prepare(
+        self,
+        *,
+        job_title: str,
+        job_description: str,
+        years_of_experience: int,
+        timings: StageTimings | None = None,
+    ) -> RoleResolution:
+        """Preprocess the description and compute the content hash; no I/O."""
+        with record_stages(timings):
+            return self._prepare(job_title, job_description, years_of_experience)
+
+    def match_content_hash(self, resolution: RoleResolution, timings: StageTimings | None = None) -> RoleResolution:
+        """Fill ``existing_role_id`` from an exact content-hash match in SQLite."""
+        with record_stages(timings):
+            return self._match_content_hash(resolution)
+
+    def match_similar(self, resolution: RoleResolution, timings: StageTimings | None = None) -> RoleResolution:
+        """Embed the description and fill ``existing_role_id`` from the similarity index."""
+        with record_stages(timings):
+            return self._match_similar(resolution)
+
+    def _prepare(self, job_title: str, job_description: str, years_of_experience: int) -> RoleResolution:
+        with time_stage("preprocess"):
+            prepared = self.preprocess(job_description)
+        content_hash = compute_content_hash(job_title, job_description, years_of_experience)
+        return RoleResolution(prepared=prepared, content_hash=content_hash, embedding=[])
+
+    def _match_content_hash(self, resolution: RoleResolution) -> RoleResolution:
+        resolution.existing_role_id = self.db.find_job_role_id_by_content_hash(resolution.content_hash)
+        return resolution
+
+    def _match_similar(self, resolution: RoleResolution) -> RoleResolution:
+        resolution.embedding = self.similarity_checker.compute_embedding(
+            resolution.prepared.for_consumer(EMBEDDING_CONSUMER)
+        )
+        similar = self.similarity_checker.find_similar_role_id_for_embedding(resolution.embedding)
+        if similar:
+            resolution.existing_role_id = similar[0]
+        return resolution
+
+    def generate(
+        self,
+        *,
+        job_title: str,
+        years_of_experience: int,
+        resolution: RoleResolution,
+        timings: StageTimings | None = None,
+    ) -> StoredJobRole:
+        """Run the LLM prompts for an unmatched request without persisting the result."""
+        with record_stages(timings):
+            return self._generate(job_title, years_of_experience, resolution)
+
+    def _generate(self, job_title: str, years_of_experience: int, resolution: RoleResolution) -> StoredJobRole:
+        prepared = resolution.prepared
         summary_text = self.llm_interface.run_prompt(
             "normalize_jd",
             {
                 "job_title": job_title,
-                "job_description": job_description,
+                "job_description": prepared.for_consumer("normalize_jd"),
                 "years_of_experience": years_of_experience,
             },
         ).strip()
@@ -58,18 +228,27 @@ class JobRoleAnalyzer:
                 "job_title": job_title,
                 "normalized_summary": summary_text,
                 "years_of_experience": years_of_experience,
-                "job_description": job_description,
+                "job_description": prepared.for_consumer("extract_competencies"),
             },
             as_json=True,
         )
 
         competencies = self._parse_competencies(competencies_payload)
 
-        embedding = self.similarity_checker.compute_embedding(job_description)
-        self.db.add_job_role(job_role, competencies, embedding)
-        self.similarity_checker.add_to_index(job_role, embedding)
+        embedding = resolution.embedding or self.similarity_checker.compute_embedding(
+            prepared.for_consumer(EMBEDDING_CONSUMER)
+        )
+        return StoredJobRole(
+            job_role=job_role,
+            competencies=competencies,
+            embedding=embedding,
+            content_hash=resolution.content_hash,
+        )
 
-        return JobRoleWithCompetencies(job_role=job_role, competencies=competencies)
+    def preprocess(self, job_description: str) -> PreprocessedDescription:
+        if not self.config.preprocessing_enabled:
+            return PreprocessedDescription.passthrough(job_description)
+        return self.preprocessor.process(job_description)
 
     def _parse_competencies(self, payload: Any) -> List[Competency]:
         if isinstance(payload, str):
@@ -0,0 +1,164 @@
+"""Asyncio facade over :class:`~job_role_analyzer.db.Database`.
+
+Blocking ``sqlite3`` calls are dispatched to dedicated executors: one thread owns every
+write, so writers are serialized in submission order, and a bounded pool of threads
+serves reads through their per-thread query-only connections.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from .data_models import Competency, JobRoleSummary, JobRoleWithCompetencies
+from .db import Database, StoredJobRole
+
+
+T = TypeVar("T")
+
+DEFAULT_READER_THREADS = 4
+
+
+class AsyncTransaction:
+    """Handle for an open write transaction; every call runs on the writer thread."""
+
+    def __init__(self, database: "AsyncDatabase", connection: sqlite3.Connection) -> None:
+        self._database = database
+        self._connection = connection
+        self._touched: List[UUID] = []
+
+    async def execute(self, sql: str, parameters: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        return await self._database._on_writer(lambda: self._connection.execute(sql, parameters).fetchall())
+
+    async def executemany(self, sql: str, parameters: Iterable[Sequence[Any]]) -> None:
+        rows = list(parameters)
+        await self._database._on_writer(lambda: self._connection.executemany(sql, rows))
+
+    async def add_job_role(
+        self,
+        job_role: JobRoleSummary,
+        competencies: Sequence[Competency],
+        embedding: Sequence[float] | None = None,
+        *,
+        content_hash: str | None = None,
+    ) -> None:
+        await self._database._on_writer(
+            self._database.db._insert_job_role,  # noqa: SLF001 - joins the open transaction
+            self._connection,
+            job_role,
+            competencies,
+            embedding,
+            content_hash,
+        )
+        self._touched.append(job_role.job_role_id)
+
+
+class _TransactionContext:
+    def __init__(self, database: "AsyncDatabase") -> None:
+        self._database = database
+        self._context: AbstractContextManager[sqlite3.Connection] | None = None
+        self._transaction: AsyncTransaction | None = None
+
+    async def __aenter__(self) -> AsyncTransaction:
+        await self._database._writer_lock.acquire()
+        try:
+            self._context = self._database.db._write_transaction()  # noqa: SLF001
+            connection = await self._database._on_writer(self._context.__enter__)
+        except BaseException:
+            self._database._writer_lock.release()
+            raise
+        self._transaction = AsyncTransaction(self._database, connection)
+        return self._transaction
+
+    async def __aexit__(self, exc_type, exc, traceback) -> bool:
+        assert self._context is not None and self._transaction is not None
+        try:
+            suppressed = await self._database._on_writer(self._context.__exit__, exc_type, exc, traceback)
+        finally:
+            self._database._writer_lock.release()
+        if exc_type is None:
+            self._database.db._invalidate_roles(self._transaction._touched)  # noqa: SLF001
+        return bool(suppressed)
+
+
+class AsyncDatabase:
+    """Awaitable wrapper that keeps storage work off the event loop."""
+
+    def __init__(self, db: Database, *, reader_threads: int = DEFAULT_READER_THREADS) -> None:
+        if reader_threads < 1:
+            raise ValueError("reader_threads must be at least 1")
+        self.db = db
+        self._reader_executor = ThreadPoolExecutor(max_workers=reader_threads, thread_name_prefix="db-reader")
+        self._writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
+        # Keeps other coroutines' writes out of an open transaction, since they would
+        # otherwise re-enter the writer thread's reentrant lock and join it.
+        self._writer_lock = asyncio.Lock()
+
+    async def run_read(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking read-only callable on the reader pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._reader_executor, functools.partial(fn, *args, **kwargs))
+
+    async def run_write(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable that writes on the single writer thread."""
+        async with self._writer_lock:
+            return await self._on_writer(fn, *args, **kwargs)
+
+    def transaction(self) -> _TransactionContext:
+        """``async with db.transaction() as tx`` commits on exit and rolls back on error."""
+        return _TransactionContext(self)
+
+    async def _on_writer(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer_executor, functools.partial(fn, *args, **kwargs))
+
+    async def get_job_role(self, job_role_id: UUID) -> JobRoleSummary | None:
+        return await self.run_read(self.db.get_job_role, job_role_id)
+
+    async def get_job_role_with_competencies(self, job_role_id: UUID) -> JobRoleWithCompetencies | None:
+        return await self.run_read(self.db.get_job_role_with_competencies, job_role_id)
+
+    async def get_many(self, job_role_ids: Iterable[UUID]) -> Dict[UUID, JobRoleWithCompetencies]:
+        return await self.run_read(self.db.get_many, list(job_role_ids))
+
+    async def find_job_role_id_by_content_hash(self, content_hash: str) -> UUID | None:
+        return await self.run_read(self.db.find_job_role_id_by_content_hash, content_hash)
+
+    async def top_competencies(
+        self,
+        job_title: str,
+        years_experience: int | None = None,
+        *,
+        limit: int = 10,
+    ) -> List[Dict[str, object]]:
+        return await self.run_read(self.db.top_competencies, job_title, years_experience, limit=limit)
+
+    async def competency_level_distribution(self, name: str) -> Dict[int, int] | None:
+        return await self.run_read(self.db.competency_level_distribution, name)
+
+    async def add_job_role(
+        self,
+        job_role: JobRoleSummary,
+        competencies: Sequence[Competency],
+        embedding: Sequence[float] | None = None,
+        *,
+        content_hash: str | None = None,
+    ) -> None:
+        await self.run_write(self.db.add_job_role, job_role, competencies, embedding, content_hash=content_hash)
+
+    async def add_job_roles(
+        self,
+        entries: Iterable[StoredJobRole],
+        *,
+        checkpoint: Tuple[str, int] | None = None,
+    ) -> None:
+        await self.run_write(self.db.add_job_roles, list(entries), checkpoint=checkpoint)
+
+    def close(self) -> None:
+        """Stop the executors; the wrapped :class:`Database` is left open."""
+        self._writer_executor.shutdown(wait=True)
+        self._reader_executor.shutdown(wait=True)
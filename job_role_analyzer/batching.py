@@ -0,0 +1,147 @@
+"""Dynamic micro-batching in front of an embedding provider."""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import List, Sequence
+
+from .metrics import Histogram
+from .similarity import DEFAULT_EMBEDDING_BATCH_SIZE, EmbeddingMatrix, EmbeddingProvider, embed_batch
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+QUEUE_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+
+@dataclass
+class _PendingEmbedding:
+    text: str
+    enqueued_at: float = field(default_factory=time.perf_counter)
+    future: "Future[List[float]]" = field(default_factory=Future)
+
+
+class MicroBatchingEmbeddingProvider(EmbeddingProvider):
+    """Coalesces concurrent ``embed`` calls into batched forward passes.
+
+    Calls arriving within ``max_wait_ms`` of the first queued request, up to
+    ``max_batch_size`` items, are encoded together on a dedicated worker thread and
+    each caller's future is resolved with its own row.
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        *,
+        max_batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be a positive integer.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be non-negative.")
+        self._provider = provider
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[_PendingEmbedding | None]" = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_seconds = Histogram(QUEUE_WAIT_BUCKETS)
+        self._worker = threading.Thread(
+            target=self._run,
+            name="embedding-dispatcher",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def submit(self, text: str) -> "Future[List[float]]":
+        pending = _PendingEmbedding(text)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Embedding dispatcher has been closed.")
+            self._queue.put(pending)
+        return pending.future
+
+    def embed(self, text: str) -> Sequence[float]:
+        if not text:
+            return []
+        return self.submit(text).result()
+
+    def embed_batch(
+        self,
+        texts: Sequence[str],
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    ) -> EmbeddingMatrix:
+        # Callers that already hold a batch skip the dispatch window entirely.
+        return embed_batch(self._provider, texts, batch_size=batch_size)
+
+    def stats(self) -> dict[str, dict[str, object]]:
+        return {
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_wait_seconds": self.queue_wait_seconds.snapshot(),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+        close = getattr(self._provider, "close", None)
+        if callable(close):
+            close()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            stop = False
+            deadline = time.perf_counter() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: List[_PendingEmbedding]) -> None:
+        started = time.perf_counter()
+        for pending in batch:
+            self.queue_wait_seconds.observe(started - pending.enqueued_at)
+        self.batch_sizes.observe(len(batch))
+        try:
+            matrix = embed_batch(
+                self._provider,
+                [pending.text for pending in batch],
+                batch_size=len(batch),
+            )
+        except Exception as exc:  # noqa: BLE001 - propagate to every waiting caller
+            logger.exception("Batched embedding of %s texts failed", len(batch))
+            for pending in batch:
+                pending.future.set_exception(exc)
+            return
+        if len(matrix) != len(batch):
+            message = f"Embedding provider returned {len(matrix)} vectors for {len(batch)} texts."
+            logger.error(message)
+            exc = ValueError(message)
+            for pending in batch:
+                pending.future.set_exception(exc)
+            return
+        for pending, row in zip(batch, matrix):
+            pending.future.set_result([float(value) for value in row])
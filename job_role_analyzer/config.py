@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 try:
     import yaml
@@ -78,11 +78,48 @@ class LLMEndpointConfig:
 class AnalyzerConfig:
     job_role_similarity_threshold: float = 0.85
     embedding_model: str = "BAAI/bge-small-en"
+    embedding_batch_size: int = 32
+    embedding_batching_enabled: bool = False
+    embedding_batch_window_ms: float = 5.0
+    embedding_batch_max_items: int = 32
+    embedding_workers: int = 0
+    embedding_worker_threads: int = 1
+    embedding_worker_cpu_affinity: List[List[int]] = field(default_factory=list)
     similarity_backend: str = "faiss"
+    index_build_chunk_size: int = 4096
+    similarity_sidecar_socket: str = "/tmp/jra-index.sock"
+    similarity_sidecar_timeout_seconds: float = 2.0
+    similarity_sidecar_max_k: int = 100
     max_competencies: int = 5
     min_competencies: int = 3
     database_path: str = "job_roles.db"
+    database_busy_timeout_ms: int = 5000
+    database_synchronous: str = "NORMAL"
+    database_cache_size_kib: int = 16384
+    database_mmap_size: int = 268435456
+    database_reader_threads: int = 4
+    role_cache_size: int = 1024
+    role_cache_ttl_seconds: float = 0.0
+    response_cache_size: int = 1024
+    response_cache_persist: bool = False
+    job_workers: int = 2
+    job_lease_seconds: float = 30.0
+    job_max_attempts: int = 3
+    job_poll_interval_seconds: float = 1.0
+    admission_control_enabled: bool = True
+    admission_route_limits: Dict[str, int] = field(
+        default_factory=lambda: {"POST /api/analyze": 8, "POST /api/jobs": 64}
+    )
+    admission_queue_size: int = 64
+    admission_queue_timeout_seconds: float = 10.0
+    admission_max_body_bytes: int = 1048576
+    admin_token: str | None = None
+    profiler_max_seconds: float = 60.0
     prompts_path: str = "job_role_analyzer/prompts"
+    preprocessing_enabled: bool = True
+    token_budgets: Dict[str, int] = field(
+        default_factory=lambda: {"embedding": 512, "normalize_jd": 2048, "extract_competencies": 2048}
+    )
     llmstudio_base_url: str | None = None
     llmstudio_completion_path: str = "/api/v1/completions"
     llmstudio_api_key: str | None = None
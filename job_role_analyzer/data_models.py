@@ -5,9 +5,22 @@ from uuid import UUID, uuid4
 
 try:  # pragma: no cover - prefer real pydantic when available
     from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+    USING_PYDANTIC_SHIM = False
 except ModuleNotFoundError:  # pragma: no cover - fallback for minimal environments
     from pydantic_shim import BaseModel, ConfigDict, Field, field_validator
 
+    USING_PYDANTIC_SHIM = True
+
+
+DEFAULT_COMPETENCY_TYPE = "technical"
+
+# ``slots`` is a shim-only option; real pydantic's ConfigDict has no such key.
+if USING_PYDANTIC_SHIM:
+    _MODEL_CONFIG = ConfigDict(from_attributes=True, slots=True)
+else:
+    _MODEL_CONFIG = ConfigDict(from_attributes=True)
+
 
 class JobRoleSummary(BaseModel):
     job_role_id: UUID = Field(default_factory=uuid4)
@@ -15,7 +28,7 @@ class JobRoleSummary(BaseModel):
     normalized_summary: str
     years_experience: int
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _MODEL_CONFIG
 
     @field_validator("years_experience")
     def _validate_years_experience(cls, value: int) -> int:
@@ -27,9 +40,9 @@ class JobRoleSummary(BaseModel):
 class Competency(BaseModel):
     name: str
     level: int
-    type: Optional[str] = Field(default="technical")
+    type: Optional[str] = Field(default=DEFAULT_COMPETENCY_TYPE)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _MODEL_CONFIG
 
     @field_validator("level", mode="before")
     def _coerce_level(cls, value: int) -> int:
@@ -43,11 +56,11 @@ class Competency(BaseModel):
 
     @field_validator("type", mode="before")
     def _default_type(cls, value: Optional[str]) -> str:
-        return value or "technical"
+        return value or DEFAULT_COMPETENCY_TYPE
 
 
 class JobRoleWithCompetencies(BaseModel):
     job_role: JobRoleSummary
     competencies: List[Competency]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _MODEL_CONFIG
@@ -2,13 +2,46 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import sys
+import threading
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
 from uuid import UUID
 
+try:  # pragma: no cover - numpy is optional
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - fallback path when numpy is missing
+    np = None  # type: ignore[assignment]
+
+from . import analytics, jobs
+from .cache import LRUCache
 from .config import load_config
-from .data_models import Competency, JobRoleSummary, JobRoleWithCompetencies
+from .data_models import (
+    DEFAULT_COMPETENCY_TYPE,
+    USING_PYDANTIC_SHIM,
+    Competency,
+    JobRoleSummary,
+    JobRoleWithCompetencies,
+)
+from .metrics import time_stage
+
 
+COMPETENCIES_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS competencies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_role_id TEXT NOT NULL,
+        name_id INTEGER NOT NULL,
+        display_name TEXT,
+        level INTEGER NOT NULL,
+        type TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (job_role_id) REFERENCES job_roles(job_role_id),
+        FOREIGN KEY (name_id) REFERENCES competency_names(id)
+    )
+    """
 
 SCHEMA_STATEMENTS = (
     """
@@ -17,112 +50,759 @@ SCHEMA_STATEMENTS = (
         job_title TEXT NOT NULL,
         normalized_summary TEXT NOT NULL,
         years_experience INTEGER NOT NULL,
-        embedding_vector TEXT
+        embedding_vector TEXT,
+        embedding_blob BLOB,
+        embedding_dtype TEXT,
+        embedding_dim INTEGER,
+        content_hash TEXT,
+        version INTEGER NOT NULL DEFAULT 1,
+        response_cache BLOB,
+        response_cache_version INTEGER
     )
     """,
     """
-    CREATE TABLE IF NOT EXISTS competencies (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        job_role_id TEXT NOT NULL,
-        name TEXT NOT NULL,
-        level INTEGER NOT NULL,
-        type TEXT,
-        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        FOREIGN KEY (job_role_id) REFERENCES job_roles(job_role_id)
+    CREATE TABLE IF NOT EXISTS competency_names (
+        id INTEGER PRIMARY KEY,
+        canonical_name TEXT NOT NULL UNIQUE,
+        display_name TEXT NOT NULL
+    )
+    """,
+    COMPETENCIES_SCHEMA,
+    """
+    CREATE TABLE IF NOT EXISTS ingest_checkpoints (
+        source TEXT PRIMARY KEY,
+        position INTEGER NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
     """,
 )
 
+# Created after column migrations so they may reference migrated columns.
+INDEX_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS idx_competencies_job_role_id ON competencies (job_role_id, id)",
+    "CREATE INDEX IF NOT EXISTS idx_competencies_name_id ON competencies (name_id)",
+    "CREATE INDEX IF NOT EXISTS idx_job_roles_content_hash ON job_roles (content_hash)",
+)
+
+ROLE_HYDRATION_QUERY = """
+    SELECT r.job_role_id, r.job_title, r.normalized_summary, r.years_experience,
+           c.id AS competency_id, COALESCE(c.display_name, n.display_name) AS name, c.level, c.type
+    FROM job_roles AS r
+    LEFT JOIN competencies AS c ON c.job_role_id = r.job_role_id
+    LEFT JOIN competency_names AS n ON n.id = c.name_id
+"""
+
+MAX_QUERY_PARAMETERS = 500
+STREAM_CHUNK_SIZE = 1024
+
+# Columns added after the initial schema, applied to existing databases in place.
+JOB_ROLE_COLUMN_MIGRATIONS = (
+    ("embedding_blob", "BLOB"),
+    ("embedding_dtype", "TEXT"),
+    ("embedding_dim", "INTEGER"),
+    ("content_hash", "TEXT"),
+    ("version", "INTEGER NOT NULL DEFAULT 1"),
+    ("response_cache", "BLOB"),
+    ("response_cache_version", "INTEGER"),
+)
+# ``display_name`` keeps a role's own spelling when it differs from the interned one.
+COMPETENCY_COLUMN_MIGRATIONS = (("display_name", "TEXT"),)
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+EMBEDDING_DTYPE = "float32"
+EMBEDDING_MIGRATION_BATCH_SIZE = 500
+
+
+@dataclass
+class StoredJobRole:
+    """A fully analyzed role ready to be written by :meth:`Database.add_job_roles`."""
+
+    job_role: JobRoleSummary
+    competencies: List[Competency]
+    embedding: Sequence[float] | None = None
+    content_hash: str | None = None
+
+
+def pack_embedding(embedding: Sequence[float]) -> Tuple[bytes, str, int]:
+    """Pack a vector as little-endian float32 bytes with its dtype and dimension."""
+    if np is not None:
+        vector = np.asarray(embedding, dtype="<f4")
+        return vector.tobytes(), EMBEDDING_DTYPE, int(vector.shape[0])
+    packed = array("f", (float(value) for value in embedding))
+    if sys.byteorder == "big":  # pragma: no cover - platform specific
+        packed.byteswap()
+    return packed.tobytes(), EMBEDDING_DTYPE, len(packed)
+
+
+def unpack_embedding(blob: bytes, dtype: str | None, dimension: int | None) -> Any:
+    """Decode a packed vector; with numpy this is a zero-copy read-only view."""
+    if (dtype or EMBEDDING_DTYPE) != EMBEDDING_DTYPE:
+        raise ValueError(f"Unsupported embedding dtype '{dtype}'.")
+    if np is not None:
+        vector = np.frombuffer(blob, dtype="<f4")
+    else:
+        vector = array("f")
+        vector.frombytes(blob)
+        if sys.byteorder == "big":  # pragma: no cover - platform specific
+            vector.byteswap()
+    if dimension is not None and len(vector) != dimension:
+        raise ValueError("Stored embedding does not match its recorded dimension.")
+    return vector
+
+
+def _row_embedding(row: sqlite3.Row) -> Any:
+    if row["embedding_blob"] is not None:
+        return unpack_embedding(row["embedding_blob"], row["embedding_dtype"], row["embedding_dim"])
+    if row["embedding_vector"]:
+        # Legacy JSON rows that the online migration has not reached yet.
+        return json.loads(row["embedding_vector"])
+    return []
+
+
+def canonical_competency_name(name: str) -> str:
+    """Case- and whitespace-insensitive key under which competency names are interned."""
+    return " ".join(name.split()).casefold()
+
+
+def _trusted_constructor(model: Any) -> Callable[..., Any]:
+    """Constructor for rows that were already validated when they were written.
+
+    The shim's generated ``model_construct`` skips validators and coercion entirely. Real
+    pydantic validates in pydantic-core faster than its pure-Python ``model_construct``,
+    so there the regular constructor is the cheaper path.
+    """
+    return model.model_construct if USING_PYDANTIC_SHIM else model
+
+
+_construct_summary = _trusted_constructor(JobRoleSummary)
+_construct_competency = _trusted_constructor(Competency)
+_construct_role = _trusted_constructor(JobRoleWithCompetencies)
+
+
+def _row_to_summary(row: sqlite3.Row) -> JobRoleSummary:
+    return _construct_summary(
+        job_role_id=UUID(row["job_role_id"]),
+        job_title=row["job_title"],
+        normalized_summary=row["normalized_summary"],
+        years_experience=row["years_experience"],
+    )
+
+
+def _rows_to_matrix(rows: Sequence[sqlite3.Row]) -> Any:
+    """Stack the vectors of ``rows`` into one float32 block, decoding BLOBs in a single pass."""
+    dimensions = {row["embedding_dim"] for row in rows}
+    all_packed = all(row["embedding_blob"] is not None for row in rows)
+    if np is not None and all_packed and len(dimensions) == 1:
+        if any((row["embedding_dtype"] or EMBEDDING_DTYPE) != EMBEDDING_DTYPE for row in rows):
+            raise ValueError("Unsupported embedding dtype in stored vectors.")
+        buffer = b"".join(row["embedding_blob"] for row in rows)
+        return np.frombuffer(buffer, dtype="<f4").reshape(len(rows), dimensions.pop())
+    vectors = [_row_embedding(row) for row in rows]
+    if len({len(vector) for vector in vectors}) > 1:
+        raise ValueError("Stored embeddings have inconsistent dimensionality.")
+    if np is not None:
+        return np.asarray(vectors, dtype="float32")
+    return [list(vector) for vector in vectors]
+
+
+def _hydrate_roles(rows: Iterable[sqlite3.Row]) -> Dict[UUID, JobRoleWithCompetencies]:
+    """Group joined role/competency rows (ordered by role) into hydrated models."""
+    roles: Dict[UUID, JobRoleWithCompetencies] = {}
+    current: JobRoleWithCompetencies | None = None
+    current_key: str | None = None
+    for row in rows:
+        # Compare the stored text key so each role's UUID is parsed once, not once per competency.
+        if current is None or row["job_role_id"] != current_key:
+            current_key = row["job_role_id"]
+            job_role_id = UUID(current_key)
+            current = _construct_role(
+                job_role=_construct_summary(
+                    job_role_id=job_role_id,
+                    job_title=row["job_title"],
+                    normalized_summary=row["normalized_summary"],
+                    years_experience=row["years_experience"],
+                ),
+                competencies=[],
+            )
+            roles[job_role_id] = current
+        if row["competency_id"] is not None:
+            competency_type = row["type"]
+            current.competencies.append(
+                _construct_competency(
+                    name=sys.intern(row["name"]),
+                    level=row["level"],
+                    # Mirrors Competency._default_type for legacy rows stored without a type.
+                    type=sys.intern(competency_type) if competency_type else DEFAULT_COMPETENCY_TYPE,
+                )
+            )
+    return roles
+
 
 class Database:
+    """SQLite store with one serialized writer connection and per-thread readers.
+
+    The database runs in WAL mode so readers never block on the writer; each thread
+    lazily opens its own query-only connection.
+    """
+
     def __init__(self, path: str | None = None) -> None:
         config = load_config()
-        db_path = Path(path or config.database_path)
-        self._connection = sqlite3.connect(db_path, check_same_thread=False)
-        self._connection.row_factory = sqlite3.Row
+        self._path = str(path or config.database_path)
+        self._busy_timeout_ms = config.database_busy_timeout_ms
+        synchronous = str(config.database_synchronous).upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"database_synchronous must be one of {', '.join(SYNCHRONOUS_MODES)}.")
+        self._pragmas = (
+            f"PRAGMA synchronous = {synchronous}",
+            f"PRAGMA cache_size = -{int(config.database_cache_size_kib)}",
+            f"PRAGMA mmap_size = {int(config.database_mmap_size)}",
+        )
+        self._in_memory = self._path == ":memory:"
+        if not self._in_memory:
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        self._invalidation_listeners: List[Callable[[UUID], None]] = []
+        self._competency_names: Dict[str, Tuple[int, str]] = {}
+        self._role_cache: LRUCache[UUID, JobRoleWithCompetencies] | None = (
+            LRUCache(config.role_cache_size, ttl_seconds=config.role_cache_ttl_seconds)
+            if config.role_cache_size > 0
+            else None
+        )
+        self._open_connections()
+        if not self._in_memory:
+            self._connection.execute("PRAGMA journal_mode = WAL")
         self._ensure_schema()
 
+    def _open_connections(self) -> None:
+        self._write_lock = threading.RLock()
+        self._readers_lock = threading.Lock()
+        self._readers: List[sqlite3.Connection] = []
+        self._local = threading.local()
+        self._connection = self._connect()
+
+    def reopen(self) -> None:
+        """Open fresh connections after :meth:`close`, e.g. in a worker forked from a preloading parent.
+
+        SQLite connections must not cross ``fork()``, so the parent closes its
+        connections before forking and each child reopens; caches are kept.
+        """
+        if self._in_memory:
+            raise ValueError("An in-memory database cannot be reopened.")
+        self._open_connections()
+
+    def _connect(self, *, read_only: bool = False) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+            timeout=self._busy_timeout_ms / 1000.0,
+        )
+        connection.row_factory = sqlite3.Row
+        connection.execute(f"PRAGMA busy_timeout = {int(self._busy_timeout_ms)}")
+        for pragma in self._pragmas:
+            connection.execute(pragma)
+        if read_only:
+            connection.execute("PRAGMA query_only = 1")
+        return connection
+
+    def _reader(self) -> sqlite3.Connection:
+        """Return the calling thread's read connection, opening it on first use."""
+        if self._in_memory:
+            return self._connection
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect(read_only=True)
+            self._local.connection = connection
+            with self._readers_lock:
+                self._readers.append(connection)
+        return connection
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            try:
+                with self._connection:
+                    # The RLock only serializes this process. Taking SQLite's write lock
+                    # before the first statement keeps reads that feed later writes inside
+                    # the same transaction for every process sharing the file.
+                    if not self._connection.in_transaction:
+                        self._connection.execute("BEGIN IMMEDIATE")
+                    yield self._connection
+            except BaseException:
+                # Name IDs assigned inside a rolled-back transaction no longer exist.
+                self._competency_names.clear()
+                raise
+
     def _ensure_schema(self) -> None:
-        with self._connection:
+        with self._write_transaction():
+            existing_tables = {
+                row["name"]
+                for row in self._connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            }
             for statement in SCHEMA_STATEMENTS:
                 self._connection.execute(statement)
+            existing = {
+                row["name"] for row in self._connection.execute("PRAGMA table_info(job_roles)")
+            }
+            for column, column_type in JOB_ROLE_COLUMN_MIGRATIONS:
+                if column not in existing:
+                    self._connection.execute(f"ALTER TABLE job_roles ADD COLUMN {column} {column_type}")
+            self._migrate_competency_names()
+            existing = {
+                row["name"] for row in self._connection.execute("PRAGMA table_info(competencies)")
+            }
+            for column, column_type in COMPETENCY_COLUMN_MIGRATIONS:
+                if column not in existing:
+                    self._connection.execute(f"ALTER TABLE competencies ADD COLUMN {column} {column_type}")
+            for statement in INDEX_STATEMENTS:
+                self._connection.execute(statement)
+            for statement in analytics.ANALYTICS_SCHEMA_STATEMENTS + jobs.JOB_SCHEMA_STATEMENTS:
+                self._connection.execute(statement)
+            if "job_roles" in existing_tables and not existing_tables.issuperset(analytics.ANALYTICS_TABLES):
+                analytics.recompute(self._connection)
+        self.migrate_json_embeddings()
+
+    def _migrate_competency_names(self) -> None:
+        """Move legacy free-text competency names into the ``competency_names`` table."""
+        columns = {row["name"] for row in self._connection.execute("PRAGMA table_info(competencies)")}
+        if "name_id" in columns:
+            return
+        legacy_rows = self._connection.execute(
+            "SELECT id, job_role_id, name, level, type, created_at FROM competencies ORDER BY id"
+        ).fetchall()
+        self._connection.execute("ALTER TABLE competencies RENAME TO competencies_legacy")
+        self._connection.execute("DROP INDEX IF EXISTS idx_competencies_job_role_id")
+        self._connection.execute(COMPETENCIES_SCHEMA)
+        self._connection.executemany(
+            """
+            INSERT INTO competencies (id, job_role_id, name_id, display_name, level, type, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    row["id"],
+                    row["job_role_id"],
+                    *self._competency_name_id(self._connection, row["name"]),
+                    row["level"],
+                    row["type"],
+                    row["created_at"],
+                )
+                for row in legacy_rows
+            ],
+        )
+        self._connection.execute("DROP TABLE competencies_legacy")
+
+    def _competency_name_id(self, connection: sqlite3.Connection, name: str) -> Tuple[int, str | None]:
+        """Intern ``name``; must run inside a write transaction.
+
+        Returns the name ID and, when ``name`` is spelled differently from the interned
+        display name, ``name`` itself so the row can keep it.
+        """
+        canonical = canonical_competency_name(name)
+        interned = self._competency_names.get(canonical)
+        if interned is None:
+            connection.execute(
+                "INSERT OR IGNORE INTO competency_names (canonical_name, display_name) VALUES (?, ?)",
+                (canonical, " ".join(name.split())),
+            )
+            row = connection.execute(
+                "SELECT id, display_name FROM competency_names WHERE canonical_name = ?",
+                (canonical,),
+            ).fetchone()
+            interned = (int(row["id"]), row["display_name"])
+            self._competency_names[canonical] = interned
+        name_id, display_name = interned
+        return name_id, (None if name == display_name else name)
+
+    def migrate_json_embeddings(self, batch_size: int = EMBEDDING_MIGRATION_BATCH_SIZE) -> int:
+        """Convert legacy JSON embeddings to packed BLOBs, one short transaction per batch.
+
+        Readers keep working during the migration because unconverted rows are still
+        decoded from JSON. Returns the number of rows converted.
+        """
+        converted = 0
+        while True:
+            with self._write_lock:
+                rows = self._connection.execute(
+                    """
+                    SELECT rowid, embedding_vector FROM job_roles
+                    WHERE embedding_blob IS NULL AND embedding_vector IS NOT NULL
+                    LIMIT ?
+                    """,
+                    (batch_size,),
+                ).fetchall()
+            if not rows:
+                return converted
+            updates = []
+            for row in rows:
+                values = json.loads(row["embedding_vector"]) if row["embedding_vector"] else []
+                if values:
+                    blob, dtype, dimension = pack_embedding(values)
+                    updates.append((blob, dtype, dimension, row["rowid"]))
+                else:
+                    updates.append((None, None, None, row["rowid"]))
+            with self._write_transaction():
+                self._connection.executemany(
+                    """
+                    UPDATE job_roles
+                    SET embedding_blob = ?, embedding_dtype = ?, embedding_dim = ?, embedding_vector = NULL
+                    WHERE rowid = ?
+                    """,
+                    updates,
+                )
+            converted += len(updates)
 
     def close(self) -> None:
-        self._connection.close()
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for connection in readers:
+            connection.close()
+        with self._write_lock:
+            self._connection.close()
 
     def add_job_role(
         self,
         job_role: JobRoleSummary,
         competencies: Sequence[Competency],
         embedding: Sequence[float] | None = None,
+        *,
+        content_hash: str | None = None,
+    ) -> None:
+        with time_stage("sqlite_write"), self._write_transaction() as connection:
+            self._insert_job_role(connection, job_role, competencies, embedding, content_hash)
+        self._invalidate_roles([job_role.job_role_id])
+
+    def add_job_roles(
+        self,
+        entries: Iterable[StoredJobRole],
+        *,
+        checkpoint: Tuple[str, int] | None = None,
+    ) -> None:
+        """Persist several roles, and optionally an ingestion checkpoint, in one transaction."""
+        entries = list(entries)
+        with time_stage("sqlite_write"), self._write_transaction() as connection:
+            for entry in entries:
+                self._insert_job_role(
+                    connection,
+                    entry.job_role,
+                    entry.competencies,
+                    entry.embedding,
+                    entry.content_hash,
+                )
+            if checkpoint is not None:
+                source, position = checkpoint
+                connection.execute(
+                    """
+                    INSERT INTO ingest_checkpoints (source, position, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT (source) DO UPDATE
+                    SET position = excluded.position, updated_at = excluded.updated_at
+                    """,
+                    (source, position),
+                )
+        self._invalidate_roles(entry.job_role.job_role_id for entry in entries)
+
+    def role_cache_stats(self) -> Dict[str, float] | None:
+        return self._role_cache.stats() if self._role_cache is not None else None
+
+    def add_invalidation_listener(self, listener: Callable[[UUID], None]) -> None:
+        """Register ``listener`` to be called with each role ID rewritten by this instance."""
+        self._invalidation_listeners.append(listener)
+
+    def get_role_version(self, job_role_id: UUID) -> int | None:
+        row = self._reader().execute(
+            "SELECT version FROM job_roles WHERE job_role_id = ?",
+            (str(job_role_id),),
+        ).fetchone()
+        return int(row["version"]) if row is not None else None
+
+    def get_cached_response(self, job_role_id: UUID) -> Tuple[bytes, int] | None:
+        """Return the stored serialized response and its role version, if still current."""
+        row = self._reader().execute(
+            """
+            SELECT response_cache, version FROM job_roles
+            WHERE job_role_id = ? AND response_cache IS NOT NULL AND response_cache_version = version
+            """,
+            (str(job_role_id),),
+        ).fetchone()
+        return (bytes(row["response_cache"]), int(row["version"])) if row is not None else None
+
+    def store_cached_response(self, job_role_id: UUID, version: int, payload: bytes) -> None:
+        with self._write_transaction() as connection:
+            connection.execute(
+                """
+                UPDATE job_roles SET response_cache = ?, response_cache_version = ?
+                WHERE job_role_id = ? AND version = ?
+                """,
+                (payload, version, str(job_role_id), version),
+            )
+
+    def _invalidate_roles(self, job_role_ids: Iterable[UUID]) -> None:
+        for job_role_id in job_role_ids:
+            if self._role_cache is not None:
+                self._role_cache.invalidate(job_role_id)
+            for listener in self._invalidation_listeners:
+                listener(job_role_id)
+
+    def get_ingest_checkpoint(self, source: str) -> int:
+        """Return the number of input records of ``source`` already committed."""
+        row = self._reader().execute(
+            "SELECT position FROM ingest_checkpoints WHERE source = ?",
+            (source,),
+        ).fetchone()
+        return int(row["position"]) if row is not None else 0
+
+    def find_job_role_id_by_content_hash(self, content_hash: str) -> UUID | None:
+        with time_stage("sqlite_lookup"):
+            row = self._reader().execute(
+                "SELECT job_role_id FROM job_roles WHERE content_hash = ? LIMIT 1",
+                (content_hash,),
+            ).fetchone()
+        return UUID(row["job_role_id"]) if row is not None else None
+
+    def _insert_job_role(
+        self,
+        connection: sqlite3.Connection,
+        job_role: JobRoleSummary,
+        competencies: Sequence[Competency],
+        embedding: Sequence[float] | None,
+        content_hash: str | None,
     ) -> None:
+        packed = pack_embedding(embedding) if embedding is not None and len(embedding) else (None, None, None)
         payload = (
             str(job_role.job_role_id),
             job_role.job_title,
             job_role.normalized_summary,
             job_role.years_experience,
-            json.dumps(list(embedding)) if embedding is not None else None,
+            *packed,
+            content_hash,
         )
-        with self._connection:
-            self._connection.execute(
-                """
-                INSERT OR REPLACE INTO job_roles (
-                    job_role_id, job_title, normalized_summary, years_experience, embedding_vector
-                ) VALUES (?, ?, ?, ?, ?)
-                """,
-                payload,
-            )
-            self._connection.execute(
-                "DELETE FROM competencies WHERE job_role_id = ?",
+        previous = connection.execute(
+            "SELECT job_title, years_experience FROM job_roles WHERE job_role_id = ?",
+            (str(job_role.job_role_id),),
+        ).fetchone()
+        if previous is not None:
+            previous_competencies = connection.execute(
+                "SELECT name_id, level FROM competencies WHERE job_role_id = ?",
                 (str(job_role.job_role_id),),
+            ).fetchall()
+            analytics.apply_role_delta(
+                connection,
+                previous["job_title"],
+                previous["years_experience"],
+                [(row["name_id"], row["level"]) for row in previous_competencies],
+                sign=-1,
             )
-            competency_rows = [
-                (str(job_role.job_role_id), comp.name, comp.level, comp.type)
-                for comp in competencies
-            ]
-            self._connection.executemany(
-                """
-                INSERT INTO competencies (job_role_id, name, level, type)
-                VALUES (?, ?, ?, ?)
-                """,
-                competency_rows,
+        connection.execute(
+            """
+            INSERT OR REPLACE INTO job_roles (
+                job_role_id, job_title, normalized_summary, years_experience,
+                embedding_blob, embedding_dtype, embedding_dim, content_hash, version
+            ) VALUES (
+                ?, ?, ?, ?, ?, ?, ?, ?,
+                (SELECT COALESCE(MAX(version), 0) + 1 FROM job_roles WHERE job_role_id = ?)
             )
-
-    def iter_job_role_embeddings(self) -> Iterable[tuple[JobRoleSummary, List[float]]]:
-        cursor = self._connection.execute(
-            "SELECT job_role_id, job_title, normalized_summary, years_experience, embedding_vector FROM job_roles"
+            """,
+            (*payload, str(job_role.job_role_id)),
+        )
+        connection.execute(
+            "DELETE FROM competencies WHERE job_role_id = ?",
+            (str(job_role.job_role_id),),
+        )
+        competency_rows = [
+            (str(job_role.job_role_id), *self._competency_name_id(connection, comp.name), comp.level, comp.type)
+            for comp in competencies
+        ]
+        connection.executemany(
+            """
+            INSERT INTO competencies (job_role_id, name_id, display_name, level, type)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            competency_rows,
+        )
+        analytics.apply_role_delta(
+            connection,
+            job_role.job_title,
+            job_role.years_experience,
+            [(name_id, level) for _, name_id, _, level, _ in competency_rows],
+            sign=1,
         )
-        rows = cursor.fetchall()
-        for row in rows:
-            embedding = json.loads(row["embedding_vector"]) if row["embedding_vector"] else []
-            job_role = JobRoleSummary(
-                job_role_id=UUID(row["job_role_id"]),
-                job_title=row["job_title"],
-                normalized_summary=row["normalized_summary"],
-                years_experience=row["years_experience"],
-            )
-            yield job_role, embedding
 
-    def get_job_role_with_competencies(self, job_role_id: UUID) -> JobRoleWithCompetencies | None:
-        cursor = self._connection.execute(
-            "SELECT job_role_id, job_title, normalized_summary, years_experience FROM job_roles WHERE job_role_id = ?",
-            (str(job_role_id),),
+    def recompute_analytics(self) -> None:
+        """Rebuild the competency aggregates from scratch."""
+        with self._write_transaction() as connection:
+            analytics.recompute(connection)
+
+    def top_competencies(
+        self,
+        job_title: str,
+        years_experience: int | None = None,
+        *,
+        limit: int = 10,
+    ) -> List[Dict[str, object]]:
+        return analytics.top_competencies(self._reader(), job_title, years_experience, limit)
+
+    def competency_level_distribution(self, name: str) -> Dict[int, int] | None:
+        """Return ``{level: role_count}`` for a competency, or ``None`` if it was never seen."""
+        return analytics.level_distribution(self._reader(), canonical_competency_name(name))
+
+    def enqueue_job(self, payload: Dict[str, Any], *, now: float) -> jobs.AnalysisJob:
+        with self._write_transaction() as connection:
+            return jobs.insert_job(connection, payload, now)
+
+    def claim_job(
+        self,
+        owner: str,
+        *,
+        now: float,
+        lease_seconds: float,
+        max_attempts: int,
+    ) -> jobs.AnalysisJob | None:
+        with self._write_transaction() as connection:
+            return jobs.claim_job(connection, owner, now, lease_seconds, max_attempts)
+
+    def renew_job_leases(self, owner: str, job_ids: List[str], *, now: float, lease_seconds: float) -> None:
+        with self._write_transaction() as connection:
+            jobs.renew_leases(connection, owner, job_ids, now, lease_seconds)
+
+    def release_job(self, job_id: str, *, owner: str, now: float, error: str) -> bool:
+        """Requeue a job ``owner`` still holds; ``False`` if it was taken over."""
+        with self._write_transaction() as connection:
+            return jobs.release_job(connection, job_id, owner, now, error)
+
+    def finish_job(
+        self,
+        job_id: str,
+        *,
+        owner: str,
+        now: float,
+        result: bytes | None = None,
+        error: str | None = None,
+    ) -> bool:
+        """Record the outcome of a job ``owner`` still holds; ``False`` if it was taken over."""
+        with self._write_transaction() as connection:
+            return jobs.finish_job(connection, job_id, now, owner=owner, result=result, error=error)
+
+    def get_job(self, job_id: str) -> jobs.AnalysisJob | None:
+        return jobs.get_job(self._reader(), job_id)
+
+    def iter_job_role_embeddings(self) -> Iterable[tuple[JobRoleSummary, Sequence[float]]]:
+        cursor = self._reader().execute(
+            """
+            SELECT job_role_id, job_title, normalized_summary, years_experience,
+                   embedding_vector, embedding_blob, embedding_dtype, embedding_dim
+            FROM job_roles
+            """
         )
-        job_row = cursor.fetchone()
-        if job_row is None:
-            return None
-        job_role = JobRoleSummary(
-            job_role_id=UUID(job_row["job_role_id"]),
-            job_title=job_row["job_title"],
-            normalized_summary=job_row["normalized_summary"],
-            years_experience=job_row["years_experience"],
+        while True:
+            rows = cursor.fetchmany(STREAM_CHUNK_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield _row_to_summary(row), _row_embedding(row)
+
+    def iter_embedding_blocks(
+        self,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[Tuple[List[UUID], Any]]:
+        """Stream ``(job_role_ids, matrix)`` blocks of at most ``chunk_size`` stored vectors.
+
+        Only the ID and vector columns are read, so peak memory is bounded by the
+        chunk rather than the corpus. Blocks are float32 arrays when numpy is present.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        cursor = self._reader().execute(
+            """
+            SELECT job_role_id, embedding_vector, embedding_blob, embedding_dtype, embedding_dim
+            FROM job_roles
+            WHERE embedding_blob IS NOT NULL OR (embedding_vector IS NOT NULL AND embedding_vector != '')
+            """
         )
-        comp_cursor = self._connection.execute(
-            "SELECT name, level, type FROM competencies WHERE job_role_id = ? ORDER BY id",
-            (str(job_role_id),),
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            job_role_ids = [UUID(row["job_role_id"]) for row in rows]
+            yield job_role_ids, _rows_to_matrix(rows)
+
+    def iter_job_roles_missing_embeddings(self) -> Iterable[JobRoleSummary]:
+        cursor = self._reader().execute(
+            """
+            SELECT job_role_id, job_title, normalized_summary, years_experience
+            FROM job_roles
+            WHERE embedding_blob IS NULL AND (embedding_vector IS NULL OR embedding_vector = '')
+            """
         )
-        competencies = [
-            Competency(name=row["name"], level=row["level"], type=row["type"])
-            for row in comp_cursor.fetchall()
+        for row in cursor.fetchall():
+            yield _row_to_summary(row)
+
+    def update_embeddings(self, embeddings: Iterable[tuple[UUID, Sequence[float]]]) -> None:
+        rows = [
+            (*pack_embedding(embedding), str(job_role_id))
+            for job_role_id, embedding in embeddings
         ]
-        return JobRoleWithCompetencies(job_role=job_role, competencies=competencies)
+        with self._write_transaction():
+            self._connection.executemany(
+                """
+                UPDATE job_roles
+                SET embedding_blob = ?, embedding_dtype = ?, embedding_dim = ?, embedding_vector = NULL
+                WHERE job_role_id = ?
+                """,
+                rows,
+            )
+
+    def get_job_role(self, job_role_id: UUID) -> JobRoleSummary | None:
+        row = self._reader().execute(
+            "SELECT job_role_id, job_title, normalized_summary, years_experience FROM job_roles WHERE job_role_id = ?",
+            (str(job_role_id),),
+        ).fetchone()
+        return _row_to_summary(row) if row is not None else None
+
+    def get_job_role_with_competencies(self, job_role_id: UUID) -> JobRoleWithCompetencies | None:
+        """Return a hydrated role, served from the LRU cache when possible.
+
+        Cached instances are shared between callers and must be treated as read-only.
+        """
+        cache = self._role_cache
+        if cache is not None:
+            cached = cache.get(job_role_id)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+        with time_stage("sqlite_hydrate"):
+            rows = self._reader().execute(
+                f"{ROLE_HYDRATION_QUERY} WHERE r.job_role_id = ? ORDER BY c.id",
+                (str(job_role_id),),
+            ).fetchall()
+            role = next(iter(_hydrate_roles(rows).values()), None)
+        if cache is not None and role is not None:
+            cache.put(role.job_role.job_role_id, role, generation=generation)
+        return role
+
+    def get_many(self, job_role_ids: Iterable[UUID]) -> Dict[UUID, JobRoleWithCompetencies]:
+        """Hydrate several roles at once; IDs that are not stored are omitted."""
+        results: Dict[UUID, JobRoleWithCompetencies] = {}
+        missing: List[UUID] = []
+        cache = self._role_cache
+        for job_role_id in dict.fromkeys(job_role_ids):
+            cached = cache.get(job_role_id) if cache is not None else None
+            if cached is not None:
+                results[job_role_id] = cached
+            else:
+                missing.append(job_role_id)
+        generation = cache.generation if cache is not None else None
+        keys = [str(job_role_id) for job_role_id in missing]
+        for start in range(0, len(keys), MAX_QUERY_PARAMETERS):
+            chunk = keys[start : start + MAX_QUERY_PARAMETERS]
+            placeholders = ", ".join("?" for _ in chunk)
+            with time_stage("sqlite_hydrate"):
+                rows = self._reader().execute(
+                    f"{ROLE_HYDRATION_QUERY} WHERE r.job_role_id IN ({placeholders}) ORDER BY r.job_role_id, c.id",
+                    chunk,
+                ).fetchall()
+                loaded = _hydrate_roles(rows)
+            if cache is not None:
+                for job_role_id, role in loaded.items():
+                    cache.put(job_role_id, role, generation=generation)
+            results.update(loaded)
+        return results
@@ -0,0 +1,156 @@
+"""Out-of-process embedding inference backed by a pool of worker processes."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - executed when numpy is missing
+    np = None  # type: ignore[assignment]
+
+from .config import load_config
+from .similarity import DEFAULT_EMBEDDING_BATCH_SIZE, EmbeddingMatrix, EmbeddingProvider
+
+
+ModelLoader = Callable[[str, "str | None"], Any]
+
+_worker_model: Any = None
+
+# fork() in a threaded web process can hand workers locks held by other threads.
+DEFAULT_MP_CONTEXT = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _initialize_worker(
+    model_name: str,
+    device: str | None,
+    threads_per_worker: int,
+    cpu_affinity: Sequence[Sequence[int]],
+    slot_counter: Any,
+    loader: ModelLoader | None,
+) -> None:
+    global _worker_model
+    with slot_counter.get_lock():
+        slot = slot_counter.value
+        slot_counter.value += 1
+    if cpu_affinity and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, set(cpu_affinity[slot % len(cpu_affinity)]))
+    if threads_per_worker > 0:
+        for variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "TOKENIZERS_PARALLELISM"):
+            os.environ[variable] = "false" if variable == "TOKENIZERS_PARALLELISM" else str(threads_per_worker)
+        try:  # pragma: no cover - torch is only present with sentence-transformers
+            import torch
+
+            torch.set_num_threads(threads_per_worker)
+        except ModuleNotFoundError:  # pragma: no cover - executed without torch
+            pass
+    if loader is None:
+        from .embeddings import _load_model
+
+        loader = _load_model
+    _worker_model = loader(model_name, device)
+
+
+def _encode_to_shared_memory(texts: List[str], batch_size: int) -> Tuple[str, Tuple[int, int]]:
+    embeddings = _worker_model.encode(
+        texts,
+        batch_size=batch_size,
+        normalize_embeddings=False,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    matrix = np.ascontiguousarray(embeddings, dtype="float32")
+    segment = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1), track=False)
+    try:
+        np.ndarray(matrix.shape, dtype="float32", buffer=segment.buf)[...] = matrix
+        return segment.name, (int(matrix.shape[0]), int(matrix.shape[1]))
+    finally:
+        segment.close()
+
+
+def _read_shared_matrix(name: str, shape: Tuple[int, int]) -> EmbeddingMatrix:
+    segment = shared_memory.SharedMemory(name=name, track=False)
+    try:
+        return np.ndarray(shape, dtype="float32", buffer=segment.buf).copy()
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+class ProcessPoolEmbeddingProvider(EmbeddingProvider):
+    """Serves embeddings from worker processes so inference never holds the web GIL.
+
+    Each worker loads the model once at start-up; result vectors travel back through
+    shared memory segments instead of pickled Python lists. Workers start through
+    ``forkserver`` (``spawn`` where unavailable); pass ``mp_context="fork"`` only when
+    the calling process has no other threads.
+    """
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        *,
+        workers: int | None = None,
+        threads_per_worker: int | None = None,
+        cpu_affinity: Sequence[Sequence[int]] | None = None,
+        device: str | None = None,
+        loader: ModelLoader | None = None,
+        mp_context: str | None = None,
+    ) -> None:
+        if np is None:
+            raise ModuleNotFoundError("numpy is required for ProcessPoolEmbeddingProvider.")
+        config = load_config()
+        self._model_name = model_name or config.embedding_model
+        self._workers = workers or config.embedding_workers or os.cpu_count() or 1
+        threads = config.embedding_worker_threads if threads_per_worker is None else threads_per_worker
+        affinity = config.embedding_worker_cpu_affinity if cpu_affinity is None else cpu_affinity
+        context = multiprocessing.get_context(mp_context or DEFAULT_MP_CONTEXT)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(
+                self._model_name,
+                device,
+                threads,
+                [list(cpus) for cpus in affinity],
+                context.Value("i", 0),
+                loader,
+            ),
+        )
+
+    def embed(self, text: str) -> Sequence[float]:
+        if not text:
+            return []
+        return [float(value) for value in self.embed_batch([text])[0]]
+
+    def embed_batch(
+        self,
+        texts: Sequence[str],
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    ) -> EmbeddingMatrix:
+        if not texts:
+            return np.empty((0, 0), dtype="float32")
+        items = list(texts)
+        futures = [
+            self._executor.submit(_encode_to_shared_memory, items[start : start + batch_size], batch_size)
+            for start in range(0, len(items), batch_size)
+        ]
+        # Drain every future, even after a failure: each finished chunk owns a segment
+        # that only _read_shared_matrix unlinks.
+        blocks = []
+        error: BaseException | None = None
+        for future in futures:
+            try:
+                blocks.append(_read_shared_matrix(*future.result()))
+            except Exception as exc:  # noqa: BLE001 - re-raised once all segments are released
+                error = error or exc
+        if error is not None:
+            raise error
+        return blocks[0] if len(blocks) == 1 else np.ascontiguousarray(np.vstack(blocks))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -1,8 +1,15 @@
 """Embedding provider implementations for the job role analyzer."""
 from __future__ import annotations
 
+import re
+import zlib
 from functools import lru_cache
-from typing import Sequence
+from typing import List, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - executed when numpy is missing
+    np = None  # type: ignore[assignment]
 
 try:  # pragma: no cover - optional dependency
     from sentence_transformers import SentenceTransformer
@@ -10,7 +17,7 @@ except ModuleNotFoundError:  # pragma: no cover - executed when the package is m
     SentenceTransformer = None  # type: ignore[assignment]
 
 from .config import load_config
-from .similarity import EmbeddingProvider
+from .similarity import DEFAULT_EMBEDDING_BATCH_SIZE, EmbeddingMatrix, EmbeddingProvider
 
 
 class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
@@ -36,6 +43,111 @@ class SentenceTransformerEmbeddingProvider(EmbeddingProvider):
         )[0]
         return list(map(float, embedding))
 
+    def embed_batch(
+        self,
+        texts: Sequence[str],
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    ) -> EmbeddingMatrix:
+        if np is None:
+            raise ModuleNotFoundError("numpy is required for batched embeddings.")
+        if not texts:
+            dimension = self._model.get_sentence_embedding_dimension() or 0  # type: ignore[union-attr]
+            return np.empty((0, dimension), dtype="float32")
+        embeddings = self._model.encode(  # type: ignore[operator]
+            list(texts),
+            batch_size=batch_size,
+            normalize_embeddings=False,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.ascontiguousarray(embeddings, dtype="float32")
+
+
+HASHING_MODEL_NAME = "hashing"
+DEFAULT_HASHING_DIMENSION = 1024
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """Model-free embedder using signed feature hashing of word and char n-grams.
+
+    Term frequencies are sublinearly scaled and each vector is L2-normalized, so
+    cosine similarity behaves like a TF-weighted bag-of-n-grams comparison. No model
+    is loaded, which keeps start-up instant and memory flat.
+    """
+
+    def __init__(
+        self,
+        dimension: int = DEFAULT_HASHING_DIMENSION,
+        *,
+        word_ngram_range: Tuple[int, int] = (1, 2),
+        char_ngram_range: Tuple[int, int] = (3, 5),
+        sublinear_tf: bool = True,
+    ) -> None:
+        if np is None:
+            raise ModuleNotFoundError("numpy is required for HashingEmbeddingProvider.")
+        if dimension <= 0:
+            raise ValueError("dimension must be a positive integer.")
+        self._dimension = dimension
+        self._word_ngram_range = word_ngram_range
+        self._char_ngram_range = char_ngram_range
+        self._sublinear_tf = sublinear_tf
+
+    @classmethod
+    def from_model_name(cls, model_name: str) -> "HashingEmbeddingProvider":
+        """Build a provider from ``"hashing"`` or ``"hashing:<dimension>"``."""
+        _, _, suffix = model_name.partition(":")
+        return cls(int(suffix)) if suffix else cls()
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    def embed(self, text: str) -> Sequence[float]:
+        if not text:
+            return []
+        return self.embed_batch([text])[0].tolist()
+
+    def embed_batch(
+        self,
+        texts: Sequence[str],
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    ) -> EmbeddingMatrix:
+        rows: List[int] = []
+        hashes: List[int] = []
+        for row, text in enumerate(texts):
+            features = self._features(text)
+            rows.extend([row] * len(features))
+            hashes.extend(zlib.crc32(feature.encode("utf-8")) for feature in features)
+        count = len(texts)
+        if not hashes:
+            return np.zeros((count, self._dimension), dtype="float32")
+        hashed = np.asarray(hashes, dtype=np.uint32)
+        buckets = np.asarray(rows, dtype=np.int64) * self._dimension + (hashed % self._dimension)
+        signs = np.where(hashed & 0x80000000, -1.0, 1.0)
+        matrix = np.bincount(buckets, weights=signs, minlength=count * self._dimension)
+        matrix = matrix.reshape(count, self._dimension)
+        if self._sublinear_tf:
+            magnitude = np.abs(matrix)
+            matrix = np.sign(matrix) * np.where(magnitude > 0, 1.0 + np.log(np.maximum(magnitude, 1.0)), 0.0)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return np.ascontiguousarray(matrix, dtype="float32")
+
+    def _features(self, text: str) -> List[str]:
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        features: List[str] = []
+        low, high = self._word_ngram_range
+        for size in range(low, high + 1):
+            features.extend("w:" + " ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1))
+        low, high = self._char_ngram_range
+        for token in tokens:
+            padded = f" {token} "
+            for size in range(low, high + 1):
+                features.extend("c:" + padded[i : i + size] for i in range(len(padded) - size + 1))
+        return features
+
 
 @lru_cache(maxsize=4)
 def _load_model(model_name: str, device: str | None) -> "SentenceTransformer":
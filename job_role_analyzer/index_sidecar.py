@@ -0,0 +1,350 @@
+"""Similarity index served from one local sidecar process over a Unix domain socket.
+
+Web workers talk to :class:`IndexSidecarServer` through :class:`SidecarIndexClient`,
+so the vectors live in memory once per node and roles added by any worker are
+immediately searchable by all of them.
+
+Wire format: every message is a little-endian ``uint32`` length followed by that many
+bytes. Requests start with a one-byte opcode, responses with a one-byte status; on
+error the rest of the response is a UTF-8 message. Matrices travel as raw float32
+rows and role IDs as 16 raw bytes each.
+
+* ``SEARCH``: ``rows, dim, k`` (``<III``) + vectors -> ``rows, k`` (``<II``) + scores + IDs;
+  empty slots carry the nil UUID.
+* ``ADD``: ``rows, dim`` (``<II``) + IDs + vectors -> index size (``<Q``).
+* ``STATS``: -> index size and dimension (``<QI``).
+* ``RELOAD``: rebuild from the database -> index size (``<Q``).
+"""
+from __future__ import annotations
+
+import array
+import logging
+import os
+import socket
+import socketserver
+import struct
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Sequence, Set, Tuple
+from uuid import UUID
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - executed when numpy is unavailable
+    np = None  # type: ignore[assignment]
+
+from .vector_index import FlatIndex, matrix_dimension, matrix_rows
+
+
+logger = logging.getLogger(__name__)
+
+OP_SEARCH = 1
+OP_ADD = 2
+OP_STATS = 3
+OP_RELOAD = 4
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+_LENGTH = struct.Struct("<I")
+_SEARCH = struct.Struct("<III")
+_MATRIX = struct.Struct("<II")
+_SIZE = struct.Struct("<Q")
+_STATS = struct.Struct("<QI")
+_NIL_ID = bytes(16)
+MAX_MESSAGE_BYTES = 256 * 2**20
+DEFAULT_MAX_K = 100
+
+
+class SidecarError(RuntimeError):
+    """The sidecar rejected a request or could not be reached."""
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes | None:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if not count:
+            return None
+        received += count
+    return bytes(buffer)
+
+
+def recv_message(sock: socket.socket) -> bytes | None:
+    """Read one framed message, or ``None`` if the peer closed the connection."""
+    header = _recv_exact(sock, _LENGTH.size)
+    if header is None:
+        return None
+    (length,) = _LENGTH.unpack(header)
+    if length > MAX_MESSAGE_BYTES:
+        raise SidecarError(f"Message of {length} bytes exceeds the {MAX_MESSAGE_BYTES} byte limit.")
+    return _recv_exact(sock, length)
+
+
+def send_message(sock: socket.socket, payload: bytes) -> None:
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def _encode_matrix(matrix: Any) -> Tuple[int, int, bytes]:
+    if np is not None:
+        values = np.ascontiguousarray(matrix, dtype=np.float32)
+        if values.ndim != 2:
+            raise ValueError("Expected a 2-D matrix of vectors.")
+        return values.shape[0], values.shape[1], values.tobytes()
+    rows = [list(row) for row in matrix]
+    dimension = len(rows[0]) if rows else 0
+    if any(len(row) != dimension for row in rows):
+        raise ValueError("All vectors must share one dimensionality.")
+    return len(rows), dimension, array.array("f", [value for row in rows for value in row]).tobytes()
+
+
+def _decode_matrix(data: bytes, rows: int, dimension: int) -> Any:
+    if len(data) != rows * dimension * 4:
+        raise ValueError("Matrix payload does not match its declared shape.")
+    if np is not None:
+        return np.frombuffer(data, dtype=np.float32).reshape(rows, dimension)
+    values = array.array("f")
+    values.frombytes(data)
+    return [values[row * dimension : (row + 1) * dimension].tolist() for row in range(rows)]
+
+
+class _ReadWriteLock:
+    """Many concurrent readers or one writer; waiting writers hold off new readers."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._condition:
+            while self._writing or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+
+class IndexSidecarServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Owns the in-memory index and answers framed requests from any number of workers.
+
+    Searches run concurrently; adds and reloads take the index exclusively. Adding a
+    role ID that is already indexed is a no-op, so clients may safely retry an add.
+    A search's ``k`` is clamped to the index size and ``max_k``.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        database: Any,
+        *,
+        chunk_size: int = 4096,
+        max_k: int = DEFAULT_MAX_K,
+    ) -> None:
+        self.database = database
+        self.chunk_size = chunk_size
+        self.max_k = max_k
+        self._lock = _ReadWriteLock()
+        self._index: FlatIndex | None = None
+        self._ids: List[bytes] = []
+        self._known: Set[bytes] = set()
+        self._dimension = 0
+        self.reload()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, _SidecarHandler)
+
+    def reload(self) -> int:
+        index: FlatIndex | None = None
+        ids: List[bytes] = []
+        dimension = 0
+        for block_ids, block in self.database.iter_embedding_blocks(self.chunk_size):
+            if index is None:
+                dimension = matrix_dimension(block)
+                index = FlatIndex(dimension)
+            index.add(block)
+            ids.extend(job_role_id.bytes for job_role_id in block_ids)
+        with self._lock.write():
+            self._index, self._ids, self._known, self._dimension = index, ids, set(ids), dimension
+        logger.info("Index sidecar loaded %s vectors", len(ids))
+        return len(ids)
+
+    def search(self, matrix: Any, k: int) -> Tuple[List[List[float]], List[List[bytes]]]:
+        rows = matrix_rows(matrix)
+        with self._lock.read():
+            if self._index is None or not rows:
+                return [[0.0] * k for _ in range(rows)], [[_NIL_ID] * k for _ in range(rows)]
+            if matrix_dimension(matrix) != self._dimension:
+                raise ValueError("Query vectors must match the index dimensionality.")
+            distances, indices = self._index.search(matrix, k)
+            ids = [[self._ids[position] if position >= 0 else _NIL_ID for position in row] for row in indices]
+        return distances, ids
+
+    def add(self, ids: List[bytes], matrix: Any) -> int:
+        with self._lock.write():
+            fresh = [row for row, job_role_id in enumerate(ids) if job_role_id not in self._known]
+            if not fresh:
+                return len(self._ids)
+            if self._index is None:
+                self._dimension = matrix_dimension(matrix)
+                self._index = FlatIndex(self._dimension)
+            elif matrix_dimension(matrix) != self._dimension:
+                raise ValueError("Embedding dimensionality must remain consistent for the index.")
+            self._index.add(matrix if len(fresh) == len(ids) else [matrix[row] for row in fresh])
+            for row in fresh:
+                self._ids.append(ids[row])
+                self._known.add(ids[row])
+            return len(self._ids)
+
+    def stats(self) -> Tuple[int, int]:
+        with self._lock.read():
+            return len(self._ids), self._dimension
+
+    def handle(self, request: bytes) -> bytes:
+        opcode, body = request[0], request[1:]
+        if opcode == OP_SEARCH:
+            rows, dimension, k = _SEARCH.unpack_from(body)
+            if k <= 0:
+                raise ValueError("k must be a positive number of neighbours.")
+            # Bound the response frame: never more slots than stored vectors or max_k.
+            k = min(k, self.max_k, max(self.stats()[0], 1))
+            distances, ids = self.search(_decode_matrix(body[_SEARCH.size :], rows, dimension), k)
+            scores = array.array("f", [score for row in distances for score in row]).tobytes()
+            return bytes([STATUS_OK]) + _MATRIX.pack(rows, k) + scores + b"".join(id_ for row in ids for id_ in row)
+        if opcode == OP_ADD:
+            rows, dimension = _MATRIX.unpack_from(body)
+            ids_end = _MATRIX.size + rows * 16
+            ids = [body[start : start + 16] for start in range(_MATRIX.size, ids_end, 16)]
+            size = self.add(ids, _decode_matrix(body[ids_end:], rows, dimension)) if rows else self.stats()[0]
+            return bytes([STATUS_OK]) + _SIZE.pack(size)
+        if opcode == OP_STATS:
+            return bytes([STATUS_OK]) + _STATS.pack(*self.stats())
+        if opcode == OP_RELOAD:
+            return bytes([STATUS_OK]) + _SIZE.pack(self.reload())
+        raise ValueError(f"Unknown opcode {opcode}")
+
+
+class _SidecarHandler(socketserver.BaseRequestHandler):
+    server: IndexSidecarServer
+
+    def handle(self) -> None:
+        while True:
+            try:
+                request = recv_message(self.request)
+            except (OSError, SidecarError):
+                return
+            if not request:
+                return
+            try:
+                response = self.server.handle(request)
+            except Exception as exc:  # noqa: BLE001 - every request gets a reply
+                if not isinstance(exc, (ValueError, struct.error)):
+                    logger.exception("Index sidecar request failed")
+                response = bytes([STATUS_ERROR]) + (str(exc) or type(exc).__name__).encode("utf-8")
+            try:
+                send_message(self.request, response)
+            except OSError:
+                return
+
+
+class SidecarIndexClient:
+    """Client for :class:`IndexSidecarServer`; each thread keeps its own connection."""
+
+    def __init__(self, socket_path: str, *, timeout: float = 2.0) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def search(self, matrix: Any, k: int = 1) -> Tuple[List[List[float]], List[List[UUID | None]]]:
+        rows, dimension, data = _encode_matrix(matrix)
+        body = self._call(bytes([OP_SEARCH]) + _SEARCH.pack(rows, dimension, k) + data)
+        rows, k = _MATRIX.unpack_from(body)
+        scores = array.array("f")
+        scores_end = _MATRIX.size + rows * k * 4
+        scores.frombytes(body[_MATRIX.size : scores_end])
+        distances = [scores[row * k : (row + 1) * k].tolist() for row in range(rows)]
+        ids = [
+            [
+                None if raw == _NIL_ID else UUID(bytes=raw)
+                for raw in (body[start : start + 16] for start in range(offset, offset + k * 16, 16))
+            ]
+            for offset in range(scores_end, scores_end + rows * k * 16, k * 16)
+        ]
+        return distances, ids
+
+    def add(self, job_role_ids: Sequence[UUID], matrix: Any) -> int:
+        rows, dimension, data = _encode_matrix(matrix)
+        if rows != len(job_role_ids):
+            raise ValueError("Each vector needs exactly one job role ID.")
+        ids = b"".join(job_role_id.bytes for job_role_id in job_role_ids)
+        body = self._call(bytes([OP_ADD]) + _MATRIX.pack(rows, dimension) + ids + data)
+        return _SIZE.unpack(body)[0]
+
+    def stats(self) -> Tuple[int, int]:
+        return _STATS.unpack(self._call(bytes([OP_STATS])))
+
+    def reload(self) -> int:
+        return _SIZE.unpack(self._call(bytes([OP_RELOAD])))[0]
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _call(self, request: bytes) -> bytes:
+        # One retry on a fresh connection covers a sidecar restart between calls. Every
+        # operation is safe to repeat: the server ignores adds of already indexed IDs.
+        for attempt in (0, 1):
+            try:
+                connection = self._connection()
+                send_message(connection, request)
+                response = recv_message(connection)
+                if response is None:
+                    raise ConnectionError("Index sidecar closed the connection.")
+                break
+            except OSError as exc:
+                self.close()
+                if attempt:
+                    raise SidecarError(f"Index sidecar at {self.socket_path} is unavailable: {exc}") from exc
+        if response[0] != STATUS_OK:
+            raise SidecarError(response[1:].decode("utf-8", "replace"))
+        return response[1:]
+
+    def _connection(self) -> socket.socket:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self.timeout)
+            try:
+                connection.connect(self.socket_path)
+            except OSError:
+                connection.close()
+                raise
+            self._local.connection = connection
+        return connection
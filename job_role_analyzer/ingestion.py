@@ -0,0 +1,242 @@
+"""Resumable bulk ingestion of historical job postings."""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .analyzer import JobRoleAnalyzer, RoleResolution, compute_content_hash
+from .db import StoredJobRole
+from .preprocessing import EMBEDDING_CONSUMER
+from .vector_index import dot, normalize_vector
+
+
+logger = logging.getLogger(__name__)
+
+LLM_CALLS_PER_ROLE = 2
+SUPPORTED_FORMATS = ("jsonl", "csv")
+
+
+@dataclass
+class IngestRecord:
+    position: int
+    job_title: str = ""
+    job_description: str = ""
+    years_of_experience: int = 0
+    error: str | None = None
+
+
+@dataclass
+class IngestionStats:
+    processed: int = 0
+    skipped: int = 0
+    created: int = 0
+    duplicates: int = 0
+    errors: int = 0
+    llm_calls: int = 0
+    llm_calls_avoided: int = 0
+    elapsed_seconds: float = 0.0
+    # Position of the first record whose analysis failed; the checkpoint never passes it.
+    retry_from: int | None = None
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        payload = asdict(self)
+        payload["elapsed_seconds"] = round(self.elapsed_seconds, 3)
+        payload["docs_per_second"] = round(self.docs_per_second, 2)
+        return payload
+
+
+def read_records(path: str | Path, fmt: str | None = None) -> Iterator[IngestRecord]:
+    """Stream records from a JSONL or CSV file; positions are 0-based record indexes."""
+    source = Path(path)
+    fmt = (fmt or source.suffix.lstrip(".")).lower()
+    if fmt == "ndjson":
+        fmt = "jsonl"
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported input format '{fmt}'; expected one of {', '.join(SUPPORTED_FORMATS)}.")
+    with source.open("r", encoding="utf-8", newline="") as handle:
+        if fmt == "csv":
+            rows: Iterable[Any] = csv.DictReader(handle)
+        else:
+            rows = (line for line in handle if line.strip())
+        for position, raw in enumerate(rows):
+            try:
+                payload = json.loads(raw) if fmt == "jsonl" else raw
+                yield _to_record(position, payload)
+            except (ValueError, TypeError) as exc:
+                yield IngestRecord(position=position, error=str(exc))
+
+
+def _to_record(position: int, payload: Any) -> IngestRecord:
+    if not isinstance(payload, dict):
+        raise ValueError("Each record must be an object.")
+    job_title = str(payload.get("job_title") or "").strip()
+    job_description = str(payload.get("job_description") or "").strip()
+    if not job_title or not job_description:
+        raise ValueError("Records require job_title and job_description.")
+    return IngestRecord(
+        position=position,
+        job_title=job_title,
+        job_description=job_description,
+        years_of_experience=int(payload.get("years_of_experience") or 0),
+    )
+
+
+class IngestionPipeline:
+    """Deduplicates records against the store and analyzes the rest in checkpointed batches.
+
+    Each batch is written in one transaction together with the checkpoint cursor, so a
+    restarted run resumes at the first uncommitted record. The cursor stops at the first
+    record whose analysis failed, so a rerun retries it; records after it that were
+    already stored are then skipped by content hash. Near-duplicates inside one batch
+    are compared with each other as well as with the index.
+    """
+
+    def __init__(
+        self,
+        analyzer: JobRoleAnalyzer,
+        *,
+        batch_size: int = 50,
+        concurrency: int = 4,
+    ) -> None:
+        if batch_size <= 0 or concurrency <= 0:
+            raise ValueError("batch_size and concurrency must be positive integers.")
+        self.analyzer = analyzer
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+    def run(self, records: Iterable[IngestRecord], *, source: str) -> IngestionStats:
+        stats = IngestionStats()
+        started = time.perf_counter()
+        resume_from = self.analyzer.db.get_ingest_checkpoint(source)
+        if resume_from:
+            logger.info("Resuming ingestion of %s at record %s", source, resume_from)
+        batch: List[IngestRecord] = []
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="ingest-llm") as executor:
+            try:
+                for record in records:
+                    if record.position < resume_from:
+                        stats.skipped += 1
+                        continue
+                    batch.append(record)
+                    if len(batch) >= self.batch_size:
+                        self._process_batch(batch, source, stats, executor, started)
+                        batch = []
+                if batch:
+                    self._process_batch(batch, source, stats, executor, started)
+            finally:
+                stats.elapsed_seconds = time.perf_counter() - started
+        return stats
+
+    def _process_batch(
+        self,
+        batch: List[IngestRecord],
+        source: str,
+        stats: IngestionStats,
+        executor: ThreadPoolExecutor,
+        started: float,
+    ) -> None:
+        pending = self._resolve_batch(batch, stats)
+        generated = list(executor.map(self._generate, pending))
+        stored = [entry for entry in generated if entry is not None]
+        stats.llm_calls += LLM_CALLS_PER_ROLE * len(pending)
+        stats.errors += len(generated) - len(stored)
+        failed = [record.position for (record, _), entry in zip(pending, generated) if entry is None]
+        if failed and (stats.retry_from is None or failed[0] < stats.retry_from):
+            stats.retry_from = failed[0]
+        checkpoint = batch[-1].position + 1
+        if stats.retry_from is not None:
+            checkpoint = min(checkpoint, stats.retry_from)
+
+        self.analyzer.db.add_job_roles(stored, checkpoint=(source, checkpoint))
+        for entry in stored:
+            self.analyzer.similarity_checker.add_to_index(entry.job_role, entry.embedding or [])
+        stats.created += len(stored)
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Committed records up to %s: %s processed, %s created, %s duplicates, %s errors (%.1f docs/s)",
+            checkpoint,
+            stats.processed,
+            stats.created,
+            stats.duplicates,
+            stats.errors,
+            stats.processed / elapsed if elapsed > 0 else 0.0,
+        )
+
+    def _resolve_batch(
+        self,
+        batch: List[IngestRecord],
+        stats: IngestionStats,
+    ) -> List[Tuple[IngestRecord, RoleResolution]]:
+        analyzer = self.analyzer
+        candidates: List[Tuple[IngestRecord, RoleResolution]] = []
+        seen_hashes: set[str] = set()
+        for record in batch:
+            stats.processed += 1
+            if record.error is not None:
+                logger.warning("Skipping record %s: %s", record.position, record.error)
+                stats.errors += 1
+                continue
+            content_hash = compute_content_hash(
+                record.job_title, record.job_description, record.years_of_experience
+            )
+            if content_hash in seen_hashes or analyzer.db.find_job_role_id_by_content_hash(content_hash):
+                self._count_duplicate(stats)
+                continue
+            seen_hashes.add(content_hash)
+            resolution = RoleResolution(
+                prepared=analyzer.preprocess(record.job_description),
+                content_hash=content_hash,
+                embedding=[],
+            )
+            candidates.append((record, resolution))
+
+        if not candidates:
+            return []
+        embeddings = analyzer.similarity_checker.compute_embeddings(
+            [resolution.prepared.for_consumer(EMBEDDING_CONSUMER) for _, resolution in candidates]
+        )
+        threshold = analyzer.similarity_checker.config.job_role_similarity_threshold
+        pending: List[Tuple[IngestRecord, RoleResolution]] = []
+        accepted: List[List[float]] = []
+        for (record, resolution), vector in zip(candidates, embeddings):
+            resolution.embedding = [float(value) for value in vector]
+            if analyzer.similarity_checker.find_similar_role_id_for_embedding(resolution.embedding):
+                self._count_duplicate(stats)
+                continue
+            # The index only knows earlier batches, so also compare with this batch's keepers.
+            normalized = normalize_vector(resolution.embedding)
+            if any(dot(normalized, other) >= threshold for other in accepted):
+                self._count_duplicate(stats)
+                continue
+            accepted.append(normalized)
+            pending.append((record, resolution))
+        return pending
+
+    def _generate(self, item: Tuple[IngestRecord, RoleResolution]) -> StoredJobRole | None:
+        record, resolution = item
+        try:
+            return self.analyzer.generate(
+                job_title=record.job_title,
+                years_of_experience=record.years_of_experience,
+                resolution=resolution,
+            )
+        except Exception:  # noqa: BLE001 - one bad posting must not abort the backfill
+            logger.exception("Failed to analyze record %s", record.position)
+            return None
+
+    @staticmethod
+    def _count_duplicate(stats: IngestionStats) -> None:
+        stats.duplicates += 1
+        stats.llm_calls_avoided += LLM_CALLS_PER_ROLE
+
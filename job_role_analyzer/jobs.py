@@ -0,0 +1,345 @@
+"""SQLite-backed queue of analysis jobs and the worker pool that drains it.
+
+Jobs are claimed under a lease that the owning worker renews while it runs. If a worker
+or the whole process dies, the lease lapses and the next claim picks the job up again;
+after ``max_attempts`` claims it is marked failed instead.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Set
+
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+TERMINAL_JOB_STATUSES = frozenset({JOB_SUCCEEDED, JOB_FAILED})
+
+JOB_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS analysis_jobs (
+        job_id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        result BLOB,
+        error TEXT,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        owner TEXT,
+        lease_expires_at REAL,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status
+    ON analysis_jobs (status, created_at)
+    """,
+)
+
+JOB_COLUMNS = "job_id, status, payload, result, error, attempts, created_at, updated_at"
+
+
+@dataclass
+class AnalysisJob:
+    job_id: str
+    status: str
+    payload: Dict[str, Any]
+    result: bytes | None = None
+    error: str | None = None
+    attempts: int = 0
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_JOB_STATUSES
+
+
+def _row_to_job(row: sqlite3.Row) -> AnalysisJob:
+    return AnalysisJob(
+        job_id=row["job_id"],
+        status=row["status"],
+        payload=json.loads(row["payload"]),
+        result=bytes(row["result"]) if row["result"] is not None else None,
+        error=row["error"],
+        attempts=row["attempts"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+def insert_job(connection: sqlite3.Connection, payload: Dict[str, Any], now: float) -> AnalysisJob:
+    job = AnalysisJob(uuid.uuid4().hex, JOB_QUEUED, payload, created_at=now, updated_at=now)
+    connection.execute(
+        """
+        INSERT INTO analysis_jobs (job_id, status, payload, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        (job.job_id, job.status, json.dumps(payload), now, now),
+    )
+    return job
+
+
+def claim_job(
+    connection: sqlite3.Connection,
+    owner: str,
+    now: float,
+    lease_seconds: float,
+    max_attempts: int,
+) -> AnalysisJob | None:
+    """Lease the oldest queued job, or one whose previous owner's lease has lapsed."""
+    while True:
+        row = connection.execute(
+            f"""
+            SELECT {JOB_COLUMNS} FROM analysis_jobs
+            WHERE status = ? OR (status = ? AND lease_expires_at < ?)
+            ORDER BY created_at
+            LIMIT 1
+            """,
+            (JOB_QUEUED, JOB_RUNNING, now),
+        ).fetchone()
+        if row is None:
+            return None
+        if row["attempts"] >= max_attempts:
+            finish_job(connection, row["job_id"], now, error="Job abandoned after repeated worker failures.")
+            continue
+        # Re-check claimability so a job another process leased first is never taken twice.
+        cursor = connection.execute(
+            """
+            UPDATE analysis_jobs
+            SET status = ?, owner = ?, attempts = attempts + 1, lease_expires_at = ?, updated_at = ?
+            WHERE job_id = ? AND (status = ? OR (status = ? AND lease_expires_at < ?))
+            """,
+            (JOB_RUNNING, owner, now + lease_seconds, now, row["job_id"], JOB_QUEUED, JOB_RUNNING, now),
+        )
+        if cursor.rowcount == 0:
+            continue
+        job = _row_to_job(row)
+        job.status, job.attempts, job.updated_at = JOB_RUNNING, job.attempts + 1, now
+        return job
+
+
+def renew_leases(
+    connection: sqlite3.Connection,
+    owner: str,
+    job_ids: List[str],
+    now: float,
+    lease_seconds: float,
+) -> None:
+    connection.executemany(
+        "UPDATE analysis_jobs SET lease_expires_at = ? WHERE job_id = ? AND owner = ? AND status = ?",
+        [(now + lease_seconds, job_id, owner, JOB_RUNNING) for job_id in job_ids],
+    )
+
+
+def release_job(connection: sqlite3.Connection, job_id: str, owner: str, now: float, error: str) -> bool:
+    """Put a running job back in the queue after a retryable failure.
+
+    Returns ``False`` when ``owner`` no longer holds the job, e.g. its lease lapsed and
+    another worker claimed it.
+    """
+    cursor = connection.execute(
+        """
+        UPDATE analysis_jobs
+        SET status = ?, owner = NULL, lease_expires_at = NULL, error = ?, updated_at = ?
+        WHERE job_id = ? AND owner = ? AND status = ?
+        """,
+        (JOB_QUEUED, error, now, job_id, owner, JOB_RUNNING),
+    )
+    return cursor.rowcount > 0
+
+
+def finish_job(
+    connection: sqlite3.Connection,
+    job_id: str,
+    now: float,
+    *,
+    owner: str | None = None,
+    result: bytes | None = None,
+    error: str | None = None,
+) -> bool:
+    """Record a job's outcome; with ``owner``, only while that worker still holds it."""
+    status = JOB_FAILED if error is not None else JOB_SUCCEEDED
+    if owner is None:
+        cursor = connection.execute(
+            """
+            UPDATE analysis_jobs
+            SET status = ?, result = ?, error = ?, owner = NULL, lease_expires_at = NULL, updated_at = ?
+            WHERE job_id = ?
+            """,
+            (status, result, error, now, job_id),
+        )
+    else:
+        cursor = connection.execute(
+            """
+            UPDATE analysis_jobs
+            SET status = ?, result = ?, error = ?, owner = NULL, lease_expires_at = NULL, updated_at = ?
+            WHERE job_id = ? AND owner = ? AND status = ?
+            """,
+            (status, result, error, now, job_id, owner, JOB_RUNNING),
+        )
+    return cursor.rowcount > 0
+
+
+def get_job(connection: sqlite3.Connection, job_id: str) -> AnalysisJob | None:
+    row = connection.execute(
+        f"SELECT {JOB_COLUMNS} FROM analysis_jobs WHERE job_id = ?",
+        (job_id,),
+    ).fetchone()
+    return _row_to_job(row) if row is not None else None
+
+
+class JobRunner:
+    """Bounded pool of threads that execute queued jobs through ``handler``.
+
+    ``handler`` receives the job payload and returns the serialized result. ``ValueError``
+    marks the job failed; any other exception releases it for another attempt.
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        handler: Callable[[Dict[str, Any]], bytes],
+        *,
+        workers: int = 2,
+        lease_seconds: float = 30.0,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self._db = db
+        self._handler = handler
+        self._workers = workers
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._poll_interval = poll_interval
+        self._clock = clock
+        self._owner = uuid.uuid4().hex
+        self._wakeup = threading.Condition()
+        self._pending_wakeups = 0
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._active: Set[str] = set()
+        self._active_lock = threading.Lock()
+        self._listeners: List[Callable[[str], None]] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    @property
+    def poll_interval(self) -> float:
+        return self._poll_interval
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stopping.clear()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"job-worker-{index}", daemon=True)
+            for index in range(self._workers)
+        ]
+        self._threads.append(threading.Thread(target=self._heartbeat, name="job-heartbeat", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stopping.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, payload: Dict[str, Any]) -> AnalysisJob:
+        job = self._db.enqueue_job(payload, now=self._clock())
+        with self._wakeup:
+            self._pending_wakeups += 1
+            self._wakeup.notify()
+        self._notify(job.job_id)
+        return job
+
+    def get(self, job_id: str) -> AnalysisJob | None:
+        return self._db.get_job(job_id)
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """Call ``listener(job_id)`` from worker threads whenever a job changes state."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str], None]) -> None:
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    def _notify(self, job_id: str) -> None:
+        for listener in list(self._listeners):
+            listener(job_id)
+
+    def _work(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                job = self._db.claim_job(
+                    self._owner,
+                    now=self._clock(),
+                    lease_seconds=self._lease_seconds,
+                    max_attempts=self._max_attempts,
+                )
+            except sqlite3.Error:
+                logger.exception("Unable to claim analysis job")
+                job = None
+            if job is None:
+                with self._wakeup:
+                    if self._pending_wakeups == 0 and not self._stopping.is_set():
+                        self._wakeup.wait(self._poll_interval)
+                    self._pending_wakeups = max(0, self._pending_wakeups - 1)
+                continue
+            self._run(job)
+
+    def _run(self, job: AnalysisJob) -> None:
+        with self._active_lock:
+            self._active.add(job.job_id)
+        self._notify(job.job_id)
+        owner = self._owner
+        try:
+            result = self._handler(job.payload)
+        except ValueError as exc:
+            recorded = self._db.finish_job(job.job_id, owner=owner, now=self._clock(), error=str(exc))
+        except Exception as exc:  # noqa: BLE001 - any other failure is retried
+            logger.exception("Analysis job %s failed on attempt %s", job.job_id, job.attempts)
+            error = str(exc) or type(exc).__name__
+            if job.attempts >= self._max_attempts:
+                recorded = self._db.finish_job(job.job_id, owner=owner, now=self._clock(), error=error)
+            else:
+                recorded = self._db.release_job(job.job_id, owner=owner, now=self._clock(), error=error)
+        else:
+            recorded = self._db.finish_job(job.job_id, owner=owner, now=self._clock(), result=result)
+        finally:
+            with self._active_lock:
+                self._active.discard(job.job_id)
+        if not recorded:
+            logger.warning("Dropped the outcome of job %s: its lease lapsed and another worker took it", job.job_id)
+        self._notify(job.job_id)
+
+    def _heartbeat(self) -> None:
+        interval = max(self._lease_seconds / 3.0, 0.01)
+        while not self._stopping.wait(interval):
+            with self._active_lock:
+                active = list(self._active)
+            if not active:
+                continue
+            try:
+                self._db.renew_job_leases(self._owner, active, now=self._clock(), lease_seconds=self._lease_seconds)
+            except sqlite3.Error:
+                logger.exception("Unable to renew analysis job leases")
@@ -18,6 +18,7 @@ except ModuleNotFoundError:  # pragma: no cover - executed when Jinja2 isn't ins
             return rendered
 
 from .config import load_config
+from .metrics import time_stage
 
 
 class PromptNotFoundError(FileNotFoundError):
@@ -38,8 +39,19 @@ class TemplateRenderer:
         self._config = load_config()
         base_path = Path(prompts_path or self._config.prompts_path)
         self._base_path = base_path.resolve()
+        self._preloaded: Dict[str, Template] = {}
+
+    def preload(self) -> int:
+        """Compile every template up front; later :meth:`load` calls skip the disk."""
+        for prompt_path in sorted(self._base_path.rglob("*.txt")):
+            prompt_name = prompt_path.relative_to(self._base_path).with_suffix("").as_posix()
+            self._preloaded[prompt_name] = self.load(prompt_name)
+        return len(self._preloaded)
 
     def load(self, prompt_name: str) -> Template:
+        preloaded = self._preloaded.get(prompt_name)
+        if preloaded is not None:
+            return preloaded
         prompt_path = self._base_path / f"{prompt_name}.txt"
         if not prompt_path.exists():
             raise PromptNotFoundError(f"Prompt template '{prompt_name}' not found at {prompt_path}")
@@ -58,7 +70,8 @@ class LLMInterface:
     def run_prompt(self, prompt_name: str, input_vars: Dict[str, Any], *, as_json: bool = False) -> Any:
         template = self.renderer.load(f"jd_analysis/{prompt_name}")
         rendered_prompt = template.render(**input_vars)
-        response = self.client.complete(rendered_prompt)
+        with time_stage(prompt_name):
+            response = self.client.complete(rendered_prompt)
         if as_json:
             return json.loads(response)
         return response
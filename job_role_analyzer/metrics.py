@@ -0,0 +1,355 @@
+"""Lightweight, dependency-free instrumentation primitives."""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SCORE_BUCKETS = (0.5, 0.6, 0.7, 0.8, 0.85, 0.9, 0.95, 0.975, 0.99, 1.0)
+
+
+class Histogram:
+    """Thread-safe histogram with fixed, cumulative upper-bound buckets."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        bounds = sorted(float(bound) for bound in buckets)
+        if not bounds:
+            raise ValueError("Histogram requires at least one bucket bound.")
+        if bounds[-1] != math.inf:
+            bounds.append(math.inf)
+        self._bounds = bounds
+        self._counts = [0] * len(bounds)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        position = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[position] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+            count = self._count
+        cumulative: Dict[float, int] = {}
+        running = 0
+        for bound, bucket_count in zip(self._bounds, counts):
+            running += bucket_count
+            cumulative[bound] = running
+        return {"buckets": cumulative, "count": count, "sum": total}
+
+
+class CounterValue:
+    """Monotonically increasing value."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class GaugeValue:
+    """Value that can go up and down, or be computed at scrape time."""
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Callable[[], float] | None = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        function = self._function
+        return float(function()) if function is not None else self._value
+
+
+class MetricFamily:
+    """A named metric whose children are keyed by label values.
+
+    Unlabelled families forward ``inc``/``dec``/``set``/``observe`` to their single child.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        factory: Callable[[], Any],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            # Unlabelled metrics are exported from the start, even before first use.
+            self._children[()] = factory()
+
+    def labels(self, *values: Any, **labels: Any) -> Any:
+        if labels:
+            values = tuple(labels[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._factory())
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.labels().set_function(function)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape_help(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in sorted(self._children.items()):
+            labels = dict(zip(self.labelnames, key))
+            if isinstance(child, Histogram):
+                snapshot = child.snapshot()
+                for bound, count in snapshot["buckets"].items():
+                    bucket_labels = {**labels, "le": _format_bound(bound)}
+                    lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {count}")
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(snapshot['sum'])}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {snapshot['count']}")
+            else:
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(child.value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered in the Prometheus text exposition format."""
+
+    def __init__(self) -> None:
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, documentation, "counter", CounterValue, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> MetricFamily:
+        return self._register(MetricFamily(name, documentation, "gauge", GaugeValue, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> MetricFamily:
+        return self._register(
+            MetricFamily(name, documentation, "histogram", lambda: Histogram(buckets), labelnames)
+        )
+
+    def get(self, name: str) -> MetricFamily | None:
+        return self._families.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in list(self._families.values()):
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, family: MetricFamily) -> MetricFamily:
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is not None:
+                if existing.kind != family.kind or existing.labelnames != family.labelnames:
+                    raise ValueError(f"Metric {family.name} is already registered with a different shape.")
+                return existing
+            self._families[family.name] = family
+            return family
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = (f'{name}="{_escape_label_value(value)}"' for name, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == math.inf else _format_value(bound)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "jra_stage_duration_seconds",
+    "Time spent in each request stage (embedding, similarity_search, sqlite_*, LLM prompts).",
+    ["stage"],
+)
+SIMILARITY_LOOKUPS = REGISTRY.counter(
+    "jra_similarity_lookups_total",
+    "Similarity index lookups by outcome.",
+    ["result"],
+)
+SIMILARITY_SCORE = REGISTRY.histogram(
+    "jra_similarity_best_score",
+    "Cosine similarity of the nearest stored role for each lookup.",
+    buckets=SCORE_BUCKETS,
+)
+PREPROCESS_TOKENS_SAVED = REGISTRY.counter(
+    "jra_preprocess_tokens_saved_total",
+    "Approximate tokens removed by preprocessing before each consumer (embedding, LLM prompts).",
+    ["stage"],
+)
+INDEX_SIZE = REGISTRY.gauge("jra_similarity_index_size", "Number of vectors in the similarity index.")
+LLM_IN_FLIGHT = REGISTRY.gauge("jra_llm_requests_in_flight", "LLM completion requests currently outstanding.")
+LLM_ERRORS = REGISTRY.counter("jra_llm_errors_total", "Failed LLM completion requests by kind.", ["kind"])
+PROCESS_MEMORY = REGISTRY.gauge(
+    "jra_process_memory_bytes",
+    "Memory of the serving process: rss, pss (shared pages split) and uss (private pages).",
+    ["kind"],
+)
+
+
+def process_memory(pid: int | str = "self") -> Dict[str, int] | None:
+    """Return ``rss``, ``pss`` and ``uss`` in bytes from ``/proc/<pid>/smaps_rollup`` (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as handle:
+            text = handle.read()
+    except OSError:
+        return None
+    fields: Dict[str, int] = {}
+    for line in text.splitlines():
+        name, _, rest = line.partition(":")
+        parts = rest.split()
+        if len(parts) == 2 and parts[1] == "kB":
+            fields[name] = int(parts[0]) * 1024
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+for _kind in ("rss", "pss", "uss"):
+    PROCESS_MEMORY.labels(_kind).set_function(lambda kind=_kind: (process_memory() or {}).get(kind, 0))
+
+
+class StageTimings:
+    """Stage durations for a single request, rendered as a ``Server-Timing`` header value.
+
+    Repeated stages (e.g. one ``llm_request`` per prompt) are summed, and the header ends
+    with a ``total`` entry covering the time since the object was created.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._durations: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._durations[stage] = self._durations.get(stage, 0.0) + seconds
+
+    def durations(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._durations)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def server_timing(self) -> str:
+        entries = list(self.durations().items())
+        entries.append(("total", time.perf_counter() - self._started))
+        return ", ".join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in entries)
+
+
+_ACTIVE_TIMINGS: ContextVar[StageTimings | None] = ContextVar("jra_stage_timings", default=None)
+
+
+@contextmanager
+def record_stages(timings: StageTimings | None) -> Iterator[None]:
+    """Also record :func:`time_stage` blocks run by this thread or task into ``timings``."""
+    if timings is None:
+        yield
+        return
+    token = _ACTIVE_TIMINGS.set(timings)
+    try:
+        yield
+    finally:
+        _ACTIVE_TIMINGS.reset(token)
+
+
+@contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    """Record the duration of the enclosed block under ``stage``."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.labels(stage).observe(elapsed)
+        timings = _ACTIVE_TIMINGS.get()
+        if timings is not None:
+            timings.record(stage, elapsed)
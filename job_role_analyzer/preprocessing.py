@@ -0,0 +1,174 @@
+"""Job description clean-up applied before embedding and prompting."""
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping
+
+from .metrics import PREPROCESS_TOKENS_SAVED
+
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CONSUMER = "embedding"
+
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_HEADING_MARKERS = "#*_-=: \t"
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+BOILERPLATE_HEADING_PATTERN = re.compile(
+    r"^(?:about (?:us|the company|our company|the team)|who we are|our (?:company|story|mission|values|culture)"
+    r"|benefits|perks|what we offer|why (?:join us|work here)|compensation(?: and benefits| & benefits)?"
+    r"|equal (?:employment )?opportunity|eeo|diversity(?:,| and| &) inclusion|legal|disclaimer"
+    r"|privacy(?: notice| policy)?|accommodations?|how to apply)\s*:?$",
+    re.IGNORECASE,
+)
+BOILERPLATE_SENTENCE_PATTERN = re.compile(
+    r"equal (?:employment )?opportunity employer|without regard to (?:race|age|sex|gender)"
+    r"|reasonable accommodations?|e-verify|background check|applicant privacy",
+    re.IGNORECASE,
+)
+
+
+def count_tokens(text: str) -> int:
+    """Approximate a subword tokenizer by counting words and punctuation marks."""
+    return sum(1 for _ in _TOKEN_PATTERN.finditer(text))
+
+
+def truncate_to_budget(text: str, budget: int) -> str:
+    if budget <= 0:
+        return text
+    for position, match in enumerate(_TOKEN_PATTERN.finditer(text), start=1):
+        if position == budget:
+            return text[: match.end()]
+    return text
+
+
+@dataclass
+class PreprocessedDescription:
+    original: str
+    cleaned: str
+    consumer_texts: Dict[str, str] = field(default_factory=dict)
+    original_tokens: int = 0
+    consumer_tokens: Dict[str, int] = field(default_factory=dict)
+
+    def for_consumer(self, consumer: str) -> str:
+        return self.consumer_texts.get(consumer, self.cleaned)
+
+    @property
+    def tokens_saved(self) -> Dict[str, int]:
+        return {
+            consumer: self.original_tokens - tokens
+            for consumer, tokens in self.consumer_tokens.items()
+        }
+
+    @property
+    def total_tokens_saved(self) -> int:
+        return sum(self.tokens_saved.values())
+
+    @classmethod
+    def passthrough(cls, text: str) -> "PreprocessedDescription":
+        return cls(original=text, cleaned=text)
+
+
+class JobDescriptionPreprocessor:
+    """Strips boilerplate sections, drops repeated paragraphs, and applies token budgets.
+
+    ``token_budgets`` maps a consumer name (``"embedding"`` or a prompt name) to the
+    maximum number of approximate tokens that consumer should receive.
+    """
+
+    def __init__(self, token_budgets: Mapping[str, int] | None = None) -> None:
+        self._token_budgets = dict(token_budgets or {})
+
+    def process(self, text: str) -> PreprocessedDescription:
+        kept: List[str] = []
+        seen: set[str] = set()
+        in_boilerplate = False
+        for block in _split_blocks(text):
+            heading = _heading_text(block)
+            if heading is not None:
+                in_boilerplate = bool(BOILERPLATE_HEADING_PATTERN.match(heading))
+            if in_boilerplate:
+                continue
+            block = _strip_boilerplate_sentences(block)
+            if not block:
+                continue
+            key = _WHITESPACE_PATTERN.sub(" ", block).strip().casefold()
+            if key in seen:
+                continue
+            seen.add(key)
+            kept.append(block)
+        # Never hand consumers an empty description just because it was all boilerplate.
+        cleaned = "\n\n".join(kept) if kept else text.strip()
+
+        consumer_texts = {
+            consumer: truncate_to_budget(cleaned, budget)
+            for consumer, budget in self._token_budgets.items()
+        }
+        result = PreprocessedDescription(
+            original=text,
+            cleaned=cleaned,
+            consumer_texts=consumer_texts,
+            original_tokens=count_tokens(text),
+            consumer_tokens={
+                consumer: count_tokens(consumer_text)
+                for consumer, consumer_text in consumer_texts.items()
+            },
+        )
+        for consumer, saved in result.tokens_saved.items():
+            PREPROCESS_TOKENS_SAVED.labels(consumer).inc(saved)
+        logger.debug(
+            "Preprocessed job description: %s tokens, saved %s",
+            result.original_tokens,
+            result.tokens_saved,
+        )
+        return result
+
+
+def _split_blocks(text: str) -> List[str]:
+    """Split on blank lines and additionally emit every heading line as its own block."""
+    blocks: List[str] = []
+    current: List[str] = []
+    for line in text.splitlines():
+        is_heading = _heading_text(line) is not None
+        if not line.strip() or is_heading:
+            if current:
+                blocks.append("\n".join(current).strip())
+                current = []
+            if is_heading:
+                blocks.append(line.strip())
+            continue
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current).strip())
+    return blocks
+
+
+def _strip_boilerplate_sentences(block: str) -> str:
+    """Drop only the boilerplate sentences of ``block``; other lines and sentences stay."""
+    if not BOILERPLATE_SENTENCE_PATTERN.search(block):
+        return block
+    lines: List[str] = []
+    for line in block.splitlines():
+        if BOILERPLATE_SENTENCE_PATTERN.search(line):
+            sentences = _SENTENCE_BOUNDARY.split(line.strip())
+            line = " ".join(sentence for sentence in sentences if not BOILERPLATE_SENTENCE_PATTERN.search(sentence))
+            if not line:
+                continue
+        lines.append(line)
+    return "\n".join(lines).strip()
+
+
+def _heading_text(line: str) -> str | None:
+    stripped = line.strip()
+    if "\n" in stripped or stripped.startswith(("- ", "* ", "\u2022")):
+        return None
+    text = stripped.strip(_HEADING_MARKERS)
+    if not text or len(text.split()) > 6 or text.endswith((".", "!", "?", ",", ";")):
+        return None
+    if stripped.startswith(("#", "**")) or stripped.endswith(":") or text.isupper() or text.istitle():
+        return text
+    return None
@@ -0,0 +1,76 @@
+"""Stdlib sampling profiler that captures every thread's stack into collapsed-stack format.
+
+The output (``frame;frame;...;leaf count`` per line) is what ``flamegraph.pl``,
+speedscope and similar tools read directly.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Callable, Dict, List
+
+
+class ProfilerBusy(RuntimeError):
+    """Raised when a profile is requested while another one is still running."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _collapse(frame: FrameType | None) -> List[str]:
+    labels: List[str] = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+class SamplingProfiler:
+    """Sample all live threads every ``interval`` seconds for a fixed duration.
+
+    Only one profile runs at a time; the sampling thread itself is left out of the output.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def profile(self, seconds: float, interval: float = 0.005) -> Counter[str]:
+        """Block for ``seconds`` while sampling and return stack counts keyed by collapsed stack."""
+        if seconds <= 0 or interval <= 0:
+            raise ValueError("seconds and interval must be positive")
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusy("A profile is already running.")
+        try:
+            return self._sample(seconds, interval)
+        finally:
+            self._lock.release()
+
+    def _sample(self, seconds: float, interval: float) -> Counter[str]:
+        own_ident = threading.get_ident()
+        stacks: Counter[str] = Counter()
+        deadline = self._clock() + seconds
+        while True:
+            names: Dict[int, str] = {thread.ident: thread.name for thread in threading.enumerate() if thread.ident}
+            frames = sys._current_frames()  # noqa: SLF001 - stdlib sampling hook
+            frames.pop(own_ident, None)
+            for ident, frame in frames.items():
+                stack = [names.get(ident, f"thread-{ident}"), *_collapse(frame)]
+                stacks[";".join(label.replace(";", ":") for label in stack)] += 1
+            # Holding frames keeps their locals alive between samples.
+            del frames
+            if self._clock() >= deadline:
+                return stacks
+            time.sleep(interval)
+
+
+def render_collapsed(stacks: Counter[str]) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
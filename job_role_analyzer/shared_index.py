@@ -0,0 +1,109 @@
+"""Read-only inner-product index over a memory-mapped file, shareable across forked workers.
+
+The file holds a small header, the L2-normalized float32 vectors and the raw 16-byte role
+IDs. Every process that maps it shares the same page-cache pages, so N workers pay for
+the index once instead of N times. IDs stay in the mapping and are only turned into
+``UUID`` objects for search hits, which keeps per-process Python objects off the heap.
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Iterable, List, Sequence, Tuple
+from uuid import UUID
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - executed when numpy is unavailable
+    np = None  # type: ignore[assignment]
+
+
+MAGIC = b"JRAIDX01"
+_HEADER = struct.Struct("<8sIQ")
+HEADER_SIZE = 64
+
+
+def write_index(path: str | os.PathLike[str], blocks: Iterable[Tuple[Sequence[UUID], Any]]) -> int:
+    """Stream ``(job_role_ids, matrix)`` blocks into an index file; returns the vector count."""
+    if np is None:
+        raise ModuleNotFoundError("numpy is required for the shared index.")
+    ids: List[bytes] = []
+    dimension = 0
+    with open(path, "wb") as handle:
+        handle.write(b"\0" * HEADER_SIZE)
+        for block_ids, block in blocks:
+            matrix = np.asarray(block, dtype=np.float32)
+            if matrix.ndim != 2 or not len(matrix):
+                continue
+            if dimension and matrix.shape[1] != dimension:
+                raise ValueError("Stored embeddings have inconsistent dimensionality.")
+            dimension = matrix.shape[1]
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            handle.write(np.ascontiguousarray(matrix / norms, dtype=np.float32).tobytes())
+            ids.extend(job_role_id.bytes for job_role_id in block_ids)
+        handle.write(b"".join(ids))
+        handle.seek(0)
+        handle.write(_HEADER.pack(MAGIC, dimension, len(ids)))
+    return len(ids)
+
+
+class SharedVectorIndex:
+    """Exact cosine search over a mapped index file, equivalent to ``faiss.IndexFlatIP``."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        if np is None:
+            raise ModuleNotFoundError("numpy is required for the shared index.")
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            magic, dimension, count = _HEADER.unpack(handle.read(_HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{self.path} is not a shared index file.")
+            size = os.fstat(handle.fileno()).st_size
+            self._mmap = mmap.mmap(handle.fileno(), size, access=mmap.ACCESS_READ) if size else None
+        self.dimension = int(dimension)
+        self.count = int(count)
+        vector_bytes = self.count * self.dimension * 4
+        if self._mmap is None or not self.count:
+            self._vectors = np.zeros((0, self.dimension), dtype=np.float32)
+            self._ids = np.zeros((0, 16), dtype=np.uint8)
+            return
+        self._vectors = np.frombuffer(self._mmap, dtype=np.float32, count=self.count * self.dimension, offset=HEADER_SIZE)
+        self._vectors = self._vectors.reshape(self.count, self.dimension)
+        self._ids = np.frombuffer(self._mmap, dtype=np.uint8, count=self.count * 16, offset=HEADER_SIZE + vector_bytes)
+        self._ids = self._ids.reshape(self.count, 16)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def job_role_id(self, position: int) -> UUID:
+        return UUID(bytes=self._ids[position].tobytes())
+
+    def search(self, matrix: Sequence[Sequence[float]], k: int) -> Tuple[List[List[float]], List[List[int]]]:
+        queries = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        queries = queries / norms
+        available = min(k, self.count)
+        distances: List[List[float]] = []
+        indices: List[List[int]] = []
+        for query in queries:
+            if not available:
+                distances.append([0.0] * k)
+                indices.append([-1] * k)
+                continue
+            scores = self._vectors @ query
+            top = np.argpartition(-scores, available - 1)[:available]
+            top = top[np.argsort(-scores[top])]
+            distances.append(scores[top].tolist() + [0.0] * (k - available))
+            indices.append(top.tolist() + [-1] * (k - available))
+        return distances, indices
+
+    def close(self) -> None:
+        # Views into the mapping must go first or mmap.close() raises BufferError.
+        self._vectors = self._ids = None  # type: ignore[assignment]
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
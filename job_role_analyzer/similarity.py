@@ -1,16 +1,10 @@
 from __future__ import annotations
 
-import math
-from typing import List, Protocol, Sequence, Tuple
+import logging
+from typing import Any, Iterable, List, Protocol, Sequence, Tuple
+from uuid import UUID
 
-try:  # pragma: no cover - exercised indirectly when faiss is installed
-    import faiss  # type: ignore
-    _FAISS_AVAILABLE = True
-except ModuleNotFoundError:  # pragma: no cover - fallback for environments without faiss
-    faiss = None  # type: ignore[assignment]
-    _FAISS_AVAILABLE = False
-
-try:  # pragma: no cover - numpy is optional when faiss isn't available
+try:  # pragma: no cover - numpy is optional
     import numpy as np
 except ModuleNotFoundError:  # pragma: no cover - fallback path when numpy is missing
     np = None  # type: ignore[assignment]
@@ -18,155 +12,275 @@ except ModuleNotFoundError:  # pragma: no cover - fallback path when numpy is mi
 from .config import load_config
 from .data_models import JobRoleSummary
 from .db import Database
+from .index_sidecar import SidecarError, SidecarIndexClient
+from .metrics import INDEX_SIZE, SIMILARITY_LOOKUPS, SIMILARITY_SCORE, time_stage
+from .shared_index import SharedVectorIndex
+from .vector_index import FlatIndex, matrix_dimension, matrix_rows
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_BATCH_SIZE = 32
+SIMILARITY_BACKENDS = ("faiss", "sidecar")
+
+EmbeddingMatrix = Any
+"""A 2-D float32 array when numpy is installed, otherwise a list of float lists."""
 
 
 class EmbeddingProvider(Protocol):
     def embed(self, text: str) -> Sequence[float]:
         ...
 
+    def embed_batch(
+        self,
+        texts: Sequence[str],
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    ) -> EmbeddingMatrix:
+        """Embed ``texts`` into one row per text.
 
-def _normalize_vector(vector: Sequence[float]) -> List[float]:
-    norm = math.sqrt(sum(component * component for component in vector))
-    if norm == 0:
-        return [0.0 for _ in vector]
-    return [component / norm for component in vector]
-
-
-def _dot(left: Sequence[float], right: Sequence[float]) -> float:
-    return sum(x * y for x, y in zip(left, right))
-
-
-class _FallbackFaissIndex:
-    """Lightweight FAISS substitute used when the library isn't available."""
-
-    def __init__(self, dimension: int) -> None:
-        self._dimension = dimension
-        self._vectors: List[List[float]] = []
-
-    def add(self, matrix: Sequence[Sequence[float]]) -> None:
-        for vector in matrix:
-            values = list(vector)
-            if len(values) != self._dimension:
-                raise ValueError("All vectors must match the index dimensionality.")
-            self._vectors.append(_normalize_vector(values))
-
-    def search(self, matrix: Sequence[Sequence[float]], k: int) -> Tuple[List[List[float]], List[List[int]]]:
-        requested_k = max(k, 0)
-        if not self._vectors:
-            zero_scores = [[0.0] * requested_k for _ in matrix]
-            zero_indices = [[-1] * requested_k for _ in matrix]
-            return zero_scores, zero_indices
-
-        results_scores: List[List[float]] = []
-        results_indices: List[List[int]] = []
-        for query in matrix:
-            values = list(query)
-            if len(values) != self._dimension:
-                raise ValueError("Query vectors must match the index dimensionality.")
-            normalized_query = _normalize_vector(values)
-            scores = [_dot(normalized_query, candidate) for candidate in self._vectors]
-            ranked = sorted(enumerate(scores), key=lambda item: item[1], reverse=True)
-            top = ranked[:requested_k]
-            padded_scores = [score for _, score in top]
-            padded_indices = [idx for idx, _ in top]
-            while len(padded_scores) < requested_k:
-                padded_scores.append(0.0)
-                padded_indices.append(-1)
-            results_scores.append(padded_scores)
-            results_indices.append(padded_indices)
-        return results_scores, results_indices
-
-
-class _FaissWrapper:
-    def __init__(self, dimension: int) -> None:
-        self._dimension = dimension
-        if _FAISS_AVAILABLE and np is not None:
-            self._index = faiss.IndexFlatIP(dimension)  # type: ignore[call-arg]
-        else:
-            self._index = _FallbackFaissIndex(dimension)
-        self._use_numpy = _FAISS_AVAILABLE and np is not None
-
-    def add(self, matrix: Sequence[Sequence[float]]) -> None:
-        if self._use_numpy:
-            array = np.array(matrix, dtype="float32")
-            faiss.normalize_L2(array)  # type: ignore[operator]
-            self._index.add(array)
-        else:
-            self._index.add(matrix)
-
-    def search(self, matrix: Sequence[Sequence[float]], k: int) -> Tuple[List[List[float]], List[List[int]]]:
-        if self._use_numpy:
-            array = np.array(matrix, dtype="float32")
-            faiss.normalize_L2(array)  # type: ignore[operator]
-            distances, indices = self._index.search(array, k)
-            return distances.tolist(), indices.tolist()
-        return self._index.search(matrix, k)
+        The default implementation calls :meth:`embed` per item; providers with a
+        native batched forward pass should override it.
+        """
+        return _stack_embeddings(self.embed(text) for text in texts)
+
+
+def embed_batch(
+    provider: EmbeddingProvider,
+    texts: Sequence[str],
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+) -> EmbeddingMatrix:
+    """Batch-embed ``texts`` with ``provider``, even if it only implements ``embed``."""
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+    method = getattr(provider, "embed_batch", None)
+    if callable(method):
+        return method(texts, batch_size=batch_size)
+    return _stack_embeddings(provider.embed(text) for text in texts)
+
+
+def _stack_embeddings(vectors: Iterable[Sequence[float]]) -> EmbeddingMatrix:
+    rows = list(vectors)
+    dimensions = {len(row) for row in rows}
+    if len(dimensions) > 1:
+        raise ValueError("Embedding provider returned vectors with inconsistent dimensionality.")
+    if np is None:
+        return [list(row) for row in rows]
+    if not rows:
+        return np.empty((0, 0), dtype="float32")
+    return np.ascontiguousarray(np.asarray(rows, dtype="float32"))
 
 
 class SimilarityChecker:
-    def __init__(self, db: Database, embedding_provider: EmbeddingProvider) -> None:
+    """Nearest-role lookup over stored embeddings.
+
+    With ``shared_index`` the stored vectors are searched through a memory-mapped
+    :class:`~job_role_analyzer.shared_index.SharedVectorIndex` instead of being loaded
+    from SQLite; roles added afterwards go to a small private index searched alongside it.
+
+    With ``similarity_backend: sidecar`` there is no local index at all: searches and
+    adds go to the :mod:`~job_role_analyzer.index_sidecar` process over its Unix socket,
+    and an unreachable sidecar degrades to a similarity miss.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        embedding_provider: EmbeddingProvider,
+        *,
+        shared_index: SharedVectorIndex | None = None,
+    ) -> None:
         self.db = db
         self.embedding_provider = embedding_provider
         self.config = load_config()
-        self._index: _FaissWrapper | None = None
-        self._job_roles: List[JobRoleSummary] = []
+        self._index: FlatIndex | None = None
+        self._job_role_ids: List[UUID] = []
         self._dimension: int | None = None
+        self._shared = shared_index
+        self._sidecar: SidecarIndexClient | None = None
+        if shared_index is not None and len(shared_index):
+            self._dimension = shared_index.dimension
         self._ensure_index_initialized()
 
     def _ensure_index_initialized(self) -> None:
-        if self.config.similarity_backend.lower() != "faiss":
-            raise ValueError("Only the 'faiss' similarity backend is currently supported.")
+        backend = self.config.similarity_backend.lower()
+        if backend not in SIMILARITY_BACKENDS:
+            raise ValueError(f"Unsupported similarity backend {backend!r}; expected one of {SIMILARITY_BACKENDS}.")
+        if backend == "sidecar":
+            if self._sidecar is None:
+                self._sidecar = SidecarIndexClient(
+                    self.config.similarity_sidecar_socket,
+                    timeout=self.config.similarity_sidecar_timeout_seconds,
+                )
+            return
+        if self._shared is not None:
+            INDEX_SIZE.set(self._index_size())
+            return
         if self._index is not None:
             return
-        embeddings: List[List[float]] = []
-        job_roles: List[JobRoleSummary] = []
-        for job_role, stored_embedding in self.db.iter_job_role_embeddings():
-            if stored_embedding:
-                job_roles.append(job_role)
-                embeddings.append(list(stored_embedding))
-        if not embeddings:
+        index: FlatIndex | None = None
+        job_role_ids: List[UUID] = []
+        for block_ids, block in self.db.iter_embedding_blocks(self.config.index_build_chunk_size):
+            dimension = matrix_dimension(block)
+            if index is None:
+                index = FlatIndex(dimension)
+                self._dimension = dimension
+            elif dimension != self._dimension:
+                raise ValueError("Stored embeddings have inconsistent dimensionality.")
+            index.add(block)
+            job_role_ids.extend(block_ids)
+        self._index = index
+        self._job_role_ids = job_role_ids
+        INDEX_SIZE.set(len(job_role_ids))
+
+    def rebuild_index(self) -> None:
+        """Discard the in-memory (and any shared) index and reload it from the database."""
+        if self._sidecar is not None:
+            INDEX_SIZE.set(self._sidecar.reload())
             return
-        self._dimension = len(embeddings[0])
-        self._index = _FaissWrapper(self._dimension)
-        self._index.add(embeddings)
-        self._job_roles = job_roles
+        self._shared = None
+        self._index = None
+        self._job_role_ids = []
+        self._dimension = None
+        self._ensure_index_initialized()
 
     def _prepare_query(self, job_description: str) -> List[List[float]]:
-        candidate_embedding = list(self.embedding_provider.embed(job_description))
+        return self._prepare_query_vector(self.embedding_provider.embed(job_description))
+
+    def _prepare_query_vector(self, embedding: Sequence[float]) -> List[List[float]]:
+        candidate_embedding = list(embedding)
         if not candidate_embedding:
             return []
         if self._dimension is not None and len(candidate_embedding) != self._dimension:
             raise ValueError("Embedding provider returned a vector with unexpected dimensionality.")
         return [candidate_embedding]
 
-    def find_similar_role(self, job_description: str) -> Tuple[JobRoleSummary, float] | None:
+    def find_similar_role_id(self, job_description: str) -> Tuple[UUID, float] | None:
         self._ensure_index_initialized()
-        if self._index is None:
+        if self._index is None and self._shared is None and self._sidecar is None:
             return None
-        query_matrix = self._prepare_query(job_description)
+        return self.find_similar_role_id_for_embedding(self.compute_embedding(job_description))
+
+    def find_similar_role_id_for_embedding(self, embedding: Sequence[float]) -> Tuple[UUID, float] | None:
+        """Search with a precomputed embedding, e.g. one that will also be persisted."""
+        self._ensure_index_initialized()
+        if self._index is None and self._shared is None and self._sidecar is None:
+            return None
+        query_matrix = self._prepare_query_vector(embedding)
         if not query_matrix:
             return None
-        distances, indices = self._index.search(query_matrix, k=1)
-        best_index = indices[0][0]
-        if best_index < 0:
+        try:
+            with time_stage("similarity_search"):
+                best = self._search_best(query_matrix)
+        except SidecarError as exc:
+            logger.warning("Similarity lookup failed; treating as a miss: %s", exc)
+            SIMILARITY_LOOKUPS.labels("error").inc()
             return None
-        similarity = float(distances[0][0])
+        if best is None:
+            SIMILARITY_LOOKUPS.labels("miss").inc()
+            return None
+        similarity, job_role_id = best
+        SIMILARITY_SCORE.observe(similarity)
         if similarity < self.config.job_role_similarity_threshold:
+            SIMILARITY_LOOKUPS.labels("miss").inc()
+            return None
+        SIMILARITY_LOOKUPS.labels("hit").inc()
+        return job_role_id, similarity
+
+    def _search_best(self, query_matrix: List[List[float]]) -> Tuple[float, UUID] | None:
+        best: Tuple[float, UUID] | None = None
+        if self._sidecar is not None:
+            distances, job_role_ids = self._sidecar.search(query_matrix, k=1)
+            if job_role_ids[0][0] is not None:
+                best = (float(distances[0][0]), job_role_ids[0][0])
+            return best
+        if self._shared is not None and len(self._shared):
+            distances, indices = self._shared.search(query_matrix, k=1)
+            if indices[0][0] >= 0:
+                best = (float(distances[0][0]), self._shared.job_role_id(indices[0][0]))
+        if self._index is not None:
+            distances, indices = self._index.search(query_matrix, k=1)
+            if indices[0][0] >= 0 and (best is None or distances[0][0] > best[0]):
+                best = (float(distances[0][0]), self._job_role_ids[indices[0][0]])
+        return best
+
+    def _index_size(self) -> int:
+        return (len(self._shared) if self._shared is not None else 0) + len(self._job_role_ids)
+
+    def find_similar_role(self, job_description: str) -> Tuple[JobRoleSummary, float] | None:
+        match = self.find_similar_role_id(job_description)
+        if match is None:
+            return None
+        job_role_id, similarity = match
+        job_role = self.db.get_job_role(job_role_id)
+        if job_role is None:
             return None
-        return self._job_roles[best_index], similarity
+        return job_role, similarity
 
     def compute_embedding(self, job_description: str) -> List[float]:
-        return list(self.embedding_provider.embed(job_description))
+        with time_stage("embedding"):
+            return list(self.embedding_provider.embed(job_description))
+
+    def compute_embeddings(
+        self,
+        texts: Sequence[str],
+        *,
+        batch_size: int | None = None,
+    ) -> EmbeddingMatrix:
+        with time_stage("embedding_batch"):
+            matrix = embed_batch(
+                self.embedding_provider,
+                texts,
+                batch_size=batch_size or self.config.embedding_batch_size,
+            )
+        if matrix_rows(matrix) != len(texts):
+            raise ValueError("Embedding provider returned an unexpected number of vectors.")
+        if (
+            self._dimension is not None
+            and matrix_rows(matrix)
+            and matrix_dimension(matrix) != self._dimension
+        ):
+            raise ValueError("Embedding provider returned a vector with unexpected dimensionality.")
+        return matrix
+
+    def backfill_embeddings(self, *, batch_size: int | None = None) -> int:
+        """Embed stored roles that have no vector yet and rebuild the index.
+
+        Roles are embedded from their normalized summary because the original job
+        description is not persisted. Returns the number of roles updated.
+        """
+        size = batch_size or self.config.embedding_batch_size
+        pending = list(self.db.iter_job_roles_missing_embeddings())
+        updated = 0
+        for start in range(0, len(pending), size):
+            chunk = pending[start : start + size]
+            matrix = self.compute_embeddings(
+                [job_role.normalized_summary for job_role in chunk],
+                batch_size=size,
+            )
+            self.db.update_embeddings(
+                (job_role.job_role_id, vector) for job_role, vector in zip(chunk, matrix)
+            )
+            updated += len(chunk)
+        if updated:
+            self.rebuild_index()
+        return updated
 
     def add_to_index(self, job_role: JobRoleSummary, embedding: Sequence[float]) -> None:
         vector = list(embedding)
         if not vector:
             return
+        if self._sidecar is not None:
+            try:
+                INDEX_SIZE.set(self._sidecar.add([job_role.job_role_id], [vector]))
+            except SidecarError as exc:
+                logger.warning("Could not add job role %s to the index sidecar: %s", job_role.job_role_id, exc)
+            return
+        if self._dimension is not None and len(vector) != self._dimension:
+            raise ValueError("Embedding dimensionality must remain consistent for FAISS index.")
         if self._index is None:
             self._dimension = len(vector)
-            self._index = _FaissWrapper(self._dimension)
-            self._job_roles = []
-        elif len(vector) != self._dimension:
-            raise ValueError("Embedding dimensionality must remain consistent for FAISS index.")
+            self._index = FlatIndex(self._dimension)
+            self._job_role_ids = []
         self._index.add([vector])
-        self._job_roles.append(job_role)
+        self._job_role_ids.append(job_role.job_role_id)
+        INDEX_SIZE.set(self._index_size())
@@ -0,0 +1,107 @@
+"""Exact cosine-similarity index shared by the in-process and sidecar similarity backends."""
+from __future__ import annotations
+
+import math
+from typing import Any, List, Sequence, Tuple
+
+try:  # pragma: no cover - exercised indirectly when faiss is installed
+    import faiss  # type: ignore
+    FAISS_AVAILABLE = True
+except ModuleNotFoundError:  # pragma: no cover - fallback for environments without faiss
+    faiss = None  # type: ignore[assignment]
+    FAISS_AVAILABLE = False
+
+try:  # pragma: no cover - numpy is optional when faiss isn't available
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - fallback path when numpy is missing
+    np = None  # type: ignore[assignment]
+
+
+def matrix_rows(matrix: Any) -> int:
+    return int(matrix.shape[0]) if hasattr(matrix, "shape") else len(matrix)
+
+
+def matrix_dimension(matrix: Any) -> int:
+    if hasattr(matrix, "shape"):
+        return int(matrix.shape[1]) if len(matrix.shape) == 2 else 0
+    return len(matrix[0]) if matrix else 0
+
+
+def normalize_vector(vector: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(component * component for component in vector))
+    if norm == 0:
+        return [0.0 for _ in vector]
+    return [component / norm for component in vector]
+
+
+def dot(left: Sequence[float], right: Sequence[float]) -> float:
+    return sum(x * y for x, y in zip(left, right))
+
+
+class _FallbackFaissIndex:
+    """Lightweight FAISS substitute used when the library isn't available."""
+
+    def __init__(self, dimension: int) -> None:
+        self._dimension = dimension
+        self._vectors: List[List[float]] = []
+
+    def add(self, matrix: Sequence[Sequence[float]]) -> None:
+        for vector in matrix:
+            values = list(vector)
+            if len(values) != self._dimension:
+                raise ValueError("All vectors must match the index dimensionality.")
+            self._vectors.append(normalize_vector(values))
+
+    def search(self, matrix: Sequence[Sequence[float]], k: int) -> Tuple[List[List[float]], List[List[int]]]:
+        requested_k = max(k, 0)
+        if not self._vectors:
+            zero_scores = [[0.0] * requested_k for _ in matrix]
+            zero_indices = [[-1] * requested_k for _ in matrix]
+            return zero_scores, zero_indices
+
+        results_scores: List[List[float]] = []
+        results_indices: List[List[int]] = []
+        for query in matrix:
+            values = list(query)
+            if len(values) != self._dimension:
+                raise ValueError("Query vectors must match the index dimensionality.")
+            normalized_query = normalize_vector(values)
+            scores = [dot(normalized_query, candidate) for candidate in self._vectors]
+            ranked = sorted(enumerate(scores), key=lambda item: item[1], reverse=True)
+            top = ranked[:requested_k]
+            padded_scores = [score for _, score in top]
+            padded_indices = [idx for idx, _ in top]
+            while len(padded_scores) < requested_k:
+                padded_scores.append(0.0)
+                padded_indices.append(-1)
+            results_scores.append(padded_scores)
+            results_indices.append(padded_indices)
+        return results_scores, results_indices
+
+
+class FlatIndex:
+    """Exact inner-product index over L2-normalized vectors: faiss when installed, else pure Python."""
+
+    def __init__(self, dimension: int) -> None:
+        self._dimension = dimension
+        if FAISS_AVAILABLE and np is not None:
+            self._index = faiss.IndexFlatIP(dimension)  # type: ignore[call-arg]
+        else:
+            self._index = _FallbackFaissIndex(dimension)
+        self._use_numpy = FAISS_AVAILABLE and np is not None
+
+    def add(self, matrix: Sequence[Sequence[float]]) -> None:
+        if self._use_numpy:
+            array = np.array(matrix, dtype="float32")
+            faiss.normalize_L2(array)  # type: ignore[operator]
+            self._index.add(array)
+        else:
+            self._index.add(matrix)
+
+    def search(self, matrix: Sequence[Sequence[float]], k: int) -> Tuple[List[List[float]], List[List[int]]]:
+        if self._use_numpy:
+            array = np.array(matrix, dtype="float32")
+            faiss.normalize_L2(array)  # type: ignore[operator]
+            distances, indices = self._index.search(array, k)
+            return distances.tolist(), indices.tolist()
+        return self._index.search(matrix, k)
@@ -1,8 +1,16 @@
-"""Minimal Pydantic-compatible shim for environments without the dependency."""
+"""Minimal Pydantic-compatible shim for environments without the dependency.
+
+Field metadata, validators and coercers are compiled once per model class when the class
+is created, so instantiation is a single pass over a precomputed tuple. Models may opt
+into a ``__slots__`` layout with ``model_config = ConfigDict(slots=True)``, and
+:meth:`BaseModel.model_construct` builds instances from trusted data without validation.
+"""
 from __future__ import annotations
 
+import sys
 from dataclasses import MISSING
-from typing import Any, Callable, Dict, Optional
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Optional, Tuple, Union, get_args, get_origin
 
 
 class ConfigDict(dict):
@@ -28,36 +36,183 @@ def field_validator(name: str, *, mode: str = "after") -> Callable[[Callable[...
     return decorator
 
 
-class BaseModel:
+_SCALAR_TYPES = (int, float, str, bool)
+_Coercer = Optional[Callable[[Any], Any]]
+
+
+class _CompiledField:
+    __slots__ = ("name", "default", "default_factory", "before", "coerce", "after")
+
+    def __init__(
+        self,
+        name: str,
+        info: _FieldInfo,
+        before: Tuple[Callable[..., Any], ...],
+        coerce: _Coercer,
+        after: Tuple[Callable[..., Any], ...],
+    ) -> None:
+        self.name = name
+        self.default = info.default
+        self.default_factory = info.default_factory
+        self.before = before
+        self.coerce = coerce
+        self.after = after
+
+    def missing_value(self) -> Any:
+        if self.default is not MISSING:
+            return self.default
+        if self.default_factory is not None:
+            return self.default_factory()
+        raise ValueError(f"Missing value for field '{self.name}'")
+
+
+def _compile_fields(cls: type) -> Tuple[_CompiledField, ...]:
+    model_classes = [klass for klass in reversed(cls.__mro__) if isinstance(klass, _ModelMeta)]
+    annotations: Dict[str, Any] = {}
+    validators: Dict[str, Dict[str, list[Callable[..., Any]]]] = {}
+    for klass in model_classes:
+        for field_name, annotation in klass.__dict__.get("__annotations__", {}).items():
+            if not field_name.startswith("model_"):
+                annotations[field_name] = annotation
+        for field_name, modes in _collect_validators(klass).items():
+            for mode, functions in modes.items():
+                validators.setdefault(field_name, {}).setdefault(mode, []).extend(functions)
+
+    compiled = []
+    for field_name, annotation in annotations.items():
+        compiled.append(
+            _CompiledField(
+                field_name,
+                _field_info(cls, field_name),
+                tuple(validators.get(field_name, {}).get("before", [])),
+                _compile_coercer(_resolve_annotation(cls, annotation)),
+                tuple(validators.get(field_name, {}).get("after", [])),
+            )
+        )
+    return tuple(compiled)
+
+
+def _compile_constructor(cls: type, fields: Tuple[_CompiledField, ...]) -> Callable[[type, Dict[str, Any]], Any]:
+    """Generate a straight-line ``model_construct`` body for ``cls``.
+
+    Slot fields are written through their member descriptors, which avoids the generic
+    ``object.__setattr__`` lookup on every assignment.
+    """
+    namespace: Dict[str, Any] = {"_new": object.__new__, "_setattr": object.__setattr__, "_fields": fields}
+    lines = ["def construct(cls, values):", "    self = _new(cls)"]
+    for position, field in enumerate(fields):
+        descriptor = getattr(cls, field.name, None)
+        if isinstance(descriptor, MemberDescriptorType):
+            setter = f"_set_{position}"
+            namespace[setter] = descriptor.__set__
+            assign = f"{setter}(self, {{value}})"
+        else:
+            assign = f"_setattr(self, {field.name!r}, {{value}})"
+        lines.append(f"    if {field.name!r} in values:")
+        lines.append("        " + assign.format(value=f"values[{field.name!r}]"))
+        if field.default is not MISSING or field.default_factory is not None:
+            lines.append("    else:")
+            lines.append("        " + assign.format(value=f"_fields[{position}].missing_value()"))
+    lines.append("    return self")
+    exec("\n".join(lines), namespace)  # noqa: S102 - source is built from field names only
+    return namespace["construct"]
+
+
+def _field_info(cls: type, field_name: str) -> _FieldInfo:
+    for klass in cls.__mro__:
+        defaults = klass.__dict__.get("__shim_defaults__", {})
+        if field_name in defaults:
+            default = defaults[field_name]
+            break
+        if field_name in klass.__dict__ and not isinstance(klass.__dict__[field_name], MemberDescriptorType):
+            default = klass.__dict__[field_name]
+            break
+    else:
+        return _FieldInfo()
+    return default if isinstance(default, _FieldInfo) else _FieldInfo(default)
+
+
+def _resolve_annotation(cls: type, annotation: Any) -> Any:
+    """Evaluate string annotations (``from __future__ import annotations``) where possible."""
+    if not isinstance(annotation, str):
+        return annotation
+    module = sys.modules.get(cls.__module__)
+    try:
+        return eval(annotation, dict(vars(module)) if module else {}, {cls.__name__: cls})  # noqa: S307
+    except Exception:
+        return None
+
+
+def _compile_coercer(annotation: Any) -> _Coercer:
+    if annotation in _SCALAR_TYPES:
+        return _scalar_coercer(annotation)
+    if get_origin(annotation) is Union:
+        members = [member for member in get_args(annotation) if member is not type(None)]
+        if len(members) == 1 and members[0] in _SCALAR_TYPES:
+            coerce = _scalar_coercer(members[0])
+            return lambda value: None if value is None else coerce(value)
+    return None
+
+
+def _scalar_coercer(target: type) -> Callable[[Any], Any]:
+    def coerce(value: Any) -> Any:
+        if type(value) is target:
+            return value
+        try:
+            return target(value)
+        except Exception as exc:  # pragma: no cover
+            raise ValueError(f"Unable to coerce value '{value}' to {target}") from exc
+
+    return coerce
+
+
+def _collect_validators(cls: type) -> Dict[str, Dict[str, list[Callable[..., Any]]]]:
+    validators: Dict[str, Dict[str, list[Callable[..., Any]]]] = {}
+    for attribute in cls.__dict__.values():
+        if callable(attribute) and hasattr(attribute, "__field_name__"):
+            name = getattr(attribute, "__field_name__")
+            mode = getattr(attribute, "__field_mode__", "after")
+            validators.setdefault(name, {}).setdefault(mode, []).append(attribute)
+    return validators
+
+
+class _ModelMeta(type):
+    def __new__(mcs, name: str, bases: tuple, namespace: Dict[str, Any], **kwargs: Any) -> "_ModelMeta":
+        config = namespace.get("model_config") or {}
+        if config.get("slots") and "__slots__" not in namespace:
+            annotations = namespace.get("__annotations__", {})
+            inherited = {slot for base in bases for slot in getattr(base, "__slots__", ())}
+            # Slot descriptors replace class attributes, so defaults move aside first.
+            namespace["__shim_defaults__"] = {
+                field: namespace.pop(field) for field in annotations if field in namespace
+            }
+            namespace["__slots__"] = tuple(field for field in annotations if field not in inherited)
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls.__shim_fields__ = _compile_fields(cls)
+        cls.__shim_construct__ = staticmethod(_compile_constructor(cls, cls.__shim_fields__))
+        return cls
+
+
+class BaseModel(metaclass=_ModelMeta):
+    __slots__ = ()
     model_config: ConfigDict = ConfigDict()
 
     def __init__(self, **data: Any) -> None:
-        values = self._validate_dict(data if isinstance(data, dict) else data.__dict__)
-        for key, value in values.items():
+        for key, value in self._validate_dict(data).items():
             object.__setattr__(self, key, value)
 
     @classmethod
     def _validate_dict(cls, data: Dict[str, Any]) -> Dict[str, Any]:
-        annotations = getattr(cls, "__annotations__", {})
         field_values: Dict[str, Any] = {}
-        validators = _collect_validators(cls)
-        for field_name, annotation in annotations.items():
-            info = getattr(cls, field_name, _FieldInfo())
-            if isinstance(info, _FieldInfo):
-                if field_name in data:
-                    value = data[field_name]
-                elif info.default is not MISSING:
-                    value = info.default
-                elif info.default_factory is not None:
-                    value = info.default_factory()
-                else:
-                    raise ValueError(f"Missing value for field '{field_name}'")
-            else:
-                value = data.get(field_name, info)
-            value = _apply_validators(validators, field_name, value, mode="before")
-            value = _coerce(annotation, value)
-            value = _apply_validators(validators, field_name, value, mode="after")
-            field_values[field_name] = value
+        for field in cls.__shim_fields__:
+            value = data[field.name] if field.name in data else field.missing_value()
+            for validator in field.before:
+                value = validator(cls, value)
+            if field.coerce is not None:
+                value = field.coerce(value)
+            for validator in field.after:
+                value = validator(cls, value)
+            field_values[field.name] = value
         return field_values
 
     @classmethod
@@ -72,8 +227,13 @@ class BaseModel:
             object.__setattr__(instance, key, value)
         return instance
 
+    @classmethod
+    def model_construct(cls, **values: Any) -> "BaseModel":
+        """Build an instance from trusted data, skipping validators and coercion."""
+        return cls.__shim_construct__(cls, values)
+
     def model_dump(self) -> Dict[str, Any]:
-        return {field: getattr(self, field) for field in getattr(self, "__annotations__", {})}
+        return {field.name: getattr(self, field.name) for field in self.__shim_fields__}
 
     def __repr__(self) -> str:  # pragma: no cover
         fields = ", ".join(f"{key}={value!r}" for key, value in self.model_dump().items())
@@ -83,38 +243,3 @@ class BaseModel:
         if not isinstance(other, BaseModel):
             return NotImplemented
         return self.model_dump() == other.model_dump()
-
-
-def _collect_validators(cls: type) -> Dict[str, Dict[str, list[Callable[..., Any]]]]:
-    validators: Dict[str, Dict[str, list[Callable[..., Any]]]] = {}
-    for attribute in cls.__dict__.values():
-        if callable(attribute) and hasattr(attribute, "__field_name__"):
-            name = getattr(attribute, "__field_name__")
-            mode = getattr(attribute, "__field_mode__", "after")
-            validators.setdefault(name, {}).setdefault(mode, []).append(attribute)
-    return validators
-
-
-def _apply_validators(
-    validators: Dict[str, Dict[str, list[Callable[..., Any]]]],
-    field_name: str,
-    value: Any,
-    *,
-    mode: str,
-) -> Any:
-    for validator in validators.get(field_name, {}).get(mode, []):
-        value = validator(None, value)  # type: ignore[arg-type]
-    return value
-
-
-def _coerce(annotation: Any, value: Any) -> Any:
-    origin = getattr(annotation, "__origin__", None)
-    if origin is Optional and value is None:
-        return None
-    target = getattr(annotation, "__args__", [annotation])[0] if origin is Optional else annotation
-    try:
-        if target in (int, float, str, bool):
-            return target(value)
-    except Exception as exc:  # pragma: no cover
-        raise ValueError(f"Unable to coerce value '{value}' to {target}") from exc
-    return value
@@ -0,0 +1,164 @@
+import asyncio
+import json
+
+import pytest
+
+from webapp.admission import (
+    PRIORITY_CACHED,
+    PRIORITY_DEFAULT,
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionRejected,
+)
+
+
+def test_controller_serves_cached_requests_first_and_sheds_when_full():
+    async def scenario():
+        controller = AdmissionController(limit=1, max_queue=2, queue_timeout=5.0, initial_service_seconds=0.01)
+        order = []
+
+        async def request(name, priority):
+            await controller.acquire(priority)
+            order.append(name)
+            await asyncio.sleep(0)
+            controller.release(0.01)
+
+        await controller.acquire()  # occupy the only slot
+        slow = asyncio.create_task(request("miss", PRIORITY_DEFAULT))
+        await asyncio.sleep(0)
+        hit = asyncio.create_task(request("hit", PRIORITY_CACHED))
+        await asyncio.sleep(0)
+        assert controller.queued == 2
+
+        # Queue is full: another miss is shed, a cache hit displaces the queued miss.
+        with pytest.raises(AdmissionRejected) as shed:
+            await controller.acquire(PRIORITY_DEFAULT)
+        assert shed.value.retry_after >= 1
+        second_hit = asyncio.create_task(request("hit-2", PRIORITY_CACHED))
+        await asyncio.sleep(0)
+
+        controller.release(0.01)
+        await asyncio.gather(hit, second_hit)
+        with pytest.raises(AdmissionRejected):
+            await slow
+        return order, controller.stats()
+
+    order, stats = asyncio.run(scenario())
+    assert order == ["hit", "hit-2"]
+    assert stats["rejected"] == 2 and stats["active"] == 0 and stats["queued"] == 0
+
+
+def test_controller_rejects_when_estimated_wait_exceeds_deadline():
+    async def scenario():
+        controller = AdmissionController(limit=1, max_queue=10, queue_timeout=0.5, initial_service_seconds=2.0)
+        await controller.acquire()
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        return rejected.value
+
+    rejection = asyncio.run(scenario())
+    assert "deadline" in rejection.reason
+    assert rejection.retry_after >= 2
+
+
+def test_controller_queues_slow_requests_when_slots_free_up_in_turn():
+    async def scenario():
+        controller = AdmissionController(limit=8, max_queue=64, queue_timeout=10.0, initial_service_seconds=12.0)
+        for _ in range(8):
+            await controller.acquire()
+        waiter = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        queued = controller.queued
+        controller.release(12.0)
+        await waiter
+        return queued, controller.estimated_wait(0), controller.estimated_wait(7)
+
+    queued, first, eighth = asyncio.run(scenario())
+    assert queued == 1
+    assert first == pytest.approx(1.5)
+    assert eighth == pytest.approx(12.0)
+
+
+def test_middleware_returns_503_with_retry_after_and_replays_body():
+    controller = AdmissionController(limit=1, max_queue=0, queue_timeout=1.0)
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["body"] = (await receive())["body"]
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def classify(scope, body):
+        seen["classified"] = json.loads(body)
+        return PRIORITY_CACHED
+
+    middleware = AdmissionMiddleware(
+        app,
+        controllers={("POST", "/api/analyze"): controller},
+        classifiers={("POST", "/api/analyze"): classify},
+    )
+
+    async def call():
+        sent = []
+        messages = [{"type": "http.request", "body": b'{"a": 1}', "more_body": False}]
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await middleware({"type": "http", "method": "POST", "path": "/api/analyze"}, receive, send)
+        return sent
+
+    async def scenario():
+        admitted = await call()
+        await controller.acquire()
+        shed = await call()
+        return admitted, shed
+
+    admitted, shed = asyncio.run(scenario())
+    assert admitted[0]["status"] == 200
+    assert dict(admitted[0]["headers"])[b"server-timing"].startswith(b"admission;dur=")
+    assert seen == {"classified": {"a": 1}, "body": b'{"a": 1}'}
+    assert shed[0]["status"] == 503
+    assert dict(shed[0]["headers"])[b"retry-after"] == b"1"
+
+
+def test_middleware_refuses_oversized_bodies_before_buffering_them():
+    controller = AdmissionController(limit=1, max_queue=0, queue_timeout=1.0)
+    reached = []
+
+    async def app(scope, receive, send):
+        reached.append(scope["path"])
+
+    async def classify(scope, body):
+        reached.append("classifier")
+        return PRIORITY_DEFAULT
+
+    middleware = AdmissionMiddleware(
+        app,
+        controllers={("POST", "/api/analyze"): controller},
+        classifiers={("POST", "/api/analyze"): classify},
+        max_body_bytes=8,
+    )
+
+    async def call(headers, chunks):
+        sent = []
+        messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "path": "/api/analyze", "headers": headers}
+        await middleware(scope, receive, send)
+        return sent, len(messages)
+
+    declared, unread = asyncio.run(call([(b"content-length", b"4096")], [b"x" * 4096]))
+    assert declared[0]["status"] == 413 and unread == 1
+    streamed, unread = asyncio.run(call([], [b"12345", b"67890", b"never read"]))
+    assert streamed[0]["status"] == 413 and unread == 1
+    assert reached == [] and controller.stats()["active"] == 0
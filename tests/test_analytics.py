@@ -0,0 +1,94 @@
+import threading
+import time
+
+from job_role_analyzer import analytics
+from job_role_analyzer.analytics import experience_band, title_key
+from job_role_analyzer.data_models import Competency, JobRoleSummary
+from job_role_analyzer.db import Database
+
+
+def _snapshot(database):
+    connection = database._connection  # noqa: SLF001 - comparing aggregate tables directly
+    title_rows = connection.execute(
+        "SELECT title_key, experience_band, name_id, role_count, level_sum FROM competency_title_stats ORDER BY 1, 2, 3"
+    ).fetchall()
+    level_rows = connection.execute(
+        "SELECT name_id, level, role_count FROM competency_level_stats ORDER BY 1, 2"
+    ).fetchall()
+    return [tuple(row) for row in title_rows], [tuple(row) for row in level_rows]
+
+
+def test_keys_normalise_titles_and_band_experience():
+    assert title_key("  Data   ENGINEER ") == "data engineer"
+    assert [experience_band(years) for years in (0, 2, 3, 5, 6, 9, 10, 30)] == [
+        "0-2", "0-2", "3-5", "3-5", "6-9", "6-9", "10+", "10+",
+    ]
+
+
+def test_aggregates_track_inserts_and_replacements(tmp_path):
+    database = Database(path=str(tmp_path / "analytics.sqlite"))
+    try:
+        first = JobRoleSummary(job_title="Data Engineer", normalized_summary="Pipelines", years_experience=4)
+        second = JobRoleSummary(job_title="data engineer", normalized_summary="Warehouses", years_experience=5)
+        senior = JobRoleSummary(job_title="Data Engineer", normalized_summary="Platforms", years_experience=12)
+        database.add_job_role(first, [Competency(name="Python", level=4), Competency(name="SQL", level=3)])
+        database.add_job_role(second, [Competency(name="python", level=2)])
+        database.add_job_role(senior, [Competency(name="SQL", level=5)])
+
+        assert database.top_competencies("Data Engineer", 3) == [
+            {"name": "Python", "role_count": 2, "average_level": 3.0},
+            {"name": "SQL", "role_count": 1, "average_level": 3.0},
+        ]
+        assert database.top_competencies("DATA ENGINEER", limit=1) == [
+            {"name": "Python", "role_count": 2, "average_level": 3.0},
+        ]
+        assert database.competency_level_distribution(" sql ") == {3: 1, 5: 1}
+        assert database.competency_level_distribution("Rust") is None
+
+        database.add_job_role(second, [Competency(name="SQL", level=3)])
+        assert database.competency_level_distribution("Python") == {4: 1}
+        assert database.top_competencies("Data Engineer", 4)[0] == {
+            "name": "SQL",
+            "role_count": 2,
+            "average_level": 3.0,
+        }
+
+        incremental = _snapshot(database)
+        database.recompute_analytics()
+        assert _snapshot(database) == incremental
+    finally:
+        database.close()
+
+
+def test_concurrent_rewrites_from_two_processes_keep_aggregates_exact(tmp_path, monkeypatch):
+    apply_role_delta = analytics.apply_role_delta
+
+    def slow_apply_role_delta(connection, *args, sign):
+        # Widen the gap between reading the previous row and writing its delta.
+        if sign < 0:
+            time.sleep(0.005)
+        apply_role_delta(connection, *args, sign=sign)
+
+    monkeypatch.setattr(analytics, "apply_role_delta", slow_apply_role_delta)
+    path = str(tmp_path / "analytics.sqlite")
+    databases = [Database(path=path), Database(path=path)]
+    role = JobRoleSummary(job_title="Data Engineer", normalized_summary="Pipelines", years_experience=4)
+    try:
+        databases[0].add_job_role(role, [Competency(name="Python", level=3)])
+
+        def rewrite(database, level):
+            for _ in range(25):
+                database.add_job_role(role, [Competency(name="Python", level=level)])
+
+        threads = [threading.Thread(target=rewrite, args=(database, level)) for database, level in zip(databases, (2, 5))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        incremental = _snapshot(databases[0])
+        databases[0].recompute_analytics()
+        assert incremental == _snapshot(databases[0])
+    finally:
+        for database in databases:
+            database.close()
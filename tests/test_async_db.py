@@ -0,0 +1,85 @@
+import asyncio
+import threading
+
+import pytest
+
+from job_role_analyzer.async_db import AsyncDatabase
+from job_role_analyzer.data_models import Competency, JobRoleSummary
+from job_role_analyzer.db import Database, StoredJobRole
+
+
+def _role(title):
+    return JobRoleSummary(job_title=title, normalized_summary=f"{title} summary", years_experience=3)
+
+
+def test_async_database_reads_and_writes_off_the_loop(tmp_path):
+    database = Database(path=str(tmp_path / "async.sqlite"))
+    facade = AsyncDatabase(database, reader_threads=2)
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        writer_threads = set()
+
+        def record_writer():
+            writer_threads.add(threading.current_thread().name)
+
+        role = _role("Analyst")
+        await facade.add_job_role(role, [Competency(name="SQL", level=3)], content_hash="abc")
+        others = [_role(f"Role {index}") for index in range(3)]
+        await facade.add_job_roles(
+            [StoredJobRole(job_role=item, competencies=[Competency(name="Excel", level=2)]) for item in others]
+        )
+        await asyncio.gather(*(facade.run_write(record_writer) for _ in range(5)))
+
+        stored = await facade.get_job_role_with_competencies(role.job_role_id)
+        many = await facade.get_many(item.job_role_id for item in others)
+        found = await facade.find_job_role_id_by_content_hash("abc")
+        reader_thread = await facade.run_read(threading.get_ident)
+        return loop_thread, writer_threads, stored, many, found, reader_thread, role, others
+
+    try:
+        loop_thread, writer_threads, stored, many, found, reader_thread, role, others = asyncio.run(scenario())
+    finally:
+        facade.close()
+        database.close()
+
+    assert [comp.name for comp in stored.competencies] == ["SQL"]
+    assert set(many) == {item.job_role_id for item in others}
+    assert found == role.job_role_id
+    assert reader_thread != loop_thread
+    assert len(writer_threads) == 1 and next(iter(writer_threads)).startswith("db-writer")
+
+
+def test_async_transaction_commits_atomically_and_rolls_back(tmp_path):
+    database = Database(path=str(tmp_path / "async_tx.sqlite"))
+    facade = AsyncDatabase(database)
+    committed = _role("Committed")
+    discarded = _role("Discarded")
+
+    async def scenario():
+        cached_before = await facade.get_job_role_with_competencies(committed.job_role_id)
+        async with facade.transaction() as tx:
+            await tx.add_job_role(committed, [Competency(name="Go", level=4)])
+            rows = await tx.execute("SELECT COUNT(*) AS n FROM job_roles")
+            assert rows[0]["n"] == 1
+
+        with pytest.raises(RuntimeError):
+            async with facade.transaction() as tx:
+                await tx.add_job_role(discarded, [Competency(name="Rust", level=4)])
+                raise RuntimeError("abort")
+
+        return (
+            cached_before,
+            await facade.get_job_role_with_competencies(committed.job_role_id),
+            await facade.get_job_role(discarded.job_role_id),
+        )
+
+    try:
+        cached_before, stored, missing = asyncio.run(scenario())
+    finally:
+        facade.close()
+        database.close()
+
+    assert cached_before is None
+    assert [comp.name for comp in stored.competencies] == ["Go"]
+    assert missing is None
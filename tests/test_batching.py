@@ -0,0 +1,88 @@
+import threading
+
+import pytest
+
+from job_role_analyzer.batching import MicroBatchingEmbeddingProvider
+
+
+class RecordingBatchProvider:
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+
+    def embed(self, text):
+        return [float(len(text)), 1.0]
+
+    def embed_batch(self, texts, batch_size=32):
+        self.release.wait(timeout=5)
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class FailingBatchProvider:
+    def embed(self, text):
+        raise RuntimeError("model offline")
+
+
+def test_dispatcher_coalesces_concurrent_calls():
+    provider = RecordingBatchProvider()
+    dispatcher = MicroBatchingEmbeddingProvider(provider, max_batch_size=8, max_wait_ms=200)
+    try:
+        futures = [dispatcher.submit("x" * length) for length in range(1, 5)]
+        provider.release.set()
+
+        assert [future.result(timeout=5) for future in futures] == [
+            [1.0, 1.0],
+            [2.0, 1.0],
+            [3.0, 1.0],
+            [4.0, 1.0],
+        ]
+        assert provider.batches == [["x", "xx", "xxx", "xxxx"]]
+        stats = dispatcher.stats()
+        assert stats["batch_size"]["count"] == 1
+        assert stats["batch_size"]["sum"] == 4
+        assert stats["queue_wait_seconds"]["count"] == 4
+    finally:
+        dispatcher.close()
+
+
+def test_dispatcher_respects_max_batch_size():
+    provider = RecordingBatchProvider()
+    provider.release.set()
+    dispatcher = MicroBatchingEmbeddingProvider(provider, max_batch_size=2, max_wait_ms=50)
+    try:
+        futures = [dispatcher.submit(text) for text in ("a", "b", "c")]
+        for future in futures:
+            future.result(timeout=5)
+        assert all(len(batch) <= 2 for batch in provider.batches)
+        assert sum(len(batch) for batch in provider.batches) == 3
+    finally:
+        dispatcher.close()
+
+
+def test_dispatcher_propagates_errors_and_rejects_after_close():
+    dispatcher = MicroBatchingEmbeddingProvider(FailingBatchProvider(), max_wait_ms=0)
+    with pytest.raises(RuntimeError, match="model offline"):
+        dispatcher.embed("text")
+    dispatcher.close()
+    with pytest.raises(RuntimeError):
+        dispatcher.submit("late")
+
+
+class ShortBatchProvider:
+    def embed(self, text):
+        return [1.0]
+
+    def embed_batch(self, texts, batch_size=32):
+        return [[1.0]] * (len(texts) - 1)
+
+
+def test_dispatcher_fails_every_caller_on_short_batch():
+    dispatcher = MicroBatchingEmbeddingProvider(ShortBatchProvider(), max_batch_size=8, max_wait_ms=200)
+    try:
+        futures = [dispatcher.submit(text) for text in ("a", "b", "c")]
+        for future in futures:
+            with pytest.raises(ValueError, match="2 vectors for 3 texts"):
+                future.result(timeout=5)
+    finally:
+        dispatcher.close()
@@ -0,0 +1,28 @@
+from benchmarks.compare import compare
+from benchmarks.corpus import make_role
+from benchmarks.suite import run
+
+
+def test_corpus_roles_are_deterministic_and_unique():
+    assert make_role(3, seed=1) == make_role(3, seed=1)
+    assert make_role(3, seed=1).job_description != make_role(4, seed=1).job_description
+
+
+def test_suite_reports_every_path_and_compares_against_baseline():
+    results = run(40, queries=10, embedder_name="stub", repeat=1)
+    metrics = results["metrics"]
+    for name in (
+        "cold_start_seconds",
+        "index_build_seconds",
+        "search_latency_us_p99",
+        "hit_requests_per_second",
+        "miss_requests_per_second",
+    ):
+        assert metrics[name] > 0
+
+    baseline = {"parameters": results["parameters"], "metrics": dict(metrics)}
+    baseline["metrics"]["hit_requests_per_second"] = metrics["hit_requests_per_second"] * 2
+    baseline["metrics"]["search_latency_us_p99"] = metrics["search_latency_us_p99"] * 2
+    comparison = compare(results, baseline, tolerance=0.2)
+    assert comparison["regressions"] == ["hit_requests_per_second"]
+    assert comparison["parameter_mismatches"] == {}
@@ -0,0 +1,46 @@
+from job_role_analyzer.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_evicts_least_recently_used_and_tracks_hits():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert stats["hit_ratio"] == 0.75
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = LRUCache(4, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+    clock.now = 9.5
+    assert cache.get("a") == 1
+    clock.now = 10.5
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_drops_puts_from_stale_generations():
+    cache = LRUCache(4)
+    generation = cache.generation
+    cache.invalidate("a")
+    cache.put("a", "stale", generation=generation)
+
+    assert cache.get("a") is None
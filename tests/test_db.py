@@ -1,5 +1,10 @@
+import json
+import sqlite3
+import threading
 from uuid import uuid4
 
+import pytest
+
 from job_role_analyzer.data_models import Competency, JobRoleSummary
 from job_role_analyzer.db import Database
 
@@ -31,6 +36,271 @@ def test_database_persists_job_role_and_competencies(tmp_path):
         assert len(embeddings) == 1
         retrieved_role, vector = embeddings[0]
         assert retrieved_role.job_role_id == job_role.job_role_id
-        assert vector == [0.1, 0.2, 0.3]
+        assert list(vector) == pytest.approx([0.1, 0.2, 0.3])
+    finally:
+        database.close()
+
+
+def test_database_migrates_legacy_json_embeddings(tmp_path):
+    db_path = tmp_path / "legacy.sqlite"
+    legacy = sqlite3.connect(db_path)
+    legacy.execute(
+        """
+        CREATE TABLE job_roles (
+            job_role_id TEXT PRIMARY KEY,
+            job_title TEXT NOT NULL,
+            normalized_summary TEXT NOT NULL,
+            years_experience INTEGER NOT NULL,
+            embedding_vector TEXT
+        )
+        """
+    )
+    role_ids = [str(uuid4()) for _ in range(3)]
+    legacy.executemany(
+        "INSERT INTO job_roles VALUES (?, 'Engineer', 'Summary', 2, ?)",
+        [
+            (role_ids[0], json.dumps([0.5, 0.25])),
+            (role_ids[1], json.dumps([1.0, 0.0])),
+            (role_ids[2], None),
+        ],
+    )
+    legacy.commit()
+    legacy.close()
+
+    database = Database(path=str(db_path))
+    try:
+        rows = database._connection.execute(  # noqa: SLF001 - inspecting storage layout
+            "SELECT job_role_id, embedding_vector, embedding_blob, embedding_dtype, embedding_dim FROM job_roles"
+        ).fetchall()
+        migrated = {row["job_role_id"]: row for row in rows}
+        assert all(row["embedding_vector"] is None for row in rows)
+        assert migrated[role_ids[0]]["embedding_dtype"] == "float32"
+        assert migrated[role_ids[0]]["embedding_dim"] == 2
+        assert len(migrated[role_ids[0]]["embedding_blob"]) == 8
+
+        vectors = {str(role.job_role_id): list(vector) for role, vector in database.iter_job_role_embeddings()}
+        assert vectors[role_ids[0]] == [0.5, 0.25]
+        assert vectors[role_ids[1]] == [1.0, 0.0]
+        assert vectors[role_ids[2]] == []
+        assert [str(role.job_role_id) for role in database.iter_job_roles_missing_embeddings()] == [role_ids[2]]
+    finally:
+        database.close()
+
+
+def test_database_uses_wal_and_serves_concurrent_readers(tmp_path):
+    database = Database(path=str(tmp_path / "concurrent.sqlite"))
+    try:
+        journal_mode = database._connection.execute("PRAGMA journal_mode").fetchone()[0]  # noqa: SLF001
+        assert journal_mode == "wal"
+
+        roles = []
+        for index in range(5):
+            role = JobRoleSummary(
+                job_title=f"Role {index}",
+                normalized_summary="Summary",
+                years_experience=index,
+            )
+            database.add_job_role(role, [Competency(name="Skill", level=3)], embedding=[1.0, 0.0])
+            roles.append(role)
+
+        errors = []
+
+        def read_roles():
+            try:
+                for _ in range(20):
+                    for role in roles:
+                        stored = database.get_job_role_with_competencies(role.job_role_id)
+                        assert stored is not None and stored.job_role.job_title == role.job_title
+            except Exception as exc:  # noqa: BLE001 - surfaced in the main thread
+                errors.append(exc)
+
+        def write_roles():
+            for index in range(20):
+                database.add_job_role(
+                    JobRoleSummary(job_title=f"Extra {index}", normalized_summary="S", years_experience=1),
+                    [Competency(name="Skill", level=2)],
+                )
+
+        threads = [threading.Thread(target=read_roles) for _ in range(4)]
+        threads.append(threading.Thread(target=write_roles))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(list(database.iter_job_role_embeddings())) == 25
+    finally:
+        database.close()
+
+
+def test_database_bulk_fetch_uses_competency_index(tmp_path):
+    database = Database(path=str(tmp_path / "bulk.sqlite"))
+    try:
+        first = JobRoleSummary(job_title="Analyst", normalized_summary="Analyses data", years_experience=2)
+        second = JobRoleSummary(job_title="Manager", normalized_summary="Leads teams", years_experience=8)
+        database.add_job_role(first, [Competency(name="SQL", level=3), Competency(name="Excel", level=2)])
+        database.add_job_role(second, [])
+
+        fetched = database.get_many([first.job_role_id, second.job_role_id, uuid4()])
+
+        assert set(fetched) == {first.job_role_id, second.job_role_id}
+        assert [comp.name for comp in fetched[first.job_role_id].competencies] == ["SQL", "Excel"]
+        assert fetched[second.job_role_id].competencies == []
+        assert database.get_job_role_with_competencies(uuid4()) is None
+
+        plan = database._connection.execute(  # noqa: SLF001 - inspecting the query plan
+            "EXPLAIN QUERY PLAN SELECT name_id FROM competencies WHERE job_role_id = ? ORDER BY id",
+            (str(first.job_role_id),),
+        ).fetchall()
+        assert any("idx_competencies_job_role_id" in row["detail"] for row in plan)
+    finally:
+        database.close()
+
+
+def test_database_streams_embedding_blocks(tmp_path):
+    database = Database(path=str(tmp_path / "blocks.sqlite"))
+    try:
+        stored = []
+        for index in range(5):
+            role = JobRoleSummary(job_title=f"Role {index}", normalized_summary="S", years_experience=1)
+            database.add_job_role(role, [], embedding=[float(index), 1.0])
+            stored.append(role.job_role_id)
+        database.add_job_role(JobRoleSummary(job_title="No vector", normalized_summary="S", years_experience=1), [])
+
+        blocks = list(database.iter_embedding_blocks(chunk_size=2))
+
+        assert [len(ids) for ids, _ in blocks] == [2, 2, 1]
+        assert [job_role_id for ids, _ in blocks for job_role_id in ids] == stored
+        rows = [list(map(float, row)) for _, block in blocks for row in block]
+        assert rows == [[float(index), 1.0] for index in range(5)]
+    finally:
+        database.close()
+
+
+def test_database_serves_hot_roles_from_cache_and_invalidates_on_write(tmp_path):
+    database = Database(path=str(tmp_path / "cached.sqlite"))
+    try:
+        role = JobRoleSummary(job_title="Designer", normalized_summary="Designs", years_experience=3)
+        database.add_job_role(role, [Competency(name="Figma", level=4)])
+
+        first = database.get_job_role_with_competencies(role.job_role_id)
+        second = database.get_job_role_with_competencies(role.job_role_id)
+        assert first is second
+        assert database.role_cache_stats()["hits"] == 1
+
+        database.add_job_role(role, [Competency(name="Sketch", level=2)])
+        refreshed = database.get_job_role_with_competencies(role.job_role_id)
+        assert [comp.name for comp in refreshed.competencies] == ["Sketch"]
+    finally:
+        database.close()
+
+
+def test_database_interns_competency_names_and_migrates_legacy_rows(tmp_path):
+    db_path = tmp_path / "names.sqlite"
+    legacy = sqlite3.connect(db_path)
+    legacy.execute(
+        """
+        CREATE TABLE competencies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_role_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            type TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    legacy_role_id = str(uuid4())
+    legacy.executemany(
+        "INSERT INTO competencies (job_role_id, name, level, type) VALUES (?, ?, ?, ?)",
+        [(legacy_role_id, "Stakeholder  Management", 3, "soft"), (legacy_role_id, "Python", 4, "technical")],
+    )
+    legacy.commit()
+    legacy.close()
+
+    database = Database(path=str(db_path))
+    try:
+        role = JobRoleSummary(job_title="Lead", normalized_summary="Leads", years_experience=9)
+        database.add_job_role(
+            role,
+            [Competency(name=" python ", level=5), Competency(name="stakeholder management", level=4, type="soft")],
+        )
+
+        names = database._connection.execute(  # noqa: SLF001 - inspecting storage layout
+            "SELECT canonical_name, display_name FROM competency_names ORDER BY id"
+        ).fetchall()
+        assert [tuple(row) for row in names] == [
+            ("stakeholder management", "Stakeholder Management"),
+            ("python", "Python"),
+        ]
+
+        # Each role keeps its own spelling; only differing spellings are stored per row.
+        stored = database.get_job_role_with_competencies(role.job_role_id)
+        assert [comp.name for comp in stored.competencies] == [" python ", "stakeholder management"]
+        overrides = database._connection.execute(  # noqa: SLF001
+            "SELECT display_name FROM competencies ORDER BY id"
+        ).fetchall()
+        assert [row["display_name"] for row in overrides] == [
+            "Stakeholder  Management",
+            None,
+            " python ",
+            "stakeholder management",
+        ]
+    finally:
+        database.close()
+
+
+def test_database_adds_competency_display_name_column_in_place(tmp_path):
+    db_path = tmp_path / "interned.sqlite"
+    database = Database(path=str(db_path))
+    role = JobRoleSummary(job_title="Analyst", normalized_summary="Analyses", years_experience=2)
+    database.add_job_role(role, [Competency(name="SQL", level=3)])
+    database.close()
+    connection = sqlite3.connect(db_path)
+    connection.execute("ALTER TABLE competencies DROP COLUMN display_name")
+    connection.commit()
+    connection.close()
+
+    database = Database(path=str(db_path))
+    try:
+        database.add_job_role(role, [Competency(name="sql", level=4)])
+        stored = database.get_job_role_with_competencies(role.job_role_id)
+        assert [(comp.name, comp.level) for comp in stored.competencies] == [("sql", 4)]
+    finally:
+        database.close()
+
+
+def test_database_hydrates_trusted_rows_with_stored_values(tmp_path):
+    database = Database(path=str(tmp_path / "trusted.sqlite"))
+    try:
+        role = JobRoleSummary(job_title="Analyst", normalized_summary="Analyses", years_experience=2)
+        database.add_job_role(role, [Competency(name="SQL", level=3), Competency(name="Excel", level=2)])
+        database._connection.execute("UPDATE competencies SET type = NULL")  # noqa: SLF001 - legacy row shape
+        database._connection.commit()  # noqa: SLF001
+
+        stored = database.get_many([role.job_role_id])[role.job_role_id]
+        assert stored.job_role == role
+        assert [(comp.name, comp.level, comp.type) for comp in stored.competencies] == [
+            ("SQL", 3, "technical"),
+            ("Excel", 2, "technical"),
+        ]
+    finally:
+        database.close()
+
+
+def test_database_reopens_connections_after_close(tmp_path):
+    database = Database(path=str(tmp_path / "reopen.db"))
+    role = JobRoleSummary(job_title="Role", normalized_summary="Summary", years_experience=2)
+    database.add_job_role(role, [Competency(name="Skill", level=2)])
+    database.close()
+
+    database.reopen()
+    try:
+        assert database.get_job_role(role.job_role_id) == role
+        database.add_job_role(
+            JobRoleSummary(job_title="Other", normalized_summary="Summary", years_experience=1),
+            [Competency(name="Skill", level=1)],
+        )
     finally:
         database.close()
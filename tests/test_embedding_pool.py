@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from job_role_analyzer.embedding_pool import ProcessPoolEmbeddingProvider  # noqa: E402
+
+
+class LengthModel:
+    def encode(self, texts, **kwargs):
+        return np.array([[float(len(text)), float(os.getpid())] for text in texts], dtype="float32")
+
+
+def load_length_model(model_name, device):
+    return LengthModel()
+
+
+def test_process_pool_returns_vectors_from_workers():
+    provider = ProcessPoolEmbeddingProvider(
+        "stub-model",
+        workers=2,
+        threads_per_worker=1,
+        loader=load_length_model,
+    )
+    try:
+        assert provider._executor._mp_context.get_start_method() != "fork"
+        matrix = provider.embed_batch(["a", "bb", "ccc", "dddd", "eeeee"], batch_size=2)
+
+        assert matrix.dtype == np.float32
+        assert matrix.flags["C_CONTIGUOUS"]
+        assert matrix[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert os.getpid() not in matrix[:, 1].tolist()
+        assert provider.embed("xyz")[0] == 3.0
+        assert provider.embed("") == []
+    finally:
+        provider.close()
+
+
+class FailingChunkModel:
+    def encode(self, texts, **kwargs):
+        if "boom" in texts:
+            raise RuntimeError("chunk failed")
+        return np.ones((len(texts), 2), dtype="float32")
+
+
+def load_failing_chunk_model(model_name, device):
+    return FailingChunkModel()
+
+
+def _shared_segments():
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")} if os.path.isdir("/dev/shm") else set()
+
+
+def test_process_pool_releases_segments_when_a_chunk_fails():
+    provider = ProcessPoolEmbeddingProvider(
+        "stub-model",
+        workers=2,
+        threads_per_worker=1,
+        loader=load_failing_chunk_model,
+        mp_context="fork",
+    )
+    try:
+        before = _shared_segments()
+        with pytest.raises(RuntimeError, match="chunk failed"):
+            provider.embed_batch(["a", "boom", "c", "d", "e"], batch_size=1)
+        assert _shared_segments() <= before
+    finally:
+        provider.close()
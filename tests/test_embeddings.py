@@ -0,0 +1,39 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from job_role_analyzer.embeddings import HashingEmbeddingProvider  # noqa: E402
+
+
+def _cosine(left, right):
+    return sum(x * y for x, y in zip(left, right))
+
+
+def test_hashing_embedder_is_deterministic_and_normalized():
+    provider = HashingEmbeddingProvider(dimension=256)
+
+    first = provider.embed("Senior Python engineer building data pipelines")
+    second = HashingEmbeddingProvider(dimension=256).embed("Senior Python engineer building data pipelines")
+
+    assert len(first) == 256
+    assert first == second
+    assert math.isclose(math.sqrt(sum(value * value for value in first)), 1.0, rel_tol=1e-5)
+    assert provider.embed("") == []
+
+
+def test_hashing_embedder_batch_matches_single_and_ranks_similar_text():
+    provider = HashingEmbeddingProvider.from_model_name("hashing:512")
+    texts = [
+        "Backend engineer writing Python microservices",
+        "Python backend engineer for microservices",
+        "Registered nurse for intensive care unit",
+    ]
+
+    matrix = provider.embed_batch(texts)
+
+    assert matrix.shape == (3, 512)
+    assert matrix.dtype == np.float32
+    assert np.allclose(matrix[0], provider.embed(texts[0]))
+    assert _cosine(matrix[0], matrix[1]) > _cosine(matrix[0], matrix[2])
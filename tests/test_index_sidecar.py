@@ -0,0 +1,134 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from job_role_analyzer import similarity
+from job_role_analyzer.config import AnalyzerConfig
+from job_role_analyzer.data_models import Competency, JobRoleSummary
+from job_role_analyzer.db import Database
+from job_role_analyzer.index_sidecar import SidecarError, SidecarIndexClient
+from job_role_analyzer.similarity import SimilarityChecker
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class StaticEmbeddingProvider:
+    def __init__(self, vector):
+        self.vector = vector
+
+    def embed(self, text):
+        return list(self.vector)
+
+
+def _role():
+    return JobRoleSummary(job_role_id=uuid4(), job_title="Role", normalized_summary="Summary", years_experience=3)
+
+
+@pytest.fixture
+def sidecar(tmp_path):
+    database = Database(path=str(tmp_path / "sidecar.db"))
+    competencies = [Competency(name=f"Skill {n}", level=3) for n in range(3)]
+    stored = _role()
+    database.add_job_role(stored, competencies, embedding=[1.0, 0.0, 0.0])
+    database.close()
+
+    socket_path = str(tmp_path / "index.sock")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "webapp.index_sidecar", "--socket", socket_path, "--database", str(tmp_path / "sidecar.db")],
+        cwd=REPO_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while not os.path.exists(socket_path):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            pytest.fail("index sidecar did not start")
+        time.sleep(0.05)
+    try:
+        yield socket_path, stored, tmp_path / "sidecar.db"
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    assert not os.path.exists(socket_path)
+
+
+def test_client_batches_search_and_add(sidecar):
+    socket_path, stored, _ = sidecar
+    client = SidecarIndexClient(socket_path)
+    assert client.stats() == (1, 3)
+
+    added = uuid4()
+    assert client.add([added], [[0.0, 1.0, 0.0]]) == 2
+    distances, ids = client.search([[1.0, 0.1, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]], k=2)
+    assert [row[0] for row in ids[:2]] == [stored.job_role_id, added]
+    assert all(len(row) == 2 for row in ids)
+    assert distances[0][0] == pytest.approx(0.995, abs=1e-3)
+    assert distances[1][0] == pytest.approx(1.0)
+    assert client.reload() == 1
+    with pytest.raises(SidecarError, match="dimensionality"):
+        client.search([[1.0, 0.0]], k=1)
+    # The connection survives an error response.
+    assert client.stats() == (1, 3)
+    client.close()
+
+
+def test_repeated_adds_and_empty_searches_are_harmless(sidecar):
+    np = pytest.importorskip("numpy")
+    socket_path, stored, _ = sidecar
+    client = SidecarIndexClient(socket_path)
+    added = uuid4()
+
+    assert client.add([added], [[0.0, 1.0, 0.0]]) == 2
+    assert client.add([added, stored.job_role_id], [[0.0, 1.0, 0.0], [1.0, 0.0, 0.0]]) == 2
+    assert client.search(np.empty((0, 3), dtype=np.float32), k=3) == ([], [])
+    assert client.stats() == (2, 3)
+    client.close()
+
+
+def test_search_clamps_k_to_the_index_size(sidecar):
+    socket_path, stored, _ = sidecar
+    client = SidecarIndexClient(socket_path)
+
+    distances, ids = client.search([[1.0, 0.0, 0.0]], k=1_000_000)
+    assert ids == [[stored.job_role_id]] and len(distances[0]) == 1
+    with pytest.raises(SidecarError, match="positive"):
+        client.search([[1.0, 0.0, 0.0]], k=0)
+    client.close()
+
+
+def test_checkers_share_one_sidecar_index(sidecar, monkeypatch):
+    socket_path, _, database_path = sidecar
+    config = AnalyzerConfig(similarity_backend="sidecar", similarity_sidecar_socket=socket_path)
+    monkeypatch.setattr(similarity, "load_config", lambda: config)
+    database = Database(path=str(database_path))
+    try:
+        first = SimilarityChecker(database, StaticEmbeddingProvider([0.0, 0.0, 1.0]))
+        second = SimilarityChecker(database, StaticEmbeddingProvider([0.0, 0.0, 1.0]))
+        assert first.find_similar_role_id("Unrelated") is None
+        assert second.find_similar_role_id("Unrelated") is None
+
+        added = _role()
+        first.add_to_index(added, [0.0, 0.0, 1.0])
+        match = second.find_similar_role_id("Same direction")
+        assert match is not None and match[0] == added.job_role_id
+    finally:
+        database.close()
+
+
+def test_unreachable_sidecar_is_a_miss(tmp_path, monkeypatch):
+    config = AnalyzerConfig(similarity_backend="sidecar", similarity_sidecar_socket=str(tmp_path / "missing.sock"))
+    monkeypatch.setattr(similarity, "load_config", lambda: config)
+    database = Database(path=str(tmp_path / "missing.db"))
+    try:
+        checker = SimilarityChecker(database, StaticEmbeddingProvider([1.0, 0.0]))
+        assert checker.find_similar_role_id("Anything") is None
+        checker.add_to_index(_role(), [1.0, 0.0])
+    finally:
+        database.close()
@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from job_role_analyzer.analyzer import JobRoleAnalyzer  # noqa: E402
+from job_role_analyzer.db import Database  # noqa: E402
+from job_role_analyzer.embeddings import HashingEmbeddingProvider  # noqa: E402
+from job_role_analyzer.ingestion import IngestionPipeline, read_records  # noqa: E402
+from job_role_analyzer.llm_interface import LLMInterface  # noqa: E402
+
+
+class StubLLMClient:
+    def __init__(self):
+        self.prompts = []
+
+    def complete(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        if "distills job descriptions" in prompt:
+            return "Stub summary"
+        return json.dumps(
+            [
+                {"name": "Skill A", "level": 3, "type": "technical"},
+                {"name": "Skill B", "level": 2, "type": "technical"},
+                {"name": "Skill C", "level": 4, "type": "soft"},
+            ]
+        )
+
+
+class FlakyLLMClient(StubLLMClient):
+    def __init__(self, failing_marker):
+        super().__init__()
+        self.failing_marker = failing_marker
+
+    def complete(self, prompt, **kwargs):
+        if self.failing_marker and self.failing_marker in prompt:
+            raise ConnectionError("LLM offline")
+        return super().complete(prompt, **kwargs)
+
+
+POSTINGS = [
+    {"job_title": "Nurse", "job_description": "Provide intensive care to patients in hospital wards", "years_of_experience": 3},
+    {"job_title": "Pilot", "job_description": "Fly commercial aircraft on international routes", "years_of_experience": 8},
+    {"job_title": "Nurse", "job_description": "Provide intensive care to patients in hospital wards", "years_of_experience": 3},
+    {"job_title": "Chef", "job_description": "Run a busy restaurant kitchen and design seasonal menus", "years_of_experience": 5},
+    {"job_title": "Accountant", "job_description": "Prepare quarterly tax filings and audit ledgers", "years_of_experience": 4},
+]
+
+
+def _write_jsonl(path, records):
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+
+def _interrupted(records, limit):
+    for index, record in enumerate(records):
+        if index == limit:
+            raise RuntimeError("simulated crash")
+        yield record
+
+
+def test_ingestion_dedupes_and_resumes_from_checkpoint(tmp_path):
+    input_path = tmp_path / "postings.jsonl"
+    _write_jsonl(input_path, POSTINGS)
+    database = Database(path=str(tmp_path / "ingest.db"))
+    try:
+        client = StubLLMClient()
+        analyzer = JobRoleAnalyzer(database, LLMInterface(client), HashingEmbeddingProvider(256))
+        pipeline = IngestionPipeline(analyzer, batch_size=2, concurrency=2)
+
+        with pytest.raises(RuntimeError):
+            pipeline.run(_interrupted(read_records(input_path), limit=3), source="postings")
+        assert database.get_ingest_checkpoint("postings") == 2
+        assert len(client.prompts) == 4
+
+        stats = pipeline.run(read_records(input_path), source="postings")
+
+        assert stats.skipped == 2
+        assert stats.processed == 3
+        assert stats.duplicates == 1
+        assert stats.created == 2
+        assert stats.llm_calls == 4
+        assert stats.llm_calls_avoided == 2
+        assert database.get_ingest_checkpoint("postings") == 5
+        assert len(client.prompts) == 8
+        assert len(list(database.iter_job_role_embeddings())) == 4
+    finally:
+        database.close()
+
+
+def test_failed_records_hold_back_the_checkpoint_for_retry(tmp_path):
+    input_path = tmp_path / "postings.jsonl"
+    _write_jsonl(input_path, POSTINGS)
+    database = Database(path=str(tmp_path / "ingest.db"))
+    try:
+        client = FlakyLLMClient("commercial aircraft")
+        analyzer = JobRoleAnalyzer(database, LLMInterface(client), HashingEmbeddingProvider(256))
+        stats = IngestionPipeline(analyzer, batch_size=2, concurrency=2).run(read_records(input_path), source="postings")
+
+        assert stats.errors == 1
+        assert stats.retry_from == 1
+        assert database.get_ingest_checkpoint("postings") == 1
+
+        client.failing_marker = None
+        stats = IngestionPipeline(analyzer, batch_size=2).run(read_records(input_path), source="postings")
+
+        assert stats.created == 1
+        assert stats.retry_from is None
+        assert database.get_ingest_checkpoint("postings") == 5
+        assert len(list(database.iter_job_role_embeddings())) == 4
+    finally:
+        database.close()
+
+
+def test_near_duplicates_in_one_batch_reach_the_llm_once(tmp_path):
+    input_path = tmp_path / "postings.jsonl"
+    description = "Provide intensive care to patients in hospital wards"
+    _write_jsonl(
+        input_path,
+        [
+            {"job_title": "Nurse", "job_description": description, "years_of_experience": 3},
+            {"job_title": "Ward Nurse", "job_description": description, "years_of_experience": 3},
+        ],
+    )
+    database = Database(path=str(tmp_path / "ingest.db"))
+    try:
+        client = StubLLMClient()
+        analyzer = JobRoleAnalyzer(database, LLMInterface(client), HashingEmbeddingProvider(256))
+        stats = IngestionPipeline(analyzer, batch_size=10).run(read_records(input_path), source="postings")
+
+        assert stats.created == 1
+        assert stats.duplicates == 1
+        assert len(client.prompts) == 2
+    finally:
+        database.close()
+
+
+def test_read_records_parses_csv_and_flags_invalid_rows(tmp_path):
+    input_path = tmp_path / "postings.csv"
+    input_path.write_text(
+        "job_title,job_description,years_of_experience\n"
+        "Nurse,Provide care,3\n"
+        ",Missing title,2\n"
+    )
+
+    records = list(read_records(input_path))
+
+    assert records[0].job_title == "Nurse"
+    assert records[0].years_of_experience == 3
+    assert records[1].position == 1
+    assert records[1].error is not None
@@ -0,0 +1,135 @@
+import threading
+
+from job_role_analyzer.db import Database
+from job_role_analyzer.jobs import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JobRunner
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_job_store_leases_and_recovers_orphaned_jobs(tmp_path):
+    database = Database(path=str(tmp_path / "jobs.sqlite"))
+    try:
+        first = database.enqueue_job({"n": 1}, now=1.0)
+        second = database.enqueue_job({"n": 2}, now=2.0)
+
+        claimed = database.claim_job("worker-a", now=10.0, lease_seconds=5.0, max_attempts=2)
+        assert (claimed.job_id, claimed.status, claimed.attempts) == (first.job_id, JOB_RUNNING, 1)
+        assert database.claim_job("worker-b", now=11.0, lease_seconds=5.0, max_attempts=2).job_id == second.job_id
+        assert database.claim_job("worker-b", now=12.0, lease_seconds=5.0, max_attempts=2) is None
+
+        # worker-a dies; its lease lapses and the job is handed out again.
+        database.renew_job_leases("worker-b", [second.job_id], now=14.0, lease_seconds=5.0)
+        reclaimed = database.claim_job("worker-b", now=16.0, lease_seconds=5.0, max_attempts=2)
+        assert (reclaimed.job_id, reclaimed.attempts) == (first.job_id, 2)
+
+        # worker-a comes back after losing its lease; its late outcome is dropped.
+        assert not database.finish_job(first.job_id, owner="worker-a", now=16.5, result=b'{"stale": true}')
+        assert not database.release_job(first.job_id, owner="worker-a", now=16.5, error="late")
+        assert database.get_job(first.job_id).status == JOB_RUNNING
+
+        assert database.finish_job(second.job_id, owner="worker-b", now=17.0, result=b'{"ok": true}')
+        assert database.get_job(second.job_id).result == b'{"ok": true}'
+
+        # A job that keeps killing its workers is eventually given up on.
+        assert database.claim_job("worker-c", now=30.0, lease_seconds=5.0, max_attempts=2) is None
+        abandoned = database.get_job(first.job_id)
+        assert abandoned.status == JOB_FAILED and abandoned.error
+        assert database.get_job("missing") is None
+    finally:
+        database.close()
+
+
+def test_two_processes_never_claim_the_same_job(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+    databases = [Database(path=path), Database(path=path)]
+    try:
+        queued = {databases[0].enqueue_job({"n": n}, now=float(n)).job_id for n in range(40)}
+        claims = []
+
+        def drain(database, owner):
+            while (job := database.claim_job(owner, now=100.0, lease_seconds=60.0, max_attempts=3)) is not None:
+                claims.append(job.job_id)
+
+        threads = [threading.Thread(target=drain, args=(database, f"worker-{n}")) for n, database in enumerate(databases)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(claims) == sorted(queued)
+        assert {databases[0].get_job(job_id).attempts for job_id in queued} == {1}
+    finally:
+        for database in databases:
+            database.close()
+
+
+def test_job_runner_executes_retries_and_fails_jobs(tmp_path):
+    database = Database(path=str(tmp_path / "runner.sqlite"))
+    attempts = {}
+    finished = threading.Event()
+    done = set()
+
+    def handler(payload):
+        kind = payload["kind"]
+        attempts[kind] = attempts.get(kind, 0) + 1
+        if kind == "invalid":
+            raise ValueError("bad payload")
+        if kind == "flaky" and attempts[kind] == 1:
+            raise RuntimeError("transient")
+        return kind.encode("utf-8")
+
+    runner = JobRunner(database, handler, workers=2, lease_seconds=5.0, max_attempts=3, poll_interval=0.05)
+    jobs = {}
+
+    def listener(job_id):
+        job = database.get_job(job_id)
+        if job is not None and job.done:
+            done.add(job_id)
+            if len(done) == 3:
+                finished.set()
+
+    runner.add_listener(listener)
+    runner.start()
+    try:
+        for kind in ("ok", "flaky", "invalid"):
+            jobs[kind] = runner.submit({"kind": kind}).job_id
+        assert finished.wait(5)
+    finally:
+        runner.stop()
+
+    ok, flaky, invalid = (database.get_job(jobs[kind]) for kind in ("ok", "flaky", "invalid"))
+    database.close()
+    assert (ok.status, ok.result) == (JOB_SUCCEEDED, b"ok")
+    assert (flaky.status, flaky.result, flaky.attempts) == (JOB_SUCCEEDED, b"flaky", 2)
+    assert (invalid.status, invalid.error, invalid.attempts) == (JOB_FAILED, "bad payload", 1)
+
+
+def test_job_runner_resumes_queue_left_by_previous_process(tmp_path):
+    database = Database(path=str(tmp_path / "resume.sqlite"))
+    clock = FakeClock()
+    try:
+        queued = database.enqueue_job({"kind": "queued"}, now=clock.now)
+        orphaned = database.enqueue_job({"kind": "orphaned"}, now=clock.now)
+        database.claim_job("dead-process", now=clock.now, lease_seconds=5.0, max_attempts=3)
+        assert database.get_job(queued.job_id).status == JOB_RUNNING
+        assert database.get_job(orphaned.job_id).status == JOB_QUEUED
+
+        clock.now += 60
+        runner = JobRunner(database, lambda payload: b"done", workers=1, poll_interval=0.02, clock=clock)
+        runner.start()
+        try:
+            for _ in range(250):
+                if all(database.get_job(job.job_id).done for job in (queued, orphaned)):
+                    break
+                threading.Event().wait(0.02)
+        finally:
+            runner.stop()
+        assert {database.get_job(job.job_id).status for job in (queued, orphaned)} == {JOB_SUCCEEDED}
+    finally:
+        database.close()
@@ -1,3 +1,7 @@
+import httpx
+import pytest
+
+from job_role_analyzer.metrics import LLM_ERRORS, LLM_IN_FLIGHT
 from webapp.llm import LLMStudioClient
 
 
@@ -69,3 +73,26 @@ def test_complete_sends_chat_messages(monkeypatch):
     assert payload["messages"][0]["role"] == "user"
     assert payload["model"] == "openai/gpt-oss-20b"
     assert payload["stream"] is False
+
+
+def test_complete_tracks_in_flight_requests_and_errors(monkeypatch):
+    observed: list[float] = []
+
+    class FailingClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def post(self, path, json, headers):
+            observed.append(LLM_IN_FLIGHT.labels().value)
+            raise httpx.ConnectError("refused")
+
+    monkeypatch.setattr("webapp.llm.httpx.Client", FailingClient)
+    errors = LLM_ERRORS.labels("transport")
+    before = errors.value
+
+    client = LLMStudioClient("http://service")
+    with pytest.raises(httpx.ConnectError):
+        client.complete("Describe the day")
+
+    assert observed == [LLM_IN_FLIGHT.labels().value + 1]
+    assert errors.value == before + 1
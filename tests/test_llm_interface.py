@@ -1,6 +1,6 @@
 import json
 
-from job_role_analyzer.llm_interface import LLMInterface
+from job_role_analyzer.llm_interface import LLMInterface, TemplateRenderer
 
 
 class EchoClient:
@@ -31,3 +31,14 @@ def test_llm_interface_renders_prompt_and_parses_json():
     assert result == [{"name": "Python", "level": 5, "type": "technical"}]
     assert "ML Engineer" in client.prompts[0]
     assert "Design machine learning models" in client.prompts[0]
+
+
+def test_template_renderer_preload_serves_templates_without_disk(tmp_path):
+    prompts = tmp_path / "jd_analysis"
+    prompts.mkdir()
+    (prompts / "normalize_jd.txt").write_text("Summarize {{ job_description }}", encoding="utf-8")
+    renderer = TemplateRenderer(str(tmp_path))
+
+    assert renderer.preload() == 1
+    (prompts / "normalize_jd.txt").unlink()
+    assert renderer.load("jd_analysis/normalize_jd").render(job_description="x") == "Summarize x"
@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from job_role_analyzer.metrics import Histogram, MetricsRegistry, StageTimings, record_stages, time_stage
+
+
+def test_histogram_snapshot_is_cumulative():
+    histogram = Histogram([0.1, 1.0])
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert list(snapshot["buckets"].values()) == [1, 3, 4]
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(4.25)
+
+
+def test_registry_renders_prometheus_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests_total", "Requests served.", ["route"])
+    in_flight = registry.gauge("demo_in_flight", "Requests in flight.")
+    size = registry.gauge("demo_size", "Computed at scrape time.")
+    latency = registry.histogram("demo_seconds", "Latency.", ["stage"], buckets=[0.1, 1.0])
+
+    threads = [threading.Thread(target=lambda: [requests.labels("/a").inc() for _ in range(500)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    requests.labels(route='say "hi"').inc(2)
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+    size.set_function(lambda: 42)
+    latency.labels("embedding").observe(0.05)
+    latency.labels("embedding").observe(2.0)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE demo_requests_total counter" in lines
+    assert 'demo_requests_total{route="/a"} 2000' in lines
+    assert 'demo_requests_total{route="say \\"hi\\""} 2' in lines
+    assert "demo_in_flight 1" in lines
+    assert "demo_size 42" in lines
+    assert 'demo_seconds_bucket{stage="embedding",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{stage="embedding",le="+Inf"} 2' in lines
+    assert 'demo_seconds_count{stage="embedding"} 2' in lines
+
+
+def test_registry_rejects_conflicting_registration_and_bad_labels():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo.", ["kind"])
+    assert registry.counter("demo_total", "Demo.", ["kind"]) is counter
+    with pytest.raises(ValueError):
+        registry.gauge("demo_total", "Demo.")
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+    with pytest.raises(ValueError):
+        counter.labels("a").inc(-1)
+
+
+def test_stage_timings_collect_only_within_record_stages():
+    timings = StageTimings()
+    with time_stage("outside"):
+        pass
+    with record_stages(timings):
+        for _ in range(2):
+            with time_stage("llm_request"):
+                pass
+    with record_stages(None), time_stage("untracked"):
+        pass
+
+    assert set(timings.durations()) == {"llm_request"}
+    header = timings.server_timing()
+    assert header.startswith("llm_request;dur=")
+    assert header.split(", ")[-1].startswith("total;dur=")
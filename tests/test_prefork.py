@@ -0,0 +1,63 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("uvicorn")
+
+from job_role_analyzer.data_models import Competency, JobRoleSummary  # noqa: E402
+from job_role_analyzer.db import Database  # noqa: E402
+from webapp.prefork import PreforkServer, build_shared_index, memory_report  # noqa: E402
+
+
+def test_build_shared_index_maps_stored_vectors_without_leaving_files(tmp_path):
+    db_path = str(tmp_path / "prefork.db")
+    database = Database(db_path)
+    role = JobRoleSummary(job_title="Role", normalized_summary="Summary", years_experience=2)
+    database.add_job_role(role, [Competency(name="Skill", level=2)], embedding=[0.0, 3.0])
+    database.close()
+
+    index_dir = tmp_path / "index"
+    index_dir.mkdir()
+    index = build_shared_index(db_path, chunk_size=16, directory=str(index_dir))
+    try:
+        assert list(index_dir.iterdir()) == []
+        distances, indices = index.search([[0.0, 1.0]], k=1)
+        assert index.job_role_id(indices[0][0]) == role.job_role_id
+        assert distances[0][0] == pytest.approx(1.0)
+    finally:
+        index.close()
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/smaps_rollup"), reason="needs Linux smaps_rollup")
+def test_memory_report_lists_unique_memory_per_process():
+    report = memory_report([os.getpid()])
+    assert report["master"]["pid"] == os.getpid()
+    worker = report["workers"][0]
+    assert 0 < worker["uss_mib"] <= worker["rss_mib"]
+
+
+class CrashingPreforkServer(PreforkServer):
+    def __init__(self, **kwargs):
+        super().__init__("127.0.0.1", 0, 1, memory_report_interval=0, **kwargs)
+        self.spawns = 0
+
+    def _spawn(self, slot, app, sock):
+        self.spawns += 1
+        pid = os.fork()
+        if pid == 0:
+            os._exit(3)
+        self._children[pid] = slot
+        self._started[pid] = time.monotonic()
+
+
+def test_supervisor_backs_off_and_gives_up_on_workers_that_crash_at_start():
+    server = CrashingPreforkServer(restart_backoff=0.05, max_fast_exits=3)
+    server._spawn(0, None, None)
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="right after start"):
+        server._supervise(None, None)
+    assert server.spawns == 3
+    # Two restarts, delayed 0.05 s and then 0.1 s.
+    assert time.monotonic() - started >= 0.15
@@ -0,0 +1,90 @@
+from job_role_analyzer.metrics import PREPROCESS_TOKENS_SAVED
+from job_role_analyzer.preprocessing import JobDescriptionPreprocessor, count_tokens
+
+
+SAMPLE_POSTING = """About Us
+Acme builds logistics software used by thousands of shippers worldwide.
+
+Responsibilities:
+- Design and operate Python services on Kubernetes
+- Mentor engineers on reliability practices
+
+Design and operate Python services on Kubernetes
+
+- Design and operate Python services on Kubernetes
+- Mentor engineers on reliability practices
+
+Benefits
+Unlimited PTO, stock options and a home office stipend.
+
+Requirements:
+5+ years building distributed systems.
+
+Acme is an equal opportunity employer and considers applicants without regard to race or gender.
+"""
+
+
+def test_preprocessor_strips_boilerplate_and_duplicates():
+    result = JobDescriptionPreprocessor().process(SAMPLE_POSTING)
+
+    assert "logistics software" not in result.cleaned
+    assert "Unlimited PTO" not in result.cleaned
+    assert "equal opportunity" not in result.cleaned
+    assert "Responsibilities:" in result.cleaned
+    assert "5+ years building distributed systems." in result.cleaned
+    assert result.cleaned.count("Mentor engineers") == 1
+
+
+def test_preprocessor_applies_token_budgets_and_reports_savings():
+    text = "Build data pipelines. " * 100
+    result = JobDescriptionPreprocessor({"embedding": 20, "normalize_jd": 1000}).process(text)
+
+    assert count_tokens(result.for_consumer("embedding")) == 20
+    assert result.for_consumer("normalize_jd") == text.strip()
+    assert result.tokens_saved["embedding"] == result.original_tokens - 20
+    assert result.total_tokens_saved == result.tokens_saved["embedding"] + result.tokens_saved["normalize_jd"]
+
+
+def test_preprocessor_exports_tokens_saved_per_stage():
+    embedding = PREPROCESS_TOKENS_SAVED.labels("embedding")
+    before = embedding.value
+    result = JobDescriptionPreprocessor({"embedding": 20}).process(SAMPLE_POSTING)
+
+    assert result.tokens_saved["embedding"] > 0
+    assert embedding.value == before + result.tokens_saved["embedding"]
+    assert any(line.startswith('jra_preprocess_tokens_saved_total{stage="embedding"}') for line in PREPROCESS_TOKENS_SAVED.render())
+
+
+def test_preprocessor_keeps_text_when_everything_is_boilerplate():
+    result = JobDescriptionPreprocessor().process("Benefits\nFree lunch every day.")
+
+    assert result.cleaned == "Benefits\nFree lunch every day."
+
+
+def test_preprocessor_does_not_treat_bullets_as_headings():
+    text = "Benefits\nHealth cover.\n\nSkills:\n- Python\n- Go\n\nAbout Us\nWe ship things."
+    result = JobDescriptionPreprocessor().process(text)
+
+    assert result.cleaned == "Skills:\n\n- Python\n- Go"
+
+
+def test_preprocessor_only_drops_boilerplate_headings_and_sentences():
+    text = (
+        "Legal Operations Manager\n"
+        "Run contract workflows for a fast-growing legal team.\n\n"
+        "Requirements:\n"
+        "- Five years in legal operations\n"
+        "- Must pass a background check\n"
+        "- Experience with CLM tooling\n\n"
+        "Benefits\n"
+        "Unlimited PTO."
+    )
+    result = JobDescriptionPreprocessor().process(text)
+
+    assert result.cleaned == (
+        "Legal Operations Manager\n\n"
+        "Run contract workflows for a fast-growing legal team.\n\n"
+        "Requirements:\n\n"
+        "- Five years in legal operations\n"
+        "- Experience with CLM tooling"
+    )
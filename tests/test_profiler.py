@@ -0,0 +1,50 @@
+import threading
+import time
+
+import pytest
+
+from job_role_analyzer.profiler import ProfilerBusy, SamplingProfiler, render_collapsed
+
+
+def _spin_until(stop):
+    while not stop.is_set():
+        sum(range(100))
+
+
+def test_profiler_collapses_stacks_of_other_threads():
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin_until, args=(stop,), name="spinner")
+    worker.start()
+    try:
+        stacks = SamplingProfiler().profile(0.1, interval=0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    spinner = [stack for stack in stacks if stack.startswith("spinner;")]
+    assert spinner
+    assert any("_spin_until (test_profiler.py:" in stack for stack in spinner)
+    assert not any("SamplingProfiler._sample" in stack for stack in stacks)
+    output = render_collapsed(stacks)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in output.splitlines())
+
+
+def test_profiler_runs_one_profile_at_a_time():
+    profiler = SamplingProfiler()
+    started = threading.Event()
+    original = profiler._sample
+
+    def slow_sample(seconds, interval):
+        started.set()
+        time.sleep(0.1)
+        return original(seconds, interval)
+
+    profiler._sample = slow_sample
+    thread = threading.Thread(target=profiler.profile, args=(0.01,))
+    thread.start()
+    started.wait()
+    with pytest.raises(ProfilerBusy):
+        profiler.profile(0.01)
+    thread.join()
+    with pytest.raises(ValueError):
+        profiler.profile(0)
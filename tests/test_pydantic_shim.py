@@ -0,0 +1,69 @@
+import pickle
+from typing import Optional
+
+import pytest
+
+from pydantic_shim import BaseModel, ConfigDict, Field, field_validator
+
+
+class Skill(BaseModel):
+    name: str
+    level: int
+    type: Optional[str] = Field(default="technical")
+    tags: list = Field(default_factory=list)
+
+    model_config = ConfigDict(slots=True)
+
+    @field_validator("level", mode="before")
+    def _check_level(cls, value):
+        if int(value) > 5:
+            raise ValueError("level too high")
+        return value
+
+
+class Plain(BaseModel):
+    title: str
+    years: int = 0
+
+
+class Extended(Plain):
+    model_config = ConfigDict(slots=True)
+
+    seniority: str = "junior"
+
+    @field_validator("years")
+    def _non_negative(cls, value):
+        if value < 0:
+            raise ValueError("years must be non-negative")
+        return value
+
+
+def test_fields_are_compiled_once_and_validated_with_coercion():
+    assert [field.name for field in Skill.__shim_fields__] == ["name", "level", "type", "tags"]
+    skill = Skill(name="SQL", level="4", type=None)
+    assert (skill.level, skill.type, skill.tags) == (4, None, [])
+    assert Skill(name="Go", level=2).type == "technical"
+    with pytest.raises(ValueError):
+        Skill(name="SQL", level=9)
+    with pytest.raises(ValueError):
+        Skill(level=1)
+
+
+def test_slots_layout_is_opt_in_and_inherits_fields():
+    assert not hasattr(Skill(name="SQL", level=1), "__dict__")
+    assert hasattr(Plain(title="Dev"), "__dict__")
+
+    extended = Extended(title="Dev", years="3")
+    assert extended.model_dump() == {"title": "Dev", "years": 3, "seniority": "junior"}
+    with pytest.raises(ValueError):
+        Extended(title="Dev", years=-1)
+    assert pickle.loads(pickle.dumps(Skill(name="SQL", level=3))) == Skill(name="SQL", level=3)
+
+
+def test_model_construct_skips_validation_and_fills_defaults():
+    trusted = Skill.model_construct(name="SQL", level="9")
+    assert trusted.level == "9"
+    assert trusted.type == "technical"
+    assert trusted.tags == []
+    assert Skill.model_construct(name="A", level=1).tags is not Skill.model_construct(name="B", level=1).tags
+    assert Plain.model_construct(title="Dev").model_dump() == {"title": "Dev", "years": 0}
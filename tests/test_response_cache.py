@@ -0,0 +1,58 @@
+import json
+
+from job_role_analyzer.data_models import Competency, JobRoleSummary
+from job_role_analyzer.db import Database
+from webapp.response_cache import ResponseCache, etag_matches
+
+
+def _serialize(result):
+    return json.dumps(
+        {
+            "job_role_id": str(result.job_role.job_role_id),
+            "competencies": [comp.name for comp in result.competencies],
+        }
+    ).encode()
+
+
+def test_response_cache_serves_bytes_and_tracks_role_versions(tmp_path):
+    database = Database(path=str(tmp_path / "responses.sqlite"))
+    try:
+        role = JobRoleSummary(job_title="Writer", normalized_summary="Writes", years_experience=2)
+        database.add_job_role(role, [Competency(name="Editing", level=3)])
+        cache = ResponseCache(database, _serialize, persist=True)
+
+        first = cache.get(role.job_role_id)
+        assert first is not None
+        assert json.loads(first.body)["competencies"] == ["Editing"]
+        assert first.etag == f'"{role.job_role_id}-v1"'
+        assert cache.get(role.job_role_id) is first
+        assert database.get_cached_response(role.job_role_id) == (first.body, 1)
+
+        database.add_job_role(role, [Competency(name="Research", level=4)])
+        assert database.get_cached_response(role.job_role_id) is None
+
+        second = cache.get(role.job_role_id)
+        assert second.version == 2
+        assert json.loads(second.body)["competencies"] == ["Research"]
+        assert etag_matches(f'W/{second.etag}, "other"', second.etag)
+        assert not etag_matches(first.etag, second.etag)
+    finally:
+        database.close()
+
+
+def test_response_cache_lookup_leaves_persisting_to_the_caller(tmp_path):
+    database = Database(path=str(tmp_path / "lookup.sqlite"))
+    try:
+        role = JobRoleSummary(job_title="Writer", normalized_summary="Writes", years_experience=2)
+        database.add_job_role(role, [Competency(name="Editing", level=3)])
+        cache = ResponseCache(database, _serialize, persist=True)
+
+        entry, rebuilt = cache.lookup(role.job_role_id)
+        assert rebuilt
+        assert database.get_cached_response(role.job_role_id) is None
+
+        cache.write_back(entry)
+        assert database.get_cached_response(role.job_role_id) == (entry.body, 1)
+        assert cache.lookup(role.job_role_id) == (entry, False)
+    finally:
+        database.close()
@@ -0,0 +1,76 @@
+from uuid import uuid4
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from job_role_analyzer.data_models import Competency, JobRoleSummary  # noqa: E402
+from job_role_analyzer.db import Database  # noqa: E402
+from job_role_analyzer.shared_index import SharedVectorIndex, write_index  # noqa: E402
+from job_role_analyzer.similarity import SimilarityChecker  # noqa: E402
+
+
+class StaticEmbeddingProvider:
+    def __init__(self, vector):
+        self.vector = vector
+
+    def embed(self, text):
+        return list(self.vector)
+
+
+def _role():
+    return JobRoleSummary(job_role_id=uuid4(), job_title="Role", normalized_summary="Summary", years_experience=3)
+
+
+def test_shared_index_matches_exact_cosine_search(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((50, 8)).astype(np.float32)
+    ids = [uuid4() for _ in range(50)]
+    path = tmp_path / "roles.idx"
+    assert write_index(path, [(ids[:20], vectors[:20]), (ids[20:], vectors[20:])]) == 50
+
+    index = SharedVectorIndex(path)
+    try:
+        query = rng.standard_normal((2, 8))
+        distances, indices = index.search(query.tolist(), k=3)
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        expected = (normalized @ (query / np.linalg.norm(query, axis=1, keepdims=True)).T).T
+        for row in range(2):
+            assert indices[row] == np.argsort(-expected[row])[:3].tolist()
+            assert distances[row] == pytest.approx(np.sort(expected[row])[::-1][:3].tolist(), rel=1e-5)
+        assert index.job_role_id(indices[0][0]) == ids[indices[0][0]]
+        assert len(index) == 50 and index.dimension == 8
+    finally:
+        index.close()
+
+
+def test_empty_shared_index_returns_no_matches(tmp_path):
+    path = tmp_path / "empty.idx"
+    write_index(path, [])
+    index = SharedVectorIndex(path)
+    assert index.search([[1.0, 0.0]], k=2) == ([[0.0, 0.0]], [[-1, -1]])
+    index.close()
+
+
+def test_similarity_checker_searches_shared_and_private_indexes(tmp_path):
+    database = Database(path=str(tmp_path / "shared.db"))
+    competencies = [Competency(name=f"Skill {n}", level=3) for n in range(3)]
+    stored = _role()
+    database.add_job_role(stored, competencies, embedding=[1.0, 0.0, 0.0])
+    path = tmp_path / "roles.idx"
+    write_index(path, database.iter_embedding_blocks())
+    index = SharedVectorIndex(path)
+    try:
+        checker = SimilarityChecker(database, StaticEmbeddingProvider([0.0, 1.0, 0.0]), shared_index=index)
+        assert checker._index is None  # noqa: SLF001 - nothing was loaded from SQLite
+        assert checker.find_similar_role_id_for_embedding([0.99, 0.05, 0.0])[0] == stored.job_role_id
+
+        added = _role()
+        checker.add_to_index(added, [0.0, 1.0, 0.0])
+        assert checker.find_similar_role_id("anything")[0] == added.job_role_id
+        assert checker.find_similar_role_id_for_embedding([1.0, 0.0, 0.0])[0] == stored.job_role_id
+        with pytest.raises(ValueError):
+            checker.add_to_index(_role(), [1.0, 0.0])
+    finally:
+        index.close()
+        database.close()
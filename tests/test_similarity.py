@@ -2,7 +2,7 @@ from uuid import uuid4
 
 from job_role_analyzer.data_models import Competency, JobRoleSummary
 from job_role_analyzer.db import Database
-from job_role_analyzer.similarity import SimilarityChecker
+from job_role_analyzer.similarity import SimilarityChecker, embed_batch
 
 
 class StaticEmbeddingProvider:
@@ -57,3 +57,40 @@ def test_similarity_checker_returns_none_when_below_threshold(tmp_path):
         assert checker.find_similar_role("Unrelated description") is None
     finally:
         database.close()
+
+
+class BatchRecordingEmbeddingProvider(StaticEmbeddingProvider):
+    def __init__(self, vector):
+        super().__init__(vector)
+        self.batches = []
+
+    def embed_batch(self, texts, batch_size=32):
+        self.batches.append((list(texts), batch_size))
+        return [list(self.vector) for _ in texts]
+
+
+def test_embed_batch_falls_back_to_single_embeds():
+    matrix = embed_batch(StaticEmbeddingProvider([0.5, 0.5]), ["a", "b", "c"], batch_size=2)
+
+    assert len(matrix) == 3
+    assert [list(map(float, row)) for row in matrix] == [[0.5, 0.5]] * 3
+
+
+def test_backfill_embeds_roles_without_vectors(tmp_path):
+    db_path = tmp_path / "backfill.db"
+    database = Database(path=str(db_path))
+    try:
+        role = _store_role(database, None)
+        provider = BatchRecordingEmbeddingProvider([0.0, 1.0, 0.0])
+        checker = SimilarityChecker(database, provider)
+        assert checker.find_similar_role("anything") is None
+
+        assert checker.backfill_embeddings(batch_size=8) == 1
+        assert provider.batches == [(["Summary"], 8)]
+
+        best_match = checker.find_similar_role("anything")
+        assert best_match is not None
+        assert best_match[0].job_role_id == role.job_role_id
+        assert list(database.iter_job_roles_missing_embeddings()) == []
+    finally:
+        database.close()
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+uvicorn = pytest.importorskip("uvicorn")
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import PlainTextResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from benchmarks.load_test import run_load  # noqa: E402
+from benchmarks.stub_llm import LatencyProfile, create_app  # noqa: E402
+from webapp.llm import LLMStudioClient  # noqa: E402
+
+
+FAST = LatencyProfile(ttft_seconds=0.0, tokens_per_second=0.0)
+NORMALIZE_PROMPT = "You are an assistant that distills job descriptions into concise role summaries."
+
+
+@pytest.fixture
+def stub_server():
+    server = uvicorn.Server(uvicorn.Config(create_app(FAST), host="127.0.0.1", port=0, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not server.started and time.monotonic() < deadline:
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(5)
+
+
+def test_llm_client_parses_stub_completions(stub_server):
+    client = LLMStudioClient(stub_server, completion_path="/v1/chat/completions", model="stub")
+    try:
+        assert client.complete(NORMALIZE_PROMPT).startswith("Synthetic role summary")
+        competencies = json.loads(client.complete("List the competencies for this role."))
+    finally:
+        client.close()
+    assert 3 <= len(competencies) <= 5
+    assert all(1 <= item["level"] <= 5 for item in competencies)
+
+
+def test_stream_concatenates_to_the_non_streaming_answer():
+    http = TestClient(create_app(FAST))
+    body = {"messages": [{"role": "user", "content": NORMALIZE_PROMPT}]}
+    whole = http.post("/v1/chat/completions", json=body).json()["choices"][0]["message"]["content"]
+
+    with http.stream("POST", "/v1/chat/completions", json={**body, "stream": True}) as stream:
+        lines = [line for line in stream.iter_lines() if line.startswith("data: ")]
+    assert lines[-1] == "data: [DONE]"
+    chunks = [json.loads(line[len("data: "):]) for line in lines[:-1]]
+    assert "".join(chunk["choices"][0]["delta"].get("content", "") for chunk in chunks) == whole
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+    assert http.get("/stats").json()["streamed"] == 1
+
+
+def test_error_rate_injects_server_errors():
+    http = TestClient(create_app(LatencyProfile(ttft_seconds=0.0, tokens_per_second=0.0, error_rate=1.0)))
+    response = http.post("/v1/chat/completions", json={"messages": [{"role": "user", "content": "x"}]})
+    assert response.status_code == 500
+    assert http.get("/stats").json() == {"requests": 1, "errors": 1, "streamed": 0, "tokens": 0}
+
+
+def test_load_generator_reports_duplicates_and_avoided_llm_calls():
+    app = FastAPI()
+    seen = set()
+    prompts = {"count": 0}
+
+    @app.post("/api/analyze")
+    async def analyze(payload: dict):
+        key = payload["job_description"]
+        if key not in seen:
+            seen.add(key)
+            prompts["count"] += 2
+        return {"ok": True}
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics():
+        half = prompts["count"] // 2
+        return (
+            f'jra_stage_duration_seconds_count{{stage="normalize_jd"}} {half}\n'
+            f'jra_stage_duration_seconds_count{{stage="extract_competencies"}} {half}\n'
+        )
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await run_load(client, rps=200, duration=0.2, duplicate_ratio=0.5, seed=3)
+
+    report = asyncio.run(scenario())
+    assert report["requests"] == 40
+    assert report["succeeded"] == 40
+    assert report["statuses"] == {"200": 40}
+    assert report["llm_calls"] == 2 * (40 - report["duplicates"])
+    assert report["llm_calls_avoided"] == 2 * report["duplicates"] > 0
+    assert report["latency_ms"]["p50"] is not None
@@ -0,0 +1,212 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from job_role_analyzer import embeddings
+from job_role_analyzer.analyzer import JobRoleAnalyzer
+from job_role_analyzer.async_db import AsyncDatabase
+from job_role_analyzer.config import AnalyzerConfig
+from job_role_analyzer.db import Database
+from job_role_analyzer.jobs import JobRunner
+from job_role_analyzer.llm_interface import LLMInterface
+from webapp import dependencies, main
+from webapp.dependencies import (
+    get_admin_token,
+    get_analyzer,
+    get_async_database,
+    get_job_runner,
+    get_response_cache,
+)
+from webapp.response_cache import ResponseCache
+
+
+class StubLLMClient:
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, prompt, **kwargs):
+        self.calls += 1
+        if "distills job descriptions" in prompt:
+            return "Stub summary"
+        return json.dumps(
+            [
+                {"name": "Python", "level": 4, "type": "technical"},
+                {"name": "SQL", "level": 3, "type": "technical"},
+                {"name": "Communication", "level": 3, "type": "soft"},
+            ]
+        )
+
+
+class StaticEmbeddingProvider:
+    def embed(self, text):
+        return [1.0, 0.0, 0.0]
+
+
+@pytest.fixture
+def client(tmp_path):
+    database = Database(path=str(tmp_path / "webapp.db"))
+    llm_client = StubLLMClient()
+    analyzer = JobRoleAnalyzer(database, LLMInterface(llm_client), StaticEmbeddingProvider())
+    response_cache = ResponseCache(database, main.serialize_result)
+    async_database = AsyncDatabase(database, reader_threads=2)
+    runner = JobRunner(
+        database,
+        lambda payload: main.run_analysis_job(analyzer, response_cache, payload),
+        workers=1,
+        poll_interval=0.05,
+    )
+    runner.start()
+    main.app.dependency_overrides[get_analyzer] = lambda: analyzer
+    main.app.dependency_overrides[get_async_database] = lambda: async_database
+    main.app.dependency_overrides[get_job_runner] = lambda: runner
+    main.app.dependency_overrides[get_response_cache] = lambda: response_cache
+    main._classify_analyze_request.database_provider = lambda: async_database
+    try:
+        yield TestClient(main.app), llm_client
+    finally:
+        main.app.dependency_overrides.clear()
+        main._classify_analyze_request.database_provider = get_async_database
+        runner.stop()
+        async_database.close()
+        database.close()
+
+
+PAYLOAD = {
+    "job_title": "Data Engineer",
+    "job_description": "Build batch and streaming pipelines",
+    "years_of_experience": 4,
+}
+
+
+def test_analyze_serves_cached_bytes_with_etag_revalidation(client):
+    http, llm_client = client
+
+    created = http.post("/api/analyze", json=PAYLOAD)
+    assert created.status_code == 200
+    etag = created.headers["etag"]
+    assert created.json()["normalized_job_role_summary"] == "Stub summary"
+
+    repeated = http.post("/api/analyze", json=PAYLOAD)
+    assert repeated.status_code == 200
+    assert repeated.content == created.content
+    assert repeated.headers["etag"] == etag
+    assert llm_client.calls == 2
+
+    revalidated = http.post("/api/analyze", json=PAYLOAD, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_analyze_reports_index_errors_while_persisting_as_bad_request(client, monkeypatch):
+    http, _ = client
+    analyzer = main.app.dependency_overrides[get_analyzer]()
+
+    def reject(job_role, embedding):
+        raise ValueError("Embedding dimensionality must remain consistent for FAISS index.")
+
+    monkeypatch.setattr(analyzer.similarity_checker, "add_to_index", reject)
+    response = http.post("/api/analyze", json=PAYLOAD)
+
+    assert response.status_code == 400
+    assert "dimensionality" in response.json()["detail"]
+
+
+def test_analytics_endpoints_answer_from_aggregates(client):
+    http, _ = client
+    assert http.post("/api/analyze", json=PAYLOAD).status_code == 200
+
+    top = http.get("/api/analytics/top-competencies", params={"job_title": "data engineer", "limit": 2})
+    assert top.status_code == 200
+    assert [item["name"] for item in top.json()["competencies"]] == ["Communication", "Python"]
+
+    levels = http.get("/api/analytics/competencies/python/levels")
+    assert levels.json() == {"name": "python", "levels": {"4": 1}}
+    assert http.get("/api/analytics/competencies/rust/levels").status_code == 404
+
+
+def test_jobs_endpoint_queues_analysis_and_delivers_result(client):
+    http, llm_client = client
+
+    accepted = http.post("/api/jobs", json=PAYLOAD)
+    assert accepted.status_code == 202
+    job = accepted.json()
+    assert accepted.headers["location"] == job["status_url"]
+
+    with http.stream("GET", job["events_url"]) as stream:
+        body = "".join(stream.iter_text())
+    events = [block for block in body.split("\n\n") if block.startswith("event:")]
+    assert events[-1].startswith("event: result")
+    result = json.loads(events[-1].split("data: ", 1)[1])
+    assert result["normalized_job_role_summary"] == "Stub summary"
+
+    status = http.get(job["status_url"]).json()
+    assert status["status"] == "succeeded"
+    assert status["result"] == result
+    assert llm_client.calls == 2
+
+    again = http.post("/api/jobs", json=PAYLOAD).json()
+    with http.stream("GET", again["events_url"]) as stream:
+        assert "event: result" in "".join(stream.iter_text())
+    assert llm_client.calls == 2
+    assert http.get("/api/jobs/unknown").status_code == 404
+
+
+def test_metrics_endpoint_exposes_stage_latencies(client):
+    http, _ = client
+    http.post("/api/analyze", json=PAYLOAD)
+    http.post("/api/analyze", json={**PAYLOAD, "job_description": "Different wording for the same pipelines"})
+
+    response = http.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    for stage in ("normalize_jd", "extract_competencies", "embedding", "sqlite_lookup", "sqlite_write"):
+        assert f'jra_stage_duration_seconds_count{{stage="{stage}"}}' in body
+    assert 'jra_similarity_lookups_total{result="hit"}' in body
+    assert "jra_similarity_index_size 1" in body
+
+
+def test_analyze_reports_stage_breakdown_in_server_timing(client):
+    http, _ = client
+    created = http.post("/api/analyze", json=PAYLOAD)
+    stages = [entry.split(";")[0] for entry in created.headers["server-timing"].split(", ")]
+    for stage in (
+        "preprocess",
+        "sqlite_lookup",
+        "embedding",
+        "normalize_jd",
+        "extract_competencies",
+        "sqlite_write",
+        "total",
+        "admission",
+    ):
+        assert stage in stages
+
+    repeated = http.post("/api/analyze", json=PAYLOAD)
+    stages = [entry.split(";")[0] for entry in repeated.headers["server-timing"].split(", ")]
+    assert "response_cache" in stages
+    assert "normalize_jd" not in stages
+
+
+def test_profile_endpoint_requires_admin_token(client):
+    http, _ = client
+    assert http.post("/admin/profile", params={"seconds": 0.05}).status_code == 404
+
+    main.app.dependency_overrides[get_admin_token] = lambda: "secret"
+    assert http.post("/admin/profile", params={"seconds": 0.05}, headers={"X-Admin-Token": "wrong"}).status_code == 403
+    response = http.post("/admin/profile", params={"seconds": 0.05}, headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert response.headers["content-disposition"].startswith("attachment;")
+    line = response.text.splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert int(count) >= 1 and ";" in stack
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_missing_sentence_transformers_fails_fast(monkeypatch, workers):
+    monkeypatch.setattr(embeddings, "SentenceTransformer", None)
+    with pytest.raises(ModuleNotFoundError, match="hashing"):
+        dependencies._build_embedding_provider(AnalyzerConfig(embedding_workers=workers))
+    provider = dependencies._build_embedding_provider(AnalyzerConfig(embedding_model="hashing:64"))
+    assert len(provider.embed("python")) == 64
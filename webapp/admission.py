@@ -0,0 +1,280 @@
+"""Admission control for expensive routes: concurrency caps, bounded priority queues, shedding."""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import itertools
+import json
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_CACHED = 0
+PRIORITY_DEFAULT = 1
+DEFAULT_MAX_BODY_BYTES = 2**20
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+Classifier = Callable[[Scope, bytes], Awaitable[int]]
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str, retry_after: float) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _BodyTooLarge(Exception):
+    pass
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    future: asyncio.Future = field(compare=False)
+
+
+class AdmissionController:
+    """Admit up to ``limit`` concurrent requests; queue up to ``max_queue`` more by priority.
+
+    Lower priority values are served first, FIFO within a priority. When the queue is full
+    a newcomer displaces the lowest-priority waiter if it outranks it, otherwise it is shed.
+    Requests whose estimated wait exceeds ``queue_timeout`` are shed immediately instead of
+    timing out later.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        max_queue: int,
+        queue_timeout: float,
+        *,
+        initial_service_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._clock = clock
+        self._active = 0
+        self._queue: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._service_seconds = initial_service_seconds
+        self._admitted = 0
+        self._rejected = 0
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def estimated_wait(self, position: int) -> float:
+        """Seconds until the waiter at ``position`` (0-based) is likely to be admitted."""
+        # Slots free up one at a time, about every service_seconds / limit on average.
+        return (position + 1) / self.limit * self._service_seconds
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.estimated_wait(len(self._queue))))
+
+    async def acquire(self, priority: int = PRIORITY_DEFAULT) -> None:
+        if self._active < self.limit and not self._queue:
+            self._active += 1
+            self._admitted += 1
+            return
+        waiter = _Waiter(priority, next(self._sequence), asyncio.get_running_loop().create_future())
+        position = bisect.bisect(self._queue, waiter)
+        if self.estimated_wait(position) > self.queue_timeout:
+            self._reject("estimated wait exceeds queue deadline")
+        if len(self._queue) >= self.max_queue:
+            if not self._queue or self._queue[-1].priority <= priority:
+                self._reject("admission queue full")
+            displaced = self._queue.pop()
+            displaced.future.set_exception(self._rejection("displaced by higher-priority request"))
+            self._rejected += 1
+        bisect.insort(self._queue, waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            self._reject("queue deadline exceeded")
+        except asyncio.CancelledError:
+            self._discard(waiter)
+            raise
+        self._admitted += 1
+
+    def release(self, service_seconds: float | None = None) -> None:
+        if service_seconds is not None:
+            # Exponentially weighted so estimates track the current mix of hits and misses.
+            self._service_seconds = 0.8 * self._service_seconds + 0.2 * service_seconds
+        self._active -= 1
+        while self._queue and self._active < self.limit:
+            waiter = self._queue.pop(0)
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                self._active += 1
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "active": self._active,
+            "queued": len(self._queue),
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "service_seconds": round(self._service_seconds, 4),
+        }
+
+    def _discard(self, waiter: _Waiter) -> None:
+        if waiter in self._queue:
+            self._queue.remove(waiter)
+        elif waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+            # Granted just as the caller gave up; hand the slot on.
+            self.release()
+
+    def _rejection(self, reason: str) -> AdmissionRejected:
+        return AdmissionRejected(reason, self.retry_after())
+
+    def _reject(self, reason: str) -> None:
+        self._rejected += 1
+        raise self._rejection(reason)
+
+
+class AdmissionMiddleware:
+    """ASGI middleware gating ``(method, path)`` routes through :class:`AdmissionController`.
+
+    ``classifiers`` may map a route to a coroutine that inspects the buffered request body
+    and returns a priority, e.g. :data:`PRIORITY_CACHED` for requests likely to be cache hits.
+    Bodies are only buffered up to ``max_body_bytes``; larger requests get ``413`` before
+    they take a queue slot or more memory.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        *,
+        controllers: Mapping[Tuple[str, str], AdmissionController],
+        classifiers: Mapping[Tuple[str, str], Classifier] | None = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    ) -> None:
+        self.app = app
+        self.controllers = dict(controllers)
+        self.classifiers = dict(classifiers or {})
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        route = (scope.get("method", ""), scope.get("path", ""))
+        controller = self.controllers.get(route) if scope["type"] == "http" else None
+        if controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        arrived = time.monotonic()
+        priority = PRIORITY_DEFAULT
+        classifier = self.classifiers.get(route)
+        if classifier is not None:
+            try:
+                if _content_length(scope) > self.max_body_bytes:
+                    raise _BodyTooLarge
+                body, receive = await _buffer_body(receive, self.max_body_bytes)
+            except _BodyTooLarge:
+                await _send_json(send, 413, f"Request body exceeds {self.max_body_bytes} bytes.")
+                return
+            try:
+                priority = await classifier(scope, body)
+            except Exception:  # noqa: BLE001 - classification is best effort
+                logger.debug("Admission classifier failed for %s %s", *route, exc_info=True)
+
+        try:
+            await controller.acquire(priority)
+        except AdmissionRejected as exc:
+            await _send_unavailable(send, exc)
+            return
+        started = time.monotonic()
+        try:
+            await self.app(scope, receive, _with_server_timing(send, "admission", started - arrived))
+        finally:
+            controller.release(time.monotonic() - started)
+
+
+def _with_server_timing(send: Send, name: str, seconds: float) -> Send:
+    """Add a ``Server-Timing`` entry for time spent before the app saw the request."""
+    entry = f"{name};dur={seconds * 1000:.1f}".encode("ascii")
+
+    async def wrapped(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            message = {**message, "headers": [*message.get("headers", []), (b"server-timing", entry)]}
+        await send(message)
+
+    return wrapped
+
+
+def _content_length(scope: Scope) -> int:
+    for name, value in scope.get("headers", []):
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+async def _buffer_body(receive: Receive, limit: int) -> Tuple[bytes, Receive]:
+    chunks: List[bytes] = []
+    messages: List[Message] = []
+    size = 0
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        size += len(chunks[-1])
+        if size > limit:
+            raise _BodyTooLarge
+        if not message.get("more_body", False):
+            break
+
+    async def replay() -> Message:
+        if messages:
+            return messages.pop(0)
+        return await receive()
+
+    return b"".join(chunks), replay
+
+
+async def _send_unavailable(send: Send, rejection: AdmissionRejected) -> None:
+    retry_after = str(max(1, math.ceil(rejection.retry_after))).encode("ascii")
+    await _send_json(send, 503, f"Server busy: {rejection.reason}", [(b"retry-after", retry_after)])
+
+
+async def _send_json(
+    send: Send,
+    status: int,
+    detail: str,
+    headers: List[Tuple[bytes, bytes]] | None = None,
+) -> None:
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                *(headers or []),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
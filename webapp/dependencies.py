@@ -1,8 +1,11 @@
 """Dependency helpers for the FastAPI application."""
 from __future__ import annotations
 
+import hmac
 from functools import lru_cache
 
+from fastapi import Depends, Header, HTTPException
+
 from job_role_analyzer import (
     Database,
     JobRoleAnalyzer,
@@ -10,9 +13,31 @@ from job_role_analyzer import (
     TemplateRenderer,
     load_config,
 )
-from job_role_analyzer.embeddings import SentenceTransformerEmbeddingProvider
+from job_role_analyzer import embeddings
+from job_role_analyzer.async_db import AsyncDatabase
+from job_role_analyzer.batching import MicroBatchingEmbeddingProvider
+from job_role_analyzer.embedding_pool import ProcessPoolEmbeddingProvider
+from job_role_analyzer.embeddings import (
+    HASHING_MODEL_NAME,
+    HashingEmbeddingProvider,
+    SentenceTransformerEmbeddingProvider,
+)
+from job_role_analyzer.jobs import JobRunner
+from job_role_analyzer.shared_index import SharedVectorIndex
+from job_role_analyzer.similarity import EmbeddingProvider
 
 from .llm import LLMStudioClient
+from .response_cache import ResponseCache
+
+
+_shared_index: SharedVectorIndex | None = None
+
+
+def use_shared_index(index: SharedVectorIndex | None) -> None:
+    """Have :func:`get_analyzer` search ``index`` instead of loading stored vectors itself."""
+    global _shared_index
+    _shared_index = index
+    get_analyzer.cache_clear()
 
 
 @lru_cache(maxsize=1)
@@ -21,8 +46,63 @@ def get_analyzer() -> JobRoleAnalyzer:
     database = Database(config.database_path)
     llm_client = _build_llm_client(config)
     llm_interface = LLMInterface(llm_client, TemplateRenderer())
-    embedding_provider = _build_embedding_provider(config.embedding_model)
-    return JobRoleAnalyzer(database, llm_interface, embedding_provider)
+    embedding_provider = _build_embedding_provider(config)
+    return JobRoleAnalyzer(database, llm_interface, embedding_provider, shared_index=_shared_index)
+
+
+@lru_cache(maxsize=1)
+def get_async_database() -> AsyncDatabase:
+    config = load_config()
+    return AsyncDatabase(get_analyzer().db, reader_threads=config.database_reader_threads)
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    from .main import serialize_result
+
+    config = load_config()
+    return ResponseCache(
+        get_analyzer().db,
+        serialize_result,
+        maxsize=config.response_cache_size,
+        persist=config.response_cache_persist,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_job_runner() -> JobRunner:
+    """Build and start the analysis job workers; queued and orphaned jobs resume at once."""
+    from .main import run_analysis_job
+
+    config = load_config()
+    analyzer = get_analyzer()
+    response_cache = get_response_cache()
+    runner = JobRunner(
+        analyzer.db,
+        lambda payload: run_analysis_job(analyzer, response_cache, payload),
+        workers=config.job_workers,
+        lease_seconds=config.job_lease_seconds,
+        max_attempts=config.job_max_attempts,
+        poll_interval=config.job_poll_interval_seconds,
+    )
+    runner.start()
+    return runner
+
+
+@lru_cache(maxsize=1)
+def get_admin_token() -> str | None:
+    return load_config().admin_token or None
+
+
+def require_admin(
+    x_admin_token: str | None = Header(default=None),
+    admin_token: str | None = Depends(get_admin_token),
+) -> None:
+    """Gate admin endpoints on the ``X-Admin-Token`` header; they do not exist without a token."""
+    if admin_token is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token.encode(), admin_token.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
 
 
 def _build_llm_client(config) -> LLMStudioClient:
@@ -38,5 +118,29 @@ def _build_llm_client(config) -> LLMStudioClient:
     )
 
 
-def _build_embedding_provider(model_name: str) -> SentenceTransformerEmbeddingProvider:
-    return SentenceTransformerEmbeddingProvider(model_name)
+def _build_embedding_provider(config) -> EmbeddingProvider:
+    provider: EmbeddingProvider
+    if config.embedding_model.split(":", 1)[0] == HASHING_MODEL_NAME:
+        return HashingEmbeddingProvider.from_model_name(config.embedding_model)
+    if embeddings.SentenceTransformer is None:
+        # No silent fallback: hashing vectors would not match the dimension of stored ones.
+        raise ModuleNotFoundError(
+            f"sentence-transformers is required for embedding_model {config.embedding_model!r}; "
+            "install it, or set embedding_model to 'hashing' and re-embed the stored roles."
+        )
+    if config.embedding_workers > 0:
+        provider = ProcessPoolEmbeddingProvider(
+            config.embedding_model,
+            workers=config.embedding_workers,
+            threads_per_worker=config.embedding_worker_threads,
+            cpu_affinity=config.embedding_worker_cpu_affinity,
+        )
+    else:
+        provider = SentenceTransformerEmbeddingProvider(config.embedding_model)
+    if config.embedding_batching_enabled:
+        provider = MicroBatchingEmbeddingProvider(
+            provider,
+            max_batch_size=config.embedding_batch_max_items,
+            max_wait_ms=config.embedding_batch_window_ms,
+        )
+    return provider
@@ -0,0 +1,51 @@
+"""Command line entry point that serves the similarity index to local web workers."""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import threading
+
+from job_role_analyzer import load_config
+from job_role_analyzer.db import Database
+from job_role_analyzer.index_sidecar import IndexSidecarServer
+
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> None:
+    config = load_config()
+    parser = argparse.ArgumentParser(description="Serve the similarity index over a Unix domain socket")
+    parser.add_argument("--socket", default=config.similarity_sidecar_socket, help="Path of the Unix socket to listen on")
+    parser.add_argument("--database", help="Path to the SQLite database (defaults to the configured path)")
+    parser.add_argument("--chunk-size", type=int, default=config.index_build_chunk_size, help="Vectors read per block")
+    parser.add_argument(
+        "--max-k", type=int, default=config.similarity_sidecar_max_k, help="Most neighbours returned per query"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    database = Database(path=args.database)
+    server = IndexSidecarServer(args.socket, database, chunk_size=args.chunk_size, max_k=args.max_k)
+
+    def stop(signum, frame) -> None:
+        # shutdown() waits for serve_forever() to return, so it cannot run on the serving thread.
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    logger.info("Index sidecar listening on %s", args.socket)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Command line entry point for resumable bulk ingestion of job postings."""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from job_role_analyzer.ingestion import SUPPORTED_FORMATS, IngestionPipeline, read_records
+
+from .dependencies import get_analyzer
+
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Bulk-ingest job postings from JSONL or CSV")
+    parser.add_argument("input", help="Path to a JSONL or CSV file of postings")
+    parser.add_argument("--format", choices=SUPPORTED_FORMATS, help="Input format (defaults to the file extension)")
+    parser.add_argument("--batch-size", type=int, default=50, help="Records committed per transaction")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum parallel LLM analyses")
+    parser.add_argument(
+        "--source",
+        help="Checkpoint key for resuming (defaults to the absolute input path)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        logger.error("Input file %s does not exist", input_path)
+        sys.exit(1)
+
+    pipeline = IngestionPipeline(
+        get_analyzer(),
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+    )
+    stats = pipeline.run(
+        read_records(input_path, args.format),
+        source=args.source or str(input_path.resolve()),
+    )
+    print(json.dumps(stats.as_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
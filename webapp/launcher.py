@@ -54,6 +54,18 @@ def main(argv: list[str] | None = None) -> None:
     parser.add_argument("--host", default="0.0.0.0", help="Host interface for the FastAPI app")
     parser.add_argument("--port", type=int, default=8000, help="Port for the FastAPI app")
     parser.add_argument("--reload", action="store_true", help="Enable uvicorn reload mode")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
+    parser.add_argument(
+        "--preload",
+        action="store_true",
+        help="Load the model, templates and a memory-mapped index once, then fork workers that share them",
+    )
+    parser.add_argument(
+        "--memory-report-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between per-worker memory reports in --preload mode (0 disables)",
+    )
     parser.add_argument("--llm-attempts", type=int, default=10, help="Maximum LLM connectivity attempts (0 for infinite)")
     parser.add_argument(
         "--llm-interval",
@@ -83,11 +95,30 @@ def main(argv: list[str] | None = None) -> None:
         logger.error("LLM preflight failed: %s", exc)
         sys.exit(1)
 
+    if args.preload:
+        if args.reload:
+            logger.error("--preload cannot be combined with --reload")
+            sys.exit(2)
+        from .prefork import PreforkServer
+
+        try:
+            PreforkServer(
+                args.host,
+                args.port,
+                args.workers,
+                memory_report_interval=args.memory_report_interval,
+            ).serve()
+        except ValueError as exc:
+            logger.error("Preload failed: %s", exc)
+            sys.exit(1)
+        return
+
     uvicorn.run(
         "webapp.main:app",
         host=args.host,
         port=args.port,
         reload=args.reload,
+        workers=None if args.reload else args.workers,
     )
 
 
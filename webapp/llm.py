@@ -7,6 +7,7 @@ from typing import Any
 import httpx
 
 from job_role_analyzer.llm_interface import LLMClient
+from job_role_analyzer.metrics import LLM_ERRORS, LLM_IN_FLIGHT, time_stage
 
 
 logger = logging.getLogger(__name__)
@@ -51,14 +52,26 @@ class LLMStudioClient(LLMClient):
         request_url = f"{self._base_url}{self._completion_path}"
         logger.info("LLMStudio POST %s", request_url)
 
-        response = self._client.post(
-            self._completion_path,
-            json=payload,
-            headers=self._headers(),
-        )
-        response.raise_for_status()
+        LLM_IN_FLIGHT.inc()
+        try:
+            with time_stage("llm_request"):
+                response = self._client.post(
+                    self._completion_path,
+                    json=payload,
+                    headers=self._headers(),
+                )
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            LLM_ERRORS.labels("http_status").inc()
+            raise
+        except httpx.HTTPError:
+            LLM_ERRORS.labels("transport").inc()
+            raise
+        finally:
+            LLM_IN_FLIGHT.dec()
         text = self._extract_text(response.json())
         if text is None:
+            LLM_ERRORS.labels("unparseable").inc()
             raise ValueError("Unable to parse completion text from LLMStudio response")
         return text.strip()
 
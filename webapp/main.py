@@ -1,23 +1,84 @@
 """FastAPI application providing a UI for the job role analyzer."""
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import time
 from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
+from job_role_analyzer import load_config
+from job_role_analyzer.analyzer import compute_content_hash
+from job_role_analyzer.async_db import AsyncDatabase
 from job_role_analyzer.data_models import JobRoleWithCompetencies
+from job_role_analyzer.jobs import AnalysisJob, JobRunner
+from job_role_analyzer.metrics import REGISTRY, StageTimings
+from job_role_analyzer.profiler import ProfilerBusy, SamplingProfiler, render_collapsed
 
-from .dependencies import get_analyzer
+from .admission import PRIORITY_CACHED, PRIORITY_DEFAULT, AdmissionController, AdmissionMiddleware
+from .dependencies import (
+    get_analyzer,
+    get_async_database,
+    get_job_runner,
+    get_response_cache,
+    require_admin,
+)
+from .response_cache import CachedResponse, ResponseCache, etag_matches
 
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
 app = FastAPI(title="Job Role Analyzer")
+
+
+class _ContentHashClassifier:
+    """Put requests whose exact content is already stored ahead of ones that need the LLM."""
+
+    def __init__(self, database_provider: Callable[[], AsyncDatabase]) -> None:
+        self.database_provider = database_provider
+
+    async def __call__(self, scope: Dict[str, Any], body: bytes) -> int:
+        payload = json.loads(body)
+        content_hash = compute_content_hash(
+            payload["job_title"], payload["job_description"], payload["years_of_experience"]
+        )
+        existing = await self.database_provider().find_job_role_id_by_content_hash(content_hash)
+        return PRIORITY_CACHED if existing is not None else PRIORITY_DEFAULT
+
+
+_classify_analyze_request = _ContentHashClassifier(get_async_database)
+
+
+def _install_admission_control(config) -> None:
+    controllers = {}
+    for route, limit in config.admission_route_limits.items():
+        method, _, path = route.partition(" ")
+        controllers[(method.upper(), path)] = AdmissionController(
+            int(limit),
+            config.admission_queue_size,
+            config.admission_queue_timeout_seconds,
+        )
+    app.add_middleware(
+        AdmissionMiddleware,
+        controllers=controllers,
+        classifiers={("POST", "/api/analyze"): _classify_analyze_request},
+        max_body_bytes=config.admission_max_body_bytes,
+    )
+
+
+_config = load_config()
+_profiler = SamplingProfiler()
+if _config.admission_control_enabled:
+    _install_admission_control(_config)
+# Added last so it wraps admission control and shed responses still carry CORS headers.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -47,21 +108,44 @@ class AnalyzeResponse(BaseModel):
     competencies: list[CompetencyDTO]
 
 
+class JobAcceptedResponse(BaseModel):
+    job_id: str
+    status: str
+    status_url: str
+    events_url: str
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    attempts: int
+    error: str | None
+    result: AnalyzeResponse | None
+
+
+class TopCompetencyDTO(BaseModel):
+    name: str
+    role_count: int
+    average_level: float
+
+
+class TopCompetenciesResponse(BaseModel):
+    job_title: str
+    years_of_experience: int | None
+    competencies: list[TopCompetencyDTO]
+
+
+class LevelDistributionResponse(BaseModel):
+    name: str
+    levels: dict[int, int]
+
+
 @app.get("/", response_class=FileResponse)
 async def index() -> FileResponse:
     return FileResponse(static_dir / "index.html")
 
 
-@app.post("/api/analyze", response_model=AnalyzeResponse)
-async def analyze(request: AnalyzeRequest, analyzer=Depends(get_analyzer)) -> AnalyzeResponse:
-    try:
-        result: JobRoleWithCompetencies = analyzer.analyze(
-            job_title=request.job_title,
-            job_description=request.job_description,
-            years_of_experience=request.years_of_experience,
-        )
-    except ValueError as exc:  # pragma: no cover - runtime validation
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
+def serialize_result(result: JobRoleWithCompetencies) -> bytes:
     job_role = result.job_role
     return AnalyzeResponse(
         job_role_id=str(job_role.job_role_id),
@@ -70,13 +154,266 @@ async def analyze(request: AnalyzeRequest, analyzer=Depends(get_analyzer)) -> An
             CompetencyDTO(name=item.name, level=item.level, type=item.type)
             for item in result.competencies
         ],
+    ).model_dump_json().encode("utf-8")
+
+
+def _cached_json_response(
+    entry: CachedResponse,
+    if_none_match: str | None,
+    timings: StageTimings | None = None,
+) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if timings is not None:
+        headers["Server-Timing"] = timings.server_timing()
+    if etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+@app.post("/api/analyze", response_model=AnalyzeResponse)
+async def analyze(
+    request: AnalyzeRequest,
+    analyzer=Depends(get_analyzer),
+    database: AsyncDatabase = Depends(get_async_database),
+    response_cache: ResponseCache = Depends(get_response_cache),
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    timings = StageTimings()
+    try:
+        # Only SQLite work goes to the database's small reader pool; preprocessing and
+        # embedding inference run on the general threadpool so they cannot starve reads.
+        resolution = await run_in_threadpool(
+            analyzer.prepare,
+            job_title=request.job_title,
+            job_description=request.job_description,
+            years_of_experience=request.years_of_experience,
+            timings=timings,
+        )
+        await database.run_read(analyzer.match_content_hash, resolution, timings=timings)
+        if resolution.existing_role_id is None:
+            await run_in_threadpool(analyzer.match_similar, resolution, timings=timings)
+        if resolution.existing_role_id is not None:
+            with timings.measure("response_cache"):
+                cached, rebuilt = await database.run_read(response_cache.lookup, resolution.existing_role_id)
+                if rebuilt:
+                    await database.run_write(response_cache.write_back, cached)
+            if cached is not None:
+                return _cached_json_response(cached, if_none_match, timings)
+        generated = await run_in_threadpool(
+            analyzer.generate,
+            job_title=request.job_title,
+            years_of_experience=request.years_of_experience,
+            resolution=resolution,
+            timings=timings,
+        )
+        result = await database.run_write(analyzer.persist, generated, timings=timings)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=str(exc),
+            headers={"Server-Timing": timings.server_timing()},
+        ) from exc
+    with timings.measure("response_cache"):
+        entry = await database.run_write(response_cache.store, result)
+    return _cached_json_response(entry, if_none_match, timings)
+
+
+def run_analysis_job(analyzer, response_cache: ResponseCache, payload: Dict[str, Any]) -> bytes:
+    """Job handler: the same resolve/cache/generate flow as ``/api/analyze``, off the request path."""
+    request = AnalyzeRequest(**payload)
+    resolution = analyzer.resolve(
+        job_title=request.job_title,
+        job_description=request.job_description,
+        years_of_experience=request.years_of_experience,
     )
+    if resolution.existing_role_id is not None:
+        cached = response_cache.get(resolution.existing_role_id)
+        if cached is not None:
+            return cached.body
+    result = analyzer.analyze_resolved(
+        job_title=request.job_title,
+        years_of_experience=request.years_of_experience,
+        resolution=resolution,
+    )
+    return response_cache.store(result).body
+
+
+def _job_status_body(job: AnalysisJob) -> bytes:
+    # The stored result is already a serialized AnalyzeResponse; splice it in as-is.
+    head = json.dumps(
+        {"job_id": job.job_id, "status": job.status, "attempts": job.attempts, "error": job.error}
+    )
+    return head[:-1].encode("utf-8") + b', "result": ' + (job.result or b"null") + b"}"
+
+
+def _sse_event(event: str, data: bytes) -> bytes:
+    return b"event: " + event.encode("ascii") + b"\ndata: " + data + b"\n\n"
+
+
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+async def _job_events(job_id: str, runner: JobRunner, database: AsyncDatabase) -> AsyncIterator[bytes]:
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+
+    def listener(changed_job_id: str) -> None:
+        if changed_job_id == job_id:
+            loop.call_soon_threadsafe(changed.set)
+
+    runner.add_listener(listener)
+    try:
+        last_status = None
+        last_sent = time.monotonic()
+        while True:
+            changed.clear()
+            job = await database.run_read(runner.get, job_id)
+            if job is None:
+                yield _sse_event("failed", json.dumps({"detail": "Job not found"}).encode("utf-8"))
+                return
+            if job.status != last_status:
+                last_status = job.status
+                last_sent = time.monotonic()
+                yield _sse_event("status", json.dumps({"job_id": job_id, "status": job.status}).encode("utf-8"))
+            if job.done:
+                if job.result is not None:
+                    yield _sse_event("result", job.result)
+                else:
+                    yield _sse_event("failed", json.dumps({"detail": job.error}).encode("utf-8"))
+                return
+            if time.monotonic() - last_sent >= SSE_KEEPALIVE_SECONDS:
+                last_sent = time.monotonic()
+                yield b": keepalive\n\n"
+            # Listener wake-ups cover this process; the timeout picks up workers in other processes.
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=runner.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        runner.remove_listener(listener)
+
+
+@app.post("/api/jobs", response_model=JobAcceptedResponse, status_code=202)
+async def submit_job(
+    request: AnalyzeRequest,
+    runner: JobRunner = Depends(get_job_runner),
+    database: AsyncDatabase = Depends(get_async_database),
+) -> Response:
+    job = await database.run_write(runner.submit, request.model_dump())
+    accepted = JobAcceptedResponse(
+        job_id=job.job_id,
+        status=job.status,
+        status_url=f"/api/jobs/{job.job_id}",
+        events_url=f"/api/jobs/{job.job_id}/events",
+    )
+    return Response(
+        content=accepted.model_dump_json(),
+        status_code=202,
+        media_type="application/json",
+        headers={"Location": accepted.status_url},
+    )
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobStatusResponse)
+async def job_status(
+    job_id: str,
+    runner: JobRunner = Depends(get_job_runner),
+    database: AsyncDatabase = Depends(get_async_database),
+) -> Response:
+    job = await database.run_read(runner.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return Response(content=_job_status_body(job), media_type="application/json")
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def job_events(
+    job_id: str,
+    runner: JobRunner = Depends(get_job_runner),
+    database: AsyncDatabase = Depends(get_async_database),
+) -> StreamingResponse:
+    if await database.run_read(runner.get, job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        _job_events(job_id, runner, database),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/analytics/top-competencies", response_model=TopCompetenciesResponse)
+async def top_competencies(
+    job_title: str,
+    years_of_experience: int | None = Query(default=None, ge=0),
+    limit: int = Query(default=10, ge=1, le=100),
+    database: AsyncDatabase = Depends(get_async_database),
+) -> TopCompetenciesResponse:
+    rows = await database.top_competencies(job_title, years_of_experience, limit=limit)
+    return TopCompetenciesResponse(
+        job_title=job_title,
+        years_of_experience=years_of_experience,
+        competencies=[TopCompetencyDTO(**row) for row in rows],
+    )
+
+
+@app.get("/api/analytics/competencies/{name}/levels", response_model=LevelDistributionResponse)
+async def competency_levels(
+    name: str,
+    database: AsyncDatabase = Depends(get_async_database),
+) -> LevelDistributionResponse:
+    levels = await database.competency_level_distribution(name)
+    if levels is None:
+        raise HTTPException(status_code=404, detail=f"Unknown competency: {name}")
+    return LevelDistributionResponse(name=name, levels=levels)
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    return Response(content=REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.post("/admin/profile", dependencies=[Depends(require_admin)])
+async def profile(
+    seconds: float = Query(default=10.0, gt=0),
+    interval_ms: float = Query(default=5.0, ge=1, le=1000),
+) -> Response:
+    """Sample every thread for ``seconds`` and return a collapsed-stack flamegraph input."""
+    if seconds > _config.profiler_max_seconds:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {_config.profiler_max_seconds}")
+    try:
+        stacks = await run_in_threadpool(_profiler.profile, seconds, interval_ms / 1000.0)
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    filename = time.strftime("profile-%Y%m%dT%H%M%S.folded", time.gmtime())
+    return Response(
+        content=render_collapsed(stacks),
+        media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@app.on_event("startup")
+async def start_job_workers() -> None:
+    # Resumes jobs left queued or orphaned by a previous process without waiting for traffic.
+    get_job_runner()
 
 
 @app.on_event("shutdown")
 async def close_dependencies() -> None:
     analyzer = get_analyzer()
+    get_job_runner().stop()
+    role_cache_stats = analyzer.db.role_cache_stats()
+    if role_cache_stats is not None:
+        logging.getLogger(__name__).info("Role cache stats: %s", role_cache_stats)
+    get_async_database().close()
     analyzer.db.close()
+    embedding_provider = analyzer.similarity_checker.embedding_provider
+    stats = getattr(embedding_provider, "stats", None)
+    if callable(stats):
+        logging.getLogger(__name__).info("Embedding dispatcher stats: %s", stats())
+    close_provider = getattr(embedding_provider, "close", None)
+    if callable(close_provider):
+        close_provider()
     llm_client = analyzer.llm_interface.client
     close = getattr(llm_client, "close", None)
     if callable(close):
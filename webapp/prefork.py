@@ -0,0 +1,206 @@
+"""Preload-and-fork serving: load once in a master process, then fork uvicorn workers.
+
+The master loads the embedding model, compiles the prompt templates and writes the
+stored vectors into a memory-mapped :class:`SharedVectorIndex` before forking, so workers
+share those pages instead of each building a copy. It then supervises the workers,
+restarting any that die, and periodically logs each worker's unique (private) memory.
+"""
+from __future__ import annotations
+
+import gc
+import json
+import logging
+import os
+import signal
+import socket
+import tempfile
+import time
+from typing import Dict, List
+
+import uvicorn
+
+from job_role_analyzer import Database, load_config
+from job_role_analyzer.metrics import process_memory
+from job_role_analyzer.shared_index import SharedVectorIndex, write_index
+
+from . import dependencies
+
+
+logger = logging.getLogger(__name__)
+
+_MIB = 2**20
+# A worker that dies this soon after starting counts as a failed start.
+FAST_EXIT_SECONDS = 10.0
+MAX_FAST_EXITS = 5
+MAX_RESTART_DELAY_SECONDS = 30.0
+
+
+def build_shared_index(database_path: str, chunk_size: int, directory: str | None = None) -> SharedVectorIndex:
+    """Write stored vectors to a fresh index file and map it.
+
+    The file is unlinked straight away: the mapping stays valid and is inherited by
+    every forked worker, and nothing is left behind if the master is killed.
+    """
+    if directory is None and os.path.isdir("/dev/shm"):
+        directory = "/dev/shm"
+    handle, path = tempfile.mkstemp(prefix="jra-index-", suffix=".idx", dir=directory)
+    os.close(handle)
+    try:
+        database = Database(database_path)
+        try:
+            count = write_index(path, database.iter_embedding_blocks(chunk_size))
+        finally:
+            database.close()
+        index = SharedVectorIndex(path)
+    finally:
+        os.unlink(path)
+    logger.info("Shared index holds %s vectors (%.1f MiB)", count, count * index.dimension * 4 / _MIB)
+    return index
+
+
+def preload() -> None:
+    """Build every shareable object in this process; call before forking."""
+    config = load_config()
+    if config.embedding_workers > 0 or config.embedding_batching_enabled:
+        raise ValueError(
+            "Preloading cannot share embedding worker processes or the batching thread; "
+            "set embedding_workers to 0 and embedding_batching_enabled to false."
+        )
+    if config.similarity_backend.lower() != "sidecar":
+        # With the sidecar backend the index already lives once per node, outside the workers.
+        dependencies.use_shared_index(build_shared_index(config.database_path, config.index_build_chunk_size))
+    analyzer = dependencies.get_analyzer()
+    analyzer.llm_interface.renderer.preload()
+    # Connections must not cross fork(); each worker reopens its own.
+    analyzer.db.close()
+    # Keep preloaded objects out of the collector so GC passes don't dirty shared pages.
+    gc.collect()
+    gc.freeze()
+
+
+def memory_report(pids: List[int]) -> Dict[str, object]:
+    def entry(pid: int | str) -> Dict[str, object]:
+        usage = process_memory(pid) or {}
+        return {"pid": os.getpid() if pid == "self" else pid, **{f"{kind}_mib": round(value / _MIB, 1) for kind, value in usage.items()}}
+
+    return {"master": entry("self"), "workers": [entry(pid) for pid in pids]}
+
+
+class PreforkServer:
+    """Forks ``workers`` uvicorn processes on one shared socket and keeps them running.
+
+    Workers that die right after starting are restarted with exponential backoff; after
+    ``max_fast_exits`` such exits in a row for one slot the whole server shuts down.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        workers: int,
+        *,
+        memory_report_interval: float = 60.0,
+        restart_backoff: float = 0.5,
+        max_fast_exits: int = MAX_FAST_EXITS,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.memory_report_interval = memory_report_interval
+        self.restart_backoff = restart_backoff
+        self.max_fast_exits = max_fast_exits
+        self._children: Dict[int, int] = {}
+        self._started: Dict[int, float] = {}
+        self._fast_exits: Dict[int, int] = {}
+        self._restarts: Dict[int, float] = {}
+        self._stopping = False
+        self._failed = False
+
+    def serve(self) -> None:
+        from .main import app
+
+        preload()
+        sock = socket.socket(socket.AF_INET6 if ":" in self.host else socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        for slot in range(self.workers):
+            self._spawn(slot, app, sock)
+        logger.info("Serving on %s:%s with %s preforked workers", self.host, self.port, self.workers)
+        try:
+            self._supervise(app, sock)
+        finally:
+            sock.close()
+
+    def _spawn(self, slot: int, app, sock: socket.socket) -> None:
+        pid = os.fork()
+        if pid:
+            self._children[pid] = slot
+            self._started[pid] = time.monotonic()
+            return
+        status = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            dependencies.get_analyzer().db.reopen()
+            uvicorn.Server(uvicorn.Config(app, log_level="info")).run(sockets=[sock])
+        except BaseException:  # noqa: BLE001 - a worker must never return into the master's loop
+            logger.exception("Worker %s crashed", os.getpid())
+            status = 1
+        finally:
+            os._exit(status)
+
+    def _supervise(self, app, sock: socket.socket) -> None:
+        next_report = time.monotonic() + min(5.0, self.memory_report_interval or 5.0)
+        while self._children or self._restarts:
+            if self._stopping:
+                self._restarts.clear()
+            for slot, due in list(self._restarts.items()):
+                if due <= time.monotonic():
+                    del self._restarts[slot]
+                    self._spawn(slot, app, sock)
+            pid = 0
+            if self._children:
+                try:
+                    pid, status = os.waitpid(-1, os.WNOHANG)
+                except ChildProcessError:
+                    self._children.clear()
+            if pid:
+                self._reap(pid, status)
+                continue
+            if self.memory_report_interval > 0 and time.monotonic() >= next_report:
+                logger.info("Worker memory: %s", json.dumps(memory_report(sorted(self._children))))
+                next_report = time.monotonic() + self.memory_report_interval
+            time.sleep(min(0.2, self.restart_backoff) if self._restarts else 0.2)
+        if self._failed:
+            raise RuntimeError("Workers keep exiting right after start; see the log for the cause.")
+
+    def _reap(self, pid: int, status: int) -> None:
+        slot = self._children.pop(pid)
+        uptime = time.monotonic() - self._started.pop(pid, 0.0)
+        if self._stopping:
+            return
+        failures = self._fast_exits.get(slot, 0) + 1 if uptime < FAST_EXIT_SECONDS else 0
+        self._fast_exits[slot] = failures
+        if failures >= self.max_fast_exits:
+            logger.error("Worker slot %s exited %s times right after start; shutting down", slot, failures)
+            self._failed = True
+            self._handle_stop(signal.SIGTERM, None)
+            return
+        delay = min(self.restart_backoff * 2 ** (failures - 1), MAX_RESTART_DELAY_SECONDS) if failures else 0.0
+        logger.warning("Worker %s exited with status %s; restarting in %.1fs", pid, status, delay)
+        self._restarts[slot] = time.monotonic() + delay
+
+    def _handle_stop(self, signum, frame) -> None:
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
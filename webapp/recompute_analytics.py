@@ -0,0 +1,31 @@
+"""Command line entry point that rebuilds the competency analytics aggregates."""
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from job_role_analyzer.db import Database
+
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild competency analytics from the stored job roles")
+    parser.add_argument("--database", help="Path to the SQLite database (defaults to the configured path)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    database = Database(path=args.database)
+    try:
+        started = time.perf_counter()
+        database.recompute_analytics()
+        logger.info("Rebuilt competency analytics in %.2fs", time.perf_counter() - started)
+    finally:
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
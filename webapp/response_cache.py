@@ -0,0 +1,107 @@
+"""Cache of serialized analyze responses keyed by job role ID."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Tuple
+from uuid import UUID
+
+from job_role_analyzer import Database, JobRoleWithCompetencies
+from job_role_analyzer.cache import LRUCache
+
+
+def make_etag(job_role_id: UUID, version: int) -> str:
+    return f'"{job_role_id}-v{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    job_role_id: UUID
+    version: int
+    body: bytes
+
+    @property
+    def etag(self) -> str:
+        return make_etag(self.job_role_id, self.version)
+
+
+class ResponseCache:
+    """Serialized ``AnalyzeResponse`` bytes per role, in memory and optionally in SQLite.
+
+    Entries are dropped whenever the database rewrites the role, and the persisted copy
+    is only served while its recorded version matches the role's current version.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        serializer: Callable[[JobRoleWithCompetencies], bytes],
+        *,
+        maxsize: int = 1024,
+        persist: bool = False,
+    ) -> None:
+        self._db = db
+        self._serializer = serializer
+        self._persist = persist
+        self._entries: LRUCache[UUID, CachedResponse] = LRUCache(maxsize)
+        db.add_invalidation_listener(self._entries.invalidate)
+
+    def get(self, job_role_id: UUID) -> CachedResponse | None:
+        entry, rebuilt = self.lookup(job_role_id)
+        if rebuilt:
+            self.write_back(entry)
+        return entry
+
+    def lookup(self, job_role_id: UUID) -> Tuple[CachedResponse | None, bool]:
+        """Read-only half of :meth:`get`, safe on reader threads.
+
+        Also returns whether the entry was rebuilt from the role, in which case the
+        caller should hand it to :meth:`write_back` on the writer.
+        """
+        cached = self._entries.get(job_role_id)
+        if cached is not None:
+            return cached, False
+        generation = self._entries.generation
+        if self._persist:
+            stored = self._db.get_cached_response(job_role_id)
+            if stored is not None:
+                body, version = stored
+                entry = CachedResponse(job_role_id, version, body)
+                self._entries.put(job_role_id, entry, generation=generation)
+                return entry, False
+        version = self._db.get_role_version(job_role_id)
+        if version is None:
+            return None, False
+        role = self._db.get_job_role_with_competencies(job_role_id)
+        if role is None:
+            return None, False
+        entry = CachedResponse(job_role_id, version, self._serializer(role))
+        self._entries.put(job_role_id, entry, generation=generation)
+        return entry, self._persist
+
+    def write_back(self, entry: CachedResponse | None) -> None:
+        """Persist an entry rebuilt by :meth:`lookup`; a no-op unless ``persist`` is on."""
+        if entry is not None and self._persist:
+            self._db.store_cached_response(entry.job_role_id, entry.version, entry.body)
+
+    def store(self, result: JobRoleWithCompetencies) -> CachedResponse:
+        generation = self._entries.generation
+        job_role_id = result.job_role.job_role_id
+        version = self._db.get_role_version(job_role_id) or 1
+        return self._store(result, version, generation)
+
+    def stats(self) -> dict[str, float]:
+        return self._entries.stats()
+
+    def _store(self, result: JobRoleWithCompetencies, version: int, generation: int) -> CachedResponse:
+        job_role_id = result.job_role.job_role_id
+        entry = CachedResponse(job_role_id, version, self._serializer(result))
+        self._entries.put(job_role_id, entry, generation=generation)
+        self.write_back(entry)
+        return entry
@@ -5,6 +5,13 @@ const roleIdEl = document.getElementById('role-id');
 const roleSummaryEl = document.getElementById('role-summary');
 const competencyList = document.getElementById('competency-list');
 const footerYear = document.getElementById('footer-year');
+const jobStatusEl = document.getElementById('job-status');
+
+const STATUS_LABELS = {
+  queued: 'Queued for analysis…',
+  running: 'Analyzing role…',
+};
+const POLL_INTERVAL_MS = 1500;
 
 footerYear.textContent = new Date().getFullYear();
 
@@ -19,7 +26,7 @@ form.addEventListener('submit', async (event) => {
   payload.years_of_experience = Number(payload.years_of_experience);
 
   try {
-    const response = await fetch('/api/analyze', {
+    const response = await fetch('/api/jobs', {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -30,16 +37,68 @@ form.addEventListener('submit', async (event) => {
       throw new Error(error.detail || 'Unable to analyze job role.');
     }
 
-    const data = await response.json();
+    const job = await response.json();
+    showStatus(job.status);
+    const data = await waitForResult(job);
     renderResults(data);
   } catch (error) {
     alert(error.message);
   } finally {
+    showStatus(null);
     submitButton.classList.remove('button--loading');
     submitButton.disabled = false;
   }
 });
 
+function showStatus(status) {
+  const label = status ? STATUS_LABELS[status] : null;
+  jobStatusEl.hidden = !label;
+  jobStatusEl.textContent = label || '';
+}
+
+function waitForResult(job) {
+  if (!('EventSource' in window)) {
+    return pollForResult(job.status_url);
+  }
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(job.events_url);
+    source.addEventListener('status', (event) => {
+      showStatus(JSON.parse(event.data).status);
+    });
+    source.addEventListener('result', (event) => {
+      source.close();
+      resolve(JSON.parse(event.data));
+    });
+    source.addEventListener('failed', (event) => {
+      source.close();
+      reject(new Error(JSON.parse(event.data).detail || 'Unable to analyze job role.'));
+    });
+    source.onerror = () => {
+      // The stream dropped (proxy timeout, redeploy); the job keeps running server-side.
+      source.close();
+      pollForResult(job.status_url).then(resolve, reject);
+    };
+  });
+}
+
+async function pollForResult(statusUrl) {
+  for (;;) {
+    const response = await fetch(statusUrl);
+    if (!response.ok) {
+      throw new Error('Unable to fetch analysis status.');
+    }
+    const job = await response.json();
+    if (job.status === 'succeeded') {
+      return job.result;
+    }
+    if (job.status === 'failed') {
+      throw new Error(job.error || 'Unable to analyze job role.');
+    }
+    showStatus(job.status);
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+  }
+}
+
 function renderResults(data) {
   placeholder.hidden = true;
   resultsContainer.hidden = false;